@@ -514,11 +514,13 @@ class CrestronHub:
                             f"join_change_callback calling service {join[CONF_SERVICE]} with data = {data} from join {cbtype} = {value}"
                         )
                         domain, service = join[CONF_SERVICE].split(".")
-                        await self.hass.services.async_call(domain, service, data)
+                        # Started as tasks so a slow service or script (e.g. with a delay)
+                        # does not stall the hub's receive loop and every update behind it
+                        self.hass.async_create_task(self.hass.services.async_call(domain, service, data))
                     elif CONF_SCRIPT in join:
                         sequence = join[CONF_SCRIPT]
                         script = Script(self.hass, sequence, "Crestron Join Change", DOMAIN)
-                        await script.async_run({"value": value}, self.context)
+                        self.hass.async_create_task(script.async_run({"value": value}, self.context))
                         _LOGGER.debug(
                             f"join_change_callback calling script {join[CONF_SCRIPT]} from join {cbtype} = {value}"
                         )
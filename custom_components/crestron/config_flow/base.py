@@ -4,7 +4,8 @@ import logging
 from typing import Any
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import entity_registry as er
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -14,6 +15,8 @@ class BaseOptionsFlow(config_entries.OptionsFlow):
     """Base class for options flow handlers."""
 
     _editing_join: int | None
+    _name_index: dict[str, tuple[list[dict[str, Any]], dict[str | None, int]]]
+    _reload_pending: bool
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow.
@@ -25,8 +28,46 @@ class BaseOptionsFlow(config_entries.OptionsFlow):
         # Note: config_entry is available via self.config_entry property from base class
         # Don't set it explicitly to avoid deprecation warning (HA 2025.12+)
         self._editing_join = None  # Track which join we're editing
+        self._name_index = {}  # Stored list key -> (indexed list, name or join -> position)
+        self._reload_pending = False  # Saved changes not yet applied by a reload
 
     async def _async_reload_integration(self) -> None:
+        """Mark the integration for reload when the options flow finishes.
+
+        Saves only set a flag, so a session of several changes costs one reload (see _async_finish).
+        """
+        self._reload_pending = True
+
+    async def _async_finish(self) -> FlowResult:
+        """Apply this session's changes with a single reload and close the options flow.
+
+        The reload is awaited, so a failure propagates to the calling step's error handling
+        and the changes stay pending.
+
+        Returns:
+            FlowResult closing the options flow
+        """
+        if self._reload_pending:
+            await self._async_reload_now()
+            self._reload_pending = False
+        return self.async_create_entry(title="", data={})
+
+    @callback
+    def async_remove(self) -> None:
+        """Reload for changes left pending when the flow is closed without finishing."""
+        super().async_remove()
+        if self._reload_pending:
+            self._reload_pending = False
+            self.hass.async_create_task(self._async_reload_abandoned())
+
+    async def _async_reload_abandoned(self) -> None:
+        """Reload after an abandoned flow, logging failures since no form is left to show them."""
+        try:
+            await self._async_reload_now()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Error reloading integration: %s", err)
+
+    async def _async_reload_now(self) -> None:
         """Safely reload the integration, handling platforms that aren't loaded."""
         try:
             await self.hass.config_entries.async_reload(self.config_entry.entry_id)
@@ -40,6 +40,7 @@ from ..const import (
     CONF_TO_HUB,
     DOMAIN,
 )
+from .validators import ANALOG_JOIN_RE, DIGITAL_JOIN_RE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,7 +110,7 @@ class DimmerHandler:
                     errors[CONF_NAME] = "name_required"
 
                 # Validate base join (digital format)
-                if not base_join_str or not (base_join_str[0] == "d" and base_join_str[1:].isdigit()):
+                if not base_join_str or not DIGITAL_JOIN_RE.fullmatch(base_join_str):
                     errors[CONF_BASE_JOIN] = "invalid_join_format"
                 else:
                     base_join_num: int = int(base_join_str[1:])
@@ -120,9 +121,7 @@ class DimmerHandler:
 
                 # Validate lighting load brightness join if provided
                 if has_lighting:
-                    if not light_brightness_join_str or not (
-                        light_brightness_join_str[0] == "a" and light_brightness_join_str[1:].isdigit()
-                    ):
+                    if not light_brightness_join_str or not ANALOG_JOIN_RE.fullmatch(light_brightness_join_str):
                         errors[CONF_LIGHT_BRIGHTNESS_JOIN] = "invalid_join_format"
 
                 # Check for join conflicts
@@ -165,8 +164,7 @@ class DimmerHandler:
                         current_dimmers: list[dict[str, Any]] = fresh_entry.data.get(CONF_DIMMERS, []).copy()
                         current_dimmers.append(dimmer_config)
 
-                        new_data: dict[str, Any] = dict(fresh_entry.data)
-                        new_data[CONF_DIMMERS] = current_dimmers
+                        new_data: dict[str, Any] = {**fresh_entry.data, CONF_DIMMERS: current_dimmers}
                         self.flow.hass.config_entries.async_update_entry(fresh_entry, data=new_data)
 
                     _LOGGER.info("Added dimmer '%s' with %d buttons (base join: %s)", name, button_count, base_join_str)
@@ -243,14 +241,14 @@ class DimmerHandler:
                     hold_join: str = user_input.get(f"button_{btn_num}_hold", "").strip()
 
                     # Validate press join (required)
-                    if not press_join or not (press_join[0] == "d" and press_join[1:].isdigit()):
+                    if not press_join or not DIGITAL_JOIN_RE.fullmatch(press_join):
                         errors[f"button_{btn_num}_press"] = "invalid_join_format"
                     else:
                         joins_to_check.append(press_join)
                         button_joins[btn_num] = {"press": press_join}
 
                     # Validate double join (required)
-                    if not double_join or not (double_join[0] == "d" and double_join[1:].isdigit()):
+                    if not double_join or not DIGITAL_JOIN_RE.fullmatch(double_join):
                         errors[f"button_{btn_num}_double"] = "invalid_join_format"
                     else:
                         joins_to_check.append(double_join)
@@ -258,7 +256,7 @@ class DimmerHandler:
                             button_joins[btn_num]["double"] = double_join
 
                     # Validate hold join (required)
-                    if not hold_join or not (hold_join[0] == "d" and hold_join[1:].isdigit()):
+                    if not hold_join or not DIGITAL_JOIN_RE.fullmatch(hold_join):
                         errors[f"button_{btn_num}_hold"] = "invalid_join_format"
                     else:
                         joins_to_check.append(hold_join)
@@ -267,9 +265,7 @@ class DimmerHandler:
 
                 # Validate lighting load brightness join if provided
                 if has_lighting:
-                    if not light_brightness_join_str or not (
-                        light_brightness_join_str[0] == "a" and light_brightness_join_str[1:].isdigit()
-                    ):
+                    if not light_brightness_join_str or not ANALOG_JOIN_RE.fullmatch(light_brightness_join_str):
                         errors[CONF_LIGHT_BRIGHTNESS_JOIN] = "invalid_join_format"
                     else:
                         joins_to_check.append(light_brightness_join_str)
@@ -301,8 +297,7 @@ class DimmerHandler:
                         current_dimmers: list[dict[str, Any]] = fresh_entry.data.get(CONF_DIMMERS, []).copy()
                         current_dimmers.append(dimmer_config)
 
-                        new_data: dict[str, Any] = dict(fresh_entry.data)
-                        new_data[CONF_DIMMERS] = current_dimmers
+                        new_data: dict[str, Any] = {**fresh_entry.data, CONF_DIMMERS: current_dimmers}
                         self.flow.hass.config_entries.async_update_entry(fresh_entry, data=new_data)
 
                     _LOGGER.info("Added dimmer '%s' with %d buttons (manual joins)", name, button_count)
@@ -448,12 +443,12 @@ class DimmerHandler:
                     errors["light_name"] = "name_required"
 
                 # Validate is_on_join format
-                if not is_on_join or not (is_on_join[0] == "d" and is_on_join[1:].isdigit()):
+                if not is_on_join or not DIGITAL_JOIN_RE.fullmatch(is_on_join):
                     errors[CONF_IS_ON_JOIN] = "invalid_join_format"
 
                 # Validate brightness join if enabled
                 if has_brightness:
-                    if not brightness_join or not (brightness_join[0] == "a" and brightness_join[1:].isdigit()):
+                    if not brightness_join or not ANALOG_JOIN_RE.fullmatch(brightness_join):
                         errors[CONF_BRIGHTNESS_JOIN] = "invalid_join_format"
 
                 # Check for join conflicts
@@ -547,7 +542,7 @@ class DimmerHandler:
 
                 # Validate press
                 if config_press:
-                    if not press_join or not (press_join[0] == "d" and press_join[1:].isdigit()):
+                    if not press_join or not DIGITAL_JOIN_RE.fullmatch(press_join):
                         errors["press_join"] = "invalid_join_format"
                     elif not press_entity or not press_action:
                         errors["press_entity"] = "entity_and_action_required"
@@ -565,7 +560,7 @@ class DimmerHandler:
 
                 # Validate double press
                 if config_double:
-                    if not double_join or not (double_join[0] == "d" and double_join[1:].isdigit()):
+                    if not double_join or not DIGITAL_JOIN_RE.fullmatch(double_join):
                         errors["double_press_join"] = "invalid_join_format"
                     elif not double_entity or not double_action:
                         errors["double_press_entity"] = "entity_and_action_required"
@@ -583,7 +578,7 @@ class DimmerHandler:
 
                 # Validate hold
                 if config_hold:
-                    if not hold_join or not (hold_join[0] == "d" and hold_join[1:].isdigit()):
+                    if not hold_join or not DIGITAL_JOIN_RE.fullmatch(hold_join):
                         errors["hold_join"] = "invalid_join_format"
                     elif not hold_entity or not hold_action:
                         errors["hold_entity"] = "entity_and_action_required"
@@ -601,7 +596,7 @@ class DimmerHandler:
 
                 # Validate feedback
                 if config_feedback:
-                    if not feedback_join or not (feedback_join[0] == "d" and feedback_join[1:].isdigit()):
+                    if not feedback_join or not DIGITAL_JOIN_RE.fullmatch(feedback_join):
                         errors["feedback_join"] = "invalid_join_format"
                     elif not feedback_entity:
                         errors["feedback_entity"] = "entity_required"
@@ -736,8 +731,7 @@ class DimmerHandler:
             current_dimmers.append(self.flow._editing_join)
 
             # Update config entry with fresh data
-            new_data: dict[str, Any] = dict(fresh_entry.data)
-            new_data[CONF_DIMMERS] = current_dimmers
+            new_data: dict[str, Any] = {**fresh_entry.data, CONF_DIMMERS: current_dimmers}
             self.flow.hass.config_entries.async_update_entry(fresh_entry, data=new_data)
 
             _LOGGER.info(
@@ -752,7 +746,7 @@ class DimmerHandler:
             # Reload integration
             await self.flow._async_reload_integration()
 
-            return self.flow.async_create_entry(title="", data={})
+            return await self.flow._async_finish()
 
         except Exception as ex:
             _LOGGER.exception("Failed to save dimmer: %s", ex)
@@ -861,8 +855,7 @@ class DimmerHandler:
                         ]
 
                         # Update config entry with fresh data
-                        new_data: dict[str, Any] = dict(fresh_entry.data)
-                        new_data[CONF_DIMMERS] = updated_dimmers
+                        new_data: dict[str, Any] = {**fresh_entry.data, CONF_DIMMERS: updated_dimmers}
                         self.flow.hass.config_entries.async_update_entry(fresh_entry, data=new_data)
 
                         # Clean up entities generated by these dimmers
@@ -880,7 +873,7 @@ class DimmerHandler:
                         await self.flow._async_reload_integration()
 
                 if not errors:
-                    return self.flow.async_create_entry(title="", data={})
+                    return await self.flow._async_finish()
 
             except Exception as ex:
                 _LOGGER.exception("Unexpected error removing dimmers: %s", ex)
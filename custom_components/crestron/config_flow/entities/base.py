@@ -1,6 +1,8 @@
 """Base entity configuration management for Crestron XSIG integration."""
 
+from collections.abc import Awaitable, Callable
 import logging
+import re
 from typing import Any
 
 from homeassistant import config_entries
@@ -27,148 +29,214 @@ from ...const import (
     CONF_VALUE_JOIN,
     DOMAIN,
 )
+from ..validators import JOIN_RE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity type -> config entry storage key, in lookup/display order
+_ENTITY_TYPES: tuple[tuple[str, str], ...] = (
+    ("light", CONF_LIGHTS),
+    ("switch", CONF_SWITCHES),
+    ("cover", CONF_COVERS),
+    ("binary_sensor", CONF_BINARY_SENSORS),
+    ("sensor", CONF_SENSORS),
+    ("climate", CONF_CLIMATES),
+    ("media_player", CONF_MEDIA_PLAYERS),
+)
+
+
+def _climate_option_label(climate: dict[str, Any]) -> str:
+    """Return the selection label for a climate entity."""
+    if climate.get(CONF_TYPE, "standard") == "floor_warming":
+        return f"{climate.get(CONF_NAME)} (Climate - Floor Warming - {climate.get(CONF_FLOOR_SP_JOIN)})"
+    return f"{climate.get(CONF_NAME)} (Climate - Standard HVAC - {climate.get(CONF_HEAT_SP_JOIN)})"
+
+
+# Entity type -> (join used in the UI unique_id, required join prefix)
+_UNIQUE_ID_JOINS: dict[str, tuple[str, str]] = {
+    "light": (CONF_BRIGHTNESS_JOIN, "a"),
+    "switch": (CONF_SWITCH_JOIN, "d"),
+    "cover": (CONF_POS_JOIN, "a"),
+    "binary_sensor": (CONF_IS_ON_JOIN, "d"),
+    "sensor": (CONF_VALUE_JOIN, "a"),
+    "climate": (CONF_FLOOR_SP_JOIN, "a"),
+    "media_player": (CONF_SOURCE_NUM_JOIN, "a"),
+}
+
+# Entity type -> selection label formatter
+_OPTION_LABELS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "light": lambda c: f"{c.get(CONF_NAME)} (Light - {c.get(CONF_BRIGHTNESS_JOIN)})",
+    "switch": lambda c: f"{c.get(CONF_NAME)} (Switch - {c.get(CONF_SWITCH_JOIN)})",
+    "cover": lambda c: f"{c.get(CONF_NAME)} (Cover - {c.get(CONF_POS_JOIN)})",
+    "binary_sensor": lambda c: f"{c.get(CONF_NAME)} (Binary Sensor - {c.get(CONF_IS_ON_JOIN)})",
+    "sensor": lambda c: f"{c.get(CONF_NAME)} (Sensor - {c.get(CONF_VALUE_JOIN)})",
+    "climate": _climate_option_label,
+    "media_player": lambda c: f"{c.get(CONF_NAME)} (Media Player - {c.get(CONF_SOURCE_NUM_JOIN)})",
+}
+
+
+def get_name_index(flow: config_entries.OptionsFlow, conf_key: str, key: str = CONF_NAME) -> dict[str | None, int]:
+    """Return entry key -> position for a stored list, rebuilt only when the stored list changes.
+
+    Args:
+        flow: The options flow instance
+        conf_key: Config entry key holding the list
+        key: Entry field identifying each entry (entity name, or "join" for join sync lists)
+
+    Returns:
+        Mapping of each entry's key to its index in the stored list
+    """
+    current: list[dict[str, Any]] = flow.config_entry.data.get(conf_key, [])
+    cached: tuple[list[dict[str, Any]], dict[str | None, int]] | None = flow._name_index.get(conf_key)
+    if cached is None or cached[0] is not current:
+        index: dict[str | None, int] = {}
+        for i, entry in enumerate(current):
+            index.setdefault(entry.get(key), i)  # First duplicate wins, as in the linear scans it replaced
+        cached = (current, index)
+        flow._name_index[conf_key] = cached
+    return cached[1]
+
+
+async def async_upsert_entity(
+    flow: config_entries.OptionsFlow,
+    conf_key: str,
+    new_entry: dict[str, Any],
+    old_index: int | None,
+    label: str,
+) -> FlowResult:
+    """Add or replace an entity entry, reload the integration and return to the menu.
+
+    Args:
+        flow: The options flow instance
+        conf_key: Config entry key holding the entity list
+        new_entry: The entity entry to store
+        old_index: Position of the entry being edited, if found
+        label: Entity kind used in log messages
+
+    Returns:
+        FlowResult for the options menu
+    """
+    current: list[dict[str, Any]] = flow.config_entry.data.get(conf_key, [])
+    is_editing: bool = flow._editing_join is not None
+    if is_editing:
+        # Replace existing entity
+        updated: list[dict[str, Any]] = list(current)
+        if old_index is not None:
+            updated[old_index] = new_entry
+    else:
+        # Append new entity
+        updated = current + [new_entry]
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("%s %s %s", "Updated" if is_editing else "Added", label, new_entry[CONF_NAME])
+
+    # Update config entry
+    flow.hass.config_entries.async_update_entry(flow.config_entry, data={**flow.config_entry.data, conf_key: updated})
+    flow._name_index.pop(conf_key, None)
+
+    # Reload the integration
+    await flow._async_reload_integration()
+
+    # Clear editing state and return to menu
+    flow._editing_join = None
+    return await flow.async_step_init()
+
 
 class EntityManager:
     """Base class for managing entity configuration across all platforms."""
 
+    __slots__ = ("flow", "_schema_cache", "_edit_dispatch")
+
     flow: config_entries.OptionsFlow
+    _schema_cache: dict[tuple, vol.Schema]
+    _edit_dispatch: dict[str, Callable[[], Awaitable[FlowResult]]]
 
     def __init__(self, flow: config_entries.OptionsFlow) -> None:
         """Initialize the entity manager."""
         self.flow = flow
+        self._schema_cache = {}
+        # Edit step per entity type (climate is routed by climate type)
+        self._edit_dispatch = {
+            "light": flow.async_step_add_light,
+            "switch": flow.async_step_add_switch,
+            "cover": flow.async_step_add_cover,
+            "binary_sensor": flow.async_step_add_binary_sensor,
+            "sensor": flow.async_step_add_sensor,
+            "climate": flow.async_step_add_climate_standard,
+            "media_player": flow.async_step_add_media_player,
+        }
+
+    @staticmethod
+    def _build_entity_options(data: dict[str, Any]) -> list[dict[str, str]]:
+        """Build the selection options for every configured entity in one pass."""
+        return [
+            {"label": _OPTION_LABELS[entity_type](entity_config), "value": entity_config.get(CONF_NAME)}
+            for entity_type, conf_key in _ENTITY_TYPES
+            for entity_config in data.get(conf_key, [])
+        ]
+
+    @staticmethod
+    def _index_entities(data: dict[str, Any]) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Map entity names to (entity_type, config), first match wins in _ENTITY_TYPES order."""
+        by_name: dict[str, tuple[str, dict[str, Any]]] = {}
+        for entity_type, conf_key in _ENTITY_TYPES:
+            for entity_config in data.get(conf_key, []):
+                by_name.setdefault(entity_config.get(CONF_NAME), (entity_type, entity_config))
+        return by_name
+
+    def _get_select_schema(self, field: vol.Marker, entity_options: list[dict[str, str]], multiple: bool) -> vol.Schema:
+        """Return a cached entity selection schema, building it only when the options change."""
+        cache_key: tuple = (
+            "select",
+            field.schema,
+            multiple,
+            tuple((option["value"], option["label"]) for option in entity_options),
+        )
+        schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if schema is None:
+            schema = vol.Schema(
+                {
+                    field: selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=entity_options,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            multiple=multiple,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = schema
+        return schema
 
     async def async_step_select_entity_to_edit(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Select which entity to edit."""
+        data: dict[str, Any] = self.flow.config_entry.data
+
         if user_input is not None:
             selected_entity: str | None = user_input.get("entity_to_edit")
 
             if selected_entity:
                 # Find the entity in our data
-                current_covers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_COVERS, [])
-                current_binary_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-                current_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SENSORS, [])
-                current_lights: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-                current_switches: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-                current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-                current_media_players: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-
-                # Check if it's a light
-                for light in current_lights:
-                    if light.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = light
-                        return await self.flow.async_step_add_light()
-
-                # Check if it's a switch
-                for switch in current_switches:
-                    if switch.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = switch
-                        return await self.flow.async_step_add_switch()
-
-                # Check if it's a cover
-                for cover in current_covers:
-                    if cover.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = cover
-                        return await self.flow.async_step_add_cover()
-
-                # Check if it's a binary sensor
-                for binary_sensor in current_binary_sensors:
-                    if binary_sensor.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = binary_sensor
-                        return await self.flow.async_step_add_binary_sensor()
-
-                # Check if it's a sensor
-                for sensor in current_sensors:
-                    if sensor.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = sensor
-                        return await self.flow.async_step_add_sensor()
-
-                # Check if it's a climate
-                for climate in current_climates:
-                    if climate.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = climate
-                        # Route to appropriate climate form based on type
-                        climate_type: str = climate.get(CONF_TYPE, "standard")
-                        if climate_type == "floor_warming":
-                            return await self.flow.async_step_add_climate()
-                        return await self.flow.async_step_add_climate_standard()
-
-                # Check if it's a media player
-                for media_player in current_media_players:
-                    if media_player.get(CONF_NAME) == selected_entity:
-                        self.flow._editing_join = media_player
-                        return await self.flow.async_step_add_media_player()
+                match: tuple[str, dict[str, Any]] | None = self._index_entities(data).get(selected_entity)
+                if match is not None:
+                    entity_type, entity_config = match
+                    self.flow._editing_join = entity_config
+                    # Route floor warming climates to their own form
+                    if entity_type == "climate" and entity_config.get(CONF_TYPE, "standard") == "floor_warming":
+                        return await self.flow.async_step_add_climate()
+                    return await self._edit_dispatch[entity_type]()
 
             # Not found, return to menu
             return await self.flow.async_step_init()
 
         # Build list of all entities for editing
-        current_covers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_COVERS, [])
-        current_binary_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-        current_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SENSORS, [])
-        current_lights: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-        current_switches: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-        current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-        current_media_players: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-
-        entity_options: list[dict[str, str]] = []
-        for l in current_lights:
-            entity_options.append(
-                {"label": f"{l.get(CONF_NAME)} (Light - {l.get(CONF_BRIGHTNESS_JOIN)})", "value": l.get(CONF_NAME)}
-            )
-        for sw in current_switches:
-            entity_options.append(
-                {"label": f"{sw.get(CONF_NAME)} (Switch - {sw.get(CONF_SWITCH_JOIN)})", "value": sw.get(CONF_NAME)}
-            )
-        for c in current_covers:
-            entity_options.append(
-                {"label": f"{c.get(CONF_NAME)} (Cover - {c.get(CONF_POS_JOIN)})", "value": c.get(CONF_NAME)}
-            )
-        for bs in current_binary_sensors:
-            entity_options.append(
-                {
-                    "label": f"{bs.get(CONF_NAME)} (Binary Sensor - {bs.get(CONF_IS_ON_JOIN)})",
-                    "value": bs.get(CONF_NAME),
-                }
-            )
-        for s in current_sensors:
-            entity_options.append(
-                {"label": f"{s.get(CONF_NAME)} (Sensor - {s.get(CONF_VALUE_JOIN)})", "value": s.get(CONF_NAME)}
-            )
-        for cl in current_climates:
-            climate_type: str = cl.get(CONF_TYPE, "standard")
-            type_label: str = "Floor Warming" if climate_type == "floor_warming" else "Standard HVAC"
-            join_display: str | None = (
-                cl.get(CONF_FLOOR_SP_JOIN) if climate_type == "floor_warming" else cl.get(CONF_HEAT_SP_JOIN)
-            )
-            entity_options.append(
-                {"label": f"{cl.get(CONF_NAME)} (Climate - {type_label} - {join_display})", "value": cl.get(CONF_NAME)}
-            )
-        for mp in current_media_players:
-            entity_options.append(
-                {
-                    "label": f"{mp.get(CONF_NAME)} (Media Player - {mp.get(CONF_SOURCE_NUM_JOIN)})",
-                    "value": mp.get(CONF_NAME),
-                }
-            )
+        entity_options: list[dict[str, str]] = self._build_entity_options(data)
 
         if not entity_options:
             # No entities to edit, return to menu
             return await self.flow.async_step_init()
 
         # Show selection form
-        select_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required("entity_to_edit"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=entity_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-            }
-        )
+        select_schema: vol.Schema = self._get_select_schema(vol.Required("entity_to_edit"), entity_options, False)
 
         return self.flow.async_show_form(
             step_id="select_entity_to_edit",
@@ -178,184 +246,55 @@ class EntityManager:
     async def async_step_remove_entities(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Remove entities by selecting from a list."""
         errors: dict[str, str] = {}
+        data: dict[str, Any] = self.flow.config_entry.data
 
         if user_input is not None:
             try:
                 entities_to_remove: list[str] = user_input.get("entities_to_remove", [])
+                remove_set: frozenset[str] = frozenset(entities_to_remove)
 
                 if entities_to_remove:
-                    current_covers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_COVERS, [])
-                    current_binary_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(
-                        CONF_BINARY_SENSORS, []
-                    )
-                    current_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SENSORS, [])
-                    current_lights: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-                    current_switches: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-                    current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-                    current_media_players: list[dict[str, Any]] = self.flow.config_entry.data.get(
-                        CONF_MEDIA_PLAYERS, []
-                    )
+                    # Index the entities before removal so registry cleanup can find their joins
+                    by_name: dict[str, tuple[str, dict[str, Any]]] = self._index_entities(data)
 
-                    # Filter out selected entities
-                    updated_covers: list[dict[str, Any]] = [
-                        c for c in current_covers if c.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_binary_sensors: list[dict[str, Any]] = [
-                        bs for bs in current_binary_sensors if bs.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_sensors: list[dict[str, Any]] = [
-                        s for s in current_sensors if s.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_lights: list[dict[str, Any]] = [
-                        l for l in current_lights if l.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_switches: list[dict[str, Any]] = [
-                        sw for sw in current_switches if sw.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_climates: list[dict[str, Any]] = [
-                        cl for cl in current_climates if cl.get(CONF_NAME) not in entities_to_remove
-                    ]
-                    updated_media_players: list[dict[str, Any]] = [
-                        mp for mp in current_media_players if mp.get(CONF_NAME) not in entities_to_remove
-                    ]
+                    # Filter out selected entities, only replacing lists that actually shrank
+                    new_data: dict[str, Any] = {**data}
+                    for _entity_type, conf_key in _ENTITY_TYPES:
+                        current: list[dict[str, Any]] = data.get(conf_key, [])
+                        updated: list[dict[str, Any]] = [e for e in current if e.get(CONF_NAME) not in remove_set]
+                        if len(updated) != len(current):
+                            new_data[conf_key] = updated
 
                     # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_COVERS] = updated_covers
-                    new_data[CONF_BINARY_SENSORS] = updated_binary_sensors
-                    new_data[CONF_SENSORS] = updated_sensors
-                    new_data[CONF_LIGHTS] = updated_lights
-                    new_data[CONF_SWITCHES] = updated_switches
-                    new_data[CONF_CLIMATES] = updated_climates
-                    new_data[CONF_MEDIA_PLAYERS] = updated_media_players
-
                     self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
+                    self._schema_cache.clear()
+                    # Re-render from the updated data if a later step fails
+                    data = new_data
 
                     # Remove entities from entity registry
                     entity_reg: er.EntityRegistry = er.async_get(self.flow.hass)
                     removed_count: int = 0
 
                     for entity_name in entities_to_remove:
-                        # Find the entity config to get join number
-                        entity_config: dict[str, Any] | None = None
-                        entity_type: str | None = None
-
-                        # Check if it's a light
-                        for light in current_lights:
-                            if light.get(CONF_NAME) == entity_name:
-                                entity_config = light
-                                entity_type = "light"
-                                break
-
-                        # Check if it's a switch
-                        if not entity_config:
-                            for switch in current_switches:
-                                if switch.get(CONF_NAME) == entity_name:
-                                    entity_config = switch
-                                    entity_type = "switch"
-                                    break
-
-                        # Check if it's a cover
-                        if not entity_config:
-                            for cover in current_covers:
-                                if cover.get(CONF_NAME) == entity_name:
-                                    entity_config = cover
-                                    entity_type = "cover"
-                                    break
-
-                        # Check if it's a binary sensor
-                        if not entity_config:
-                            for bs in current_binary_sensors:
-                                if bs.get(CONF_NAME) == entity_name:
-                                    entity_config = bs
-                                    entity_type = "binary_sensor"
-                                    break
-
-                        # Check if it's a sensor
-                        if not entity_config:
-                            for s in current_sensors:
-                                if s.get(CONF_NAME) == entity_name:
-                                    entity_config = s
-                                    entity_type = "sensor"
-                                    break
-
-                        # Check if it's a climate
-                        if not entity_config:
-                            for cl in current_climates:
-                                if cl.get(CONF_NAME) == entity_name:
-                                    entity_config = cl
-                                    entity_type = "climate"
-                                    break
-
-                        # Check if it's a media player
-                        if not entity_config:
-                            for mp in current_media_players:
-                                if mp.get(CONF_NAME) == entity_name:
-                                    entity_config = mp
-                                    entity_type = "media_player"
-                                    break
-
-                        if entity_config and entity_type:
-                            # Construct unique_id based on entity type
-                            unique_id: str | None = None
-                            if entity_type == "light":
-                                brightness_join_str: str = entity_config.get(CONF_BRIGHTNESS_JOIN, "")
-                                if brightness_join_str and brightness_join_str[0] == "a":
-                                    join_num: str = brightness_join_str[1:]
-                                    unique_id = f"crestron_light_ui_a{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "switch":
-                                switch_join_str: str = entity_config.get(CONF_SWITCH_JOIN, "")
-                                if switch_join_str and switch_join_str[0] == "d":
-                                    join_num: str = switch_join_str[1:]
-                                    unique_id = f"crestron_switch_ui_d{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "cover":
-                                pos_join_str: str = entity_config.get(CONF_POS_JOIN, "")
-                                if pos_join_str and pos_join_str[0] == "a":
-                                    join_num: str = pos_join_str[1:]
-                                    unique_id = f"crestron_cover_ui_a{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "binary_sensor":
-                                is_on_join_str: str = entity_config.get(CONF_IS_ON_JOIN, "")
-                                if is_on_join_str and is_on_join_str[0] == "d":
-                                    join_num: str = is_on_join_str[1:]
-                                    unique_id = f"crestron_binary_sensor_ui_d{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "sensor":
-                                value_join_str: str = entity_config.get(CONF_VALUE_JOIN, "")
-                                if value_join_str and value_join_str[0] == "a":
-                                    join_num: str = value_join_str[1:]
-                                    unique_id = f"crestron_sensor_ui_a{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "climate":
-                                # Use setpoint join for floor warming
-                                sp_join_str: str = entity_config.get(CONF_FLOOR_SP_JOIN, "")
-                                if sp_join_str and sp_join_str[0] == "a":
-                                    join_num: str = sp_join_str[1:]
-                                    unique_id = f"crestron_climate_ui_a{join_num}"
-                                else:
-                                    continue
-                            elif entity_type == "media_player":
-                                source_join_str: str = entity_config.get(CONF_SOURCE_NUM_JOIN, "")
-                                if source_join_str and source_join_str[0] == "a":
-                                    join_num: str = source_join_str[1:]
-                                    unique_id = f"crestron_media_player_ui_a{join_num}"
-                                else:
-                                    continue
-
-                            # Find and remove entity from registry
-                            entity_id: str | None = entity_reg.async_get_entity_id(entity_type, DOMAIN, unique_id)
-
-                            if entity_id:
-                                entity_reg.async_remove(entity_id)
-                                removed_count += 1
-                                _LOGGER.info("Removed entity %s (unique_id: %s) from registry", entity_name, unique_id)
+                        match: tuple[str, dict[str, Any]] | None = by_name.get(entity_name)
+                        if match is None:
+                            continue
+
+                        # Construct unique_id from the entity's identifying join
+                        entity_type, entity_config = match
+                        join_key, join_prefix = _UNIQUE_ID_JOINS[entity_type]
+                        join_match: re.Match[str] | None = JOIN_RE.fullmatch(entity_config.get(join_key) or "")
+                        if join_match is None or join_match.group(1) != join_prefix:
+                            continue
+                        unique_id: str = f"crestron_{entity_type}_ui_{join_prefix}{join_match.group(2)}"
+
+                        # Find and remove entity from registry
+                        entity_id: str | None = entity_reg.async_get_entity_id(entity_type, DOMAIN, unique_id)
+
+                        if entity_id:
+                            entity_reg.async_remove(entity_id)
+                            removed_count += 1
+                            _LOGGER.info("Removed entity %s (unique_id: %s) from registry", entity_name, unique_id)
 
                     # Reload the integration
                     await self.flow._async_reload_integration()
@@ -372,71 +311,14 @@ class EntityManager:
                 errors["base"] = "unknown"
 
         # Build list of all entities for removal selection
-        current_covers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_COVERS, [])
-        current_binary_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-        current_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SENSORS, [])
-        current_lights: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-        current_switches: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-        current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-        current_media_players: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-
-        entity_options: list[dict[str, str]] = []
-        for l in current_lights:
-            entity_options.append(
-                {"label": f"{l.get(CONF_NAME)} (Light - {l.get(CONF_BRIGHTNESS_JOIN)})", "value": l.get(CONF_NAME)}
-            )
-        for sw in current_switches:
-            entity_options.append(
-                {"label": f"{sw.get(CONF_NAME)} (Switch - {sw.get(CONF_SWITCH_JOIN)})", "value": sw.get(CONF_NAME)}
-            )
-        for c in current_covers:
-            entity_options.append(
-                {"label": f"{c.get(CONF_NAME)} (Cover - {c.get(CONF_POS_JOIN)})", "value": c.get(CONF_NAME)}
-            )
-        for bs in current_binary_sensors:
-            entity_options.append(
-                {
-                    "label": f"{bs.get(CONF_NAME)} (Binary Sensor - {bs.get(CONF_IS_ON_JOIN)})",
-                    "value": bs.get(CONF_NAME),
-                }
-            )
-        for s in current_sensors:
-            entity_options.append(
-                {"label": f"{s.get(CONF_NAME)} (Sensor - {s.get(CONF_VALUE_JOIN)})", "value": s.get(CONF_NAME)}
-            )
-        for cl in current_climates:
-            climate_type: str = cl.get(CONF_TYPE, "standard")
-            type_label: str = "Floor Warming" if climate_type == "floor_warming" else "Standard HVAC"
-            join_display: str | None = (
-                cl.get(CONF_FLOOR_SP_JOIN) if climate_type == "floor_warming" else cl.get(CONF_HEAT_SP_JOIN)
-            )
-            entity_options.append(
-                {"label": f"{cl.get(CONF_NAME)} (Climate - {type_label} - {join_display})", "value": cl.get(CONF_NAME)}
-            )
-        for mp in current_media_players:
-            entity_options.append(
-                {
-                    "label": f"{mp.get(CONF_NAME)} (Media Player - {mp.get(CONF_SOURCE_NUM_JOIN)})",
-                    "value": mp.get(CONF_NAME),
-                }
-            )
+        entity_options: list[dict[str, str]] = self._build_entity_options(data)
 
         if not entity_options:
             # No entities to remove, return to menu
             return await self.flow.async_step_init()
 
         # Show removal form
-        remove_schema: vol.Schema = vol.Schema(
-            {
-                vol.Optional("entities_to_remove"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=entity_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                        multiple=True,
-                    )
-                ),
-            }
-        )
+        remove_schema: vol.Schema = self._get_select_schema(vol.Optional("entities_to_remove"), entity_options, True)
 
         return self.flow.async_show_form(
             step_id="remove_entities",
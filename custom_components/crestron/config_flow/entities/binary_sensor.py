@@ -9,18 +9,59 @@ from homeassistant.helpers import selector
 import voluptuous as vol
 
 from ...const import CONF_BINARY_SENSORS, CONF_IS_ON_JOIN
+from ..validators import DIGITAL_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 _LOGGER = logging.getLogger(__name__)
 
+# Binary sensor form fields, in display order
+_BINARY_SENSOR_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    CONF_IS_ON_JOIN,
+    CONF_DEVICE_CLASS,
+)
+# Form defaults when adding; also the fallback for fields missing from an edited entry
+_BINARY_SENSOR_DEFAULTS_EMPTY: dict[str, str] = {
+    **dict.fromkeys(_BINARY_SENSOR_FIELDS, ""),
+    CONF_DEVICE_CLASS: "motion",
+}
+
+# Selectors are stateless, so the form shares module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_BINARY_SENSOR_DEVICE_CLASS_SELECTOR: selector.SelectSelector = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"label": "Motion", "value": "motion"},
+            {"label": "Door", "value": "door"},
+            {"label": "Window", "value": "window"},
+            {"label": "Opening", "value": "opening"},
+            {"label": "Occupancy", "value": "occupancy"},
+            {"label": "Presence", "value": "presence"},
+            {"label": "Garage Door", "value": "garage_door"},
+            {"label": "Smoke", "value": "smoke"},
+            {"label": "Moisture", "value": "moisture"},
+            {"label": "Light", "value": "light"},
+            {"label": "None", "value": "none"},
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
 
 class BinarySensorEntityHandler:
     """Handler for binary sensor entity configuration."""
 
+    __slots__ = ("flow", "_schema_cache")
+
     flow: Any  # Type is OptionsFlowHandler from config_flow.py
+    _schema_cache: dict[tuple, vol.Schema]
 
     def __init__(self, flow: Any) -> None:
         """Initialize the binary sensor entity handler."""
         self.flow = flow
+        self._schema_cache = {}
 
     async def async_step_add_binary_sensor(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a binary sensor entity."""
@@ -34,13 +75,13 @@ class BinarySensorEntityHandler:
                 device_class: str | None = user_input.get(CONF_DEVICE_CLASS)
 
                 # Validate is_on_join format (must be digital)
-                if not is_on_join or not (is_on_join[0] == "d" and is_on_join[1:].isdigit()):
+                if not DIGITAL_JOIN_RE.fullmatch(is_on_join or ""):
                     errors[CONF_IS_ON_JOIN] = "invalid_join_format"
 
                 # Check for duplicate entity name
-                current_binary_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
                 old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(bs.get(CONF_NAME) == name for bs in current_binary_sensors):
+                name_index: dict[str | None, int] = get_name_index(self.flow, CONF_BINARY_SENSORS)
+                if name != old_name and name in name_index:
                     errors[CONF_NAME] = "entity_already_exists"
 
                 if not errors:
@@ -51,78 +92,36 @@ class BinarySensorEntityHandler:
                         CONF_DEVICE_CLASS: device_class,
                     }
 
-                    if is_editing:
-                        # Replace existing binary sensor
-                        updated_binary_sensors: list[dict[str, Any]] = [
-                            new_binary_sensor if bs.get(CONF_NAME) == old_name else bs for bs in current_binary_sensors
-                        ]
-                        _LOGGER.info("Updated binary sensor %s", name)
-                    else:
-                        # Append new binary sensor
-                        updated_binary_sensors: list[dict[str, Any]] = current_binary_sensors + [new_binary_sensor]
-                        _LOGGER.info("Added binary sensor %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_BINARY_SENSORS] = updated_binary_sensors
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
+                    return await async_upsert_entity(
+                        self.flow, CONF_BINARY_SENSORS, new_binary_sensor, name_index.get(old_name), "binary sensor"
+                    )
 
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error adding/updating binary sensor: %s", err)
                 errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, Any] = {}
+        default_values: dict[str, str] = _BINARY_SENSOR_DEFAULTS_EMPTY
         if is_editing:
             default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_IS_ON_JOIN: self.flow._editing_join.get(CONF_IS_ON_JOIN, ""),
-                CONF_DEVICE_CLASS: self.flow._editing_join.get(CONF_DEVICE_CLASS, "motion"),
+                field: self.flow._editing_join.get(field, _BINARY_SENSOR_DEFAULTS_EMPTY[field])
+                for field in _BINARY_SENSOR_FIELDS
             }
 
-        # Show form
-        add_binary_sensor_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_IS_ON_JOIN, default=default_values.get(CONF_IS_ON_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_DEVICE_CLASS, default=default_values.get(CONF_DEVICE_CLASS, "motion")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Motion", "value": "motion"},
-                            {"label": "Door", "value": "door"},
-                            {"label": "Window", "value": "window"},
-                            {"label": "Opening", "value": "opening"},
-                            {"label": "Occupancy", "value": "occupancy"},
-                            {"label": "Presence", "value": "presence"},
-                            {"label": "Garage Door", "value": "garage_door"},
-                            {"label": "Smoke", "value": "smoke"},
-                            {"label": "Moisture", "value": "moisture"},
-                            {"label": "Light", "value": "light"},
-                            {"label": "None", "value": "none"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_binary_sensor_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_binary_sensor_schema is None:
+            add_binary_sensor_schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=default_values[CONF_NAME]): _TEXT_SELECTOR,
+                    vol.Required(CONF_IS_ON_JOIN, default=default_values[CONF_IS_ON_JOIN]): _TEXT_SELECTOR,
+                    vol.Required(
+                        CONF_DEVICE_CLASS, default=default_values[CONF_DEVICE_CLASS]
+                    ): _BINARY_SENSOR_DEVICE_CLASS_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_binary_sensor_schema
 
         return self.flow.async_show_form(
             step_id="add_binary_sensor",
@@ -38,12 +38,103 @@ from ...const import (
     CONF_MODE_OFF_JOIN,
     CONF_REG_TEMP_JOIN,
 )
+from ..validators import ANALOG_JOIN_RE, DIGITAL_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 if TYPE_CHECKING:
     from ..base import BaseOptionsFlow
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Selectors are stateless, so every text field shares one instance
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+
+# Climate type selection form (options are static)
+_CLIMATE_TYPE_SCHEMA: vol.Schema = vol.Schema(
+    {
+        vol.Required("climate_type"): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    {"label": "Floor Warming Thermostat (5 analog joins)", "value": "floor_warming"},
+                    {"label": "Standard HVAC (3 analog + 15 digital joins)", "value": "standard"},
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+    }
+)
+
+# Floor warming joins (all analog), in display and stored entry order
+_FLOOR_JOIN_FIELDS: tuple[str, ...] = (
+    CONF_FLOOR_MODE_JOIN,
+    CONF_FLOOR_MODE_FB_JOIN,
+    CONF_FLOOR_SP_JOIN,
+    CONF_FLOOR_SP_FB_JOIN,
+    CONF_FLOOR_TEMP_JOIN,
+)
+
+# Floor warming form fields, in display order
+_ADD_CLIMATE_FIELDS: tuple[str, ...] = (CONF_NAME, *_FLOOR_JOIN_FIELDS)
+
+# Standard HVAC form fields, in display order
+_ADD_STANDARD_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    # Temperature setpoints (3 analog)
+    CONF_HEAT_SP_JOIN,
+    CONF_COOL_SP_JOIN,
+    CONF_REG_TEMP_JOIN,
+    # HVAC modes (5 digital)
+    CONF_MODE_HEAT_JOIN,
+    CONF_MODE_COOL_JOIN,
+    CONF_MODE_AUTO_JOIN,
+    CONF_MODE_HEAT_COOL_JOIN,
+    CONF_MODE_OFF_JOIN,
+    # Fan modes (4 digital)
+    CONF_FAN_ON_JOIN,
+    CONF_FAN_AUTO_JOIN,
+    CONF_FAN_MODE_ON_JOIN,
+    CONF_FAN_MODE_AUTO_JOIN,
+    # HVAC equipment status (6 digital, 2 optional)
+    CONF_H1_JOIN,
+    CONF_H2_JOIN,
+    CONF_C1_JOIN,
+    CONF_C2_JOIN,
+    CONF_FA_JOIN,
+    # HVAC actions (3 digital)
+    CONF_HVAC_ACTION_HEAT_JOIN,
+    CONF_HVAC_ACTION_COOL_JOIN,
+    CONF_HVAC_ACTION_IDLE_JOIN,
+)
+
+# Standard HVAC joins by validation type, in stored entry order
+_STANDARD_ANALOG: tuple[str, ...] = (CONF_HEAT_SP_JOIN, CONF_COOL_SP_JOIN, CONF_REG_TEMP_JOIN)
+_STANDARD_DIGITAL: tuple[str, ...] = (
+    CONF_MODE_HEAT_JOIN,
+    CONF_MODE_COOL_JOIN,
+    CONF_MODE_AUTO_JOIN,
+    CONF_MODE_OFF_JOIN,
+    CONF_FAN_ON_JOIN,
+    CONF_FAN_AUTO_JOIN,
+    CONF_H1_JOIN,
+    CONF_C1_JOIN,
+    CONF_FA_JOIN,
+    CONF_MODE_HEAT_COOL_JOIN,
+    CONF_FAN_MODE_AUTO_JOIN,
+    CONF_FAN_MODE_ON_JOIN,
+    CONF_HVAC_ACTION_HEAT_JOIN,
+    CONF_HVAC_ACTION_COOL_JOIN,
+    CONF_HVAC_ACTION_IDLE_JOIN,
+)
+# Standard HVAC joins that may be left blank
+_STANDARD_OPTIONAL: tuple[str, ...] = (CONF_H2_JOIN, CONF_C2_JOIN)
+
+# Standard HVAC form fields paired with their schema marker, in display order
+_ADD_STANDARD_MARKERS: tuple[tuple[type[vol.Marker], str], ...] = tuple(
+    (vol.Optional if field in _STANDARD_OPTIONAL else vol.Required, field) for field in _ADD_STANDARD_FIELDS
+)
+
 
 class ClimateEntityHandler:
     """Handler for climate entity configuration."""
@@ -55,6 +146,7 @@ class ClimateEntityHandler:
             flow: The options flow instance
         """
         self.flow: BaseOptionsFlow = flow
+        self._schema_cache: dict[tuple, vol.Schema] = {}
 
     async def async_step_select_climate_type(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Select climate type (floor_warming or standard).
@@ -73,23 +165,9 @@ class ClimateEntityHandler:
                 return await self.flow.async_step_add_climate_standard()
 
         # Show type selection form
-        type_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required("climate_type"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Floor Warming Thermostat (5 analog joins)", "value": "floor_warming"},
-                            {"label": "Standard HVAC (3 analog + 15 digital joins)", "value": "standard"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-            }
-        )
-
         return self.flow.async_show_form(
             step_id="select_climate_type",
-            data_schema=type_schema,
+            data_schema=_CLIMATE_TYPE_SCHEMA,
         )
 
     async def async_step_add_climate(self, user_input: dict[str, Any] | None = None) -> FlowResult:
@@ -102,34 +180,27 @@ class ClimateEntityHandler:
             FlowResult for next step or form display
         """
         errors: dict[str, str] = {}
-        is_editing: bool = self.flow._editing_join is not None
+        editing: dict[str, Any] | None = self.flow._editing_join
+        is_editing: bool = editing is not None
 
         if user_input is not None:
             try:
                 name: str | None = user_input.get(CONF_NAME)
-                floor_mode_join: str | None = user_input.get(CONF_FLOOR_MODE_JOIN)
-                floor_mode_fb_join: str | None = user_input.get(CONF_FLOOR_MODE_FB_JOIN)
-                floor_sp_join: str | None = user_input.get(CONF_FLOOR_SP_JOIN)
-                floor_sp_fb_join: str | None = user_input.get(CONF_FLOOR_SP_FB_JOIN)
-                floor_temp_join: str | None = user_input.get(CONF_FLOOR_TEMP_JOIN)
 
                 # Validate all joins are analog format
-                joins_to_validate: list[tuple[str, str | None]] = [
-                    (CONF_FLOOR_MODE_JOIN, floor_mode_join),
-                    (CONF_FLOOR_MODE_FB_JOIN, floor_mode_fb_join),
-                    (CONF_FLOOR_SP_JOIN, floor_sp_join),
-                    (CONF_FLOOR_SP_FB_JOIN, floor_sp_fb_join),
-                    (CONF_FLOOR_TEMP_JOIN, floor_temp_join),
-                ]
-
-                for join_field, join_value in joins_to_validate:
-                    if not join_value or not (join_value[0] == "a" and join_value[1:].isdigit()):
+                for join_field in _FLOOR_JOIN_FIELDS:
+                    join_value: str | None = user_input.get(join_field)
+                    if not join_value or not ANALOG_JOIN_RE.fullmatch(join_value):
                         errors[join_field] = "invalid_join_format"
 
+                # Skip the duplicate scan when the joins are already invalid
+                if errors:
+                    return self._show_add_climate_form(errors)
+
                 # Check for duplicate entity name
-                current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(c.get(CONF_NAME) == name for c in current_climates):
+                old_name: str | None = editing.get(CONF_NAME) if is_editing else None
+                name_index: dict[str | None, int] = get_name_index(self.flow, CONF_CLIMATES)
+                if name != old_name and name in name_index:
                     errors[CONF_NAME] = "entity_already_exists"
 
                 if not errors:
@@ -137,104 +208,18 @@ class ClimateEntityHandler:
                     new_climate: dict[str, Any] = {
                         CONF_NAME: name,
                         CONF_TYPE: "floor_warming",
-                        CONF_FLOOR_MODE_JOIN: floor_mode_join,
-                        CONF_FLOOR_MODE_FB_JOIN: floor_mode_fb_join,
-                        CONF_FLOOR_SP_JOIN: floor_sp_join,
-                        CONF_FLOOR_SP_FB_JOIN: floor_sp_fb_join,
-                        CONF_FLOOR_TEMP_JOIN: floor_temp_join,
+                        **{field: user_input.get(field) for field in _FLOOR_JOIN_FIELDS},
                     }
 
-                    if is_editing:
-                        # Replace existing climate
-                        updated_climates: list[dict[str, Any]] = [
-                            new_climate if c.get(CONF_NAME) == old_name else c for c in current_climates
-                        ]
-                        _LOGGER.info("Updated climate %s", name)
-                    else:
-                        # Append new climate
-                        updated_climates: list[dict[str, Any]] = current_climates + [new_climate]
-                        _LOGGER.info("Added climate %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_CLIMATES] = updated_climates
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
+                    return await async_upsert_entity(
+                        self.flow, CONF_CLIMATES, new_climate, name_index.get(old_name), "climate"
+                    )
 
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error adding/updating climate: %s", err)
                 errors["base"] = "unknown"
 
-        # Pre-fill form if editing
-        default_values: dict[str, str] = {}
-        if is_editing:
-            default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_FLOOR_MODE_JOIN: self.flow._editing_join.get(CONF_FLOOR_MODE_JOIN, ""),
-                CONF_FLOOR_MODE_FB_JOIN: self.flow._editing_join.get(CONF_FLOOR_MODE_FB_JOIN, ""),
-                CONF_FLOOR_SP_JOIN: self.flow._editing_join.get(CONF_FLOOR_SP_JOIN, ""),
-                CONF_FLOOR_SP_FB_JOIN: self.flow._editing_join.get(CONF_FLOOR_SP_FB_JOIN, ""),
-                CONF_FLOOR_TEMP_JOIN: self.flow._editing_join.get(CONF_FLOOR_TEMP_JOIN, ""),
-            }
-
-        # Show form
-        add_climate_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_FLOOR_MODE_JOIN, default=default_values.get(CONF_FLOOR_MODE_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_FLOOR_MODE_FB_JOIN, default=default_values.get(CONF_FLOOR_MODE_FB_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_FLOOR_SP_JOIN, default=default_values.get(CONF_FLOOR_SP_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_FLOOR_SP_FB_JOIN, default=default_values.get(CONF_FLOOR_SP_FB_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_FLOOR_TEMP_JOIN, default=default_values.get(CONF_FLOOR_TEMP_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-            }
-        )
-
-        return self.flow.async_show_form(
-            step_id="add_climate",
-            data_schema=add_climate_schema,
-            errors=errors,
-        )
+        return self._show_add_climate_form(errors)
 
     async def async_step_add_climate_standard(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a standard HVAC climate entity.
@@ -246,59 +231,45 @@ class ClimateEntityHandler:
             FlowResult for next step or form display
         """
         errors: dict[str, str] = {}
-        is_editing: bool = self.flow._editing_join is not None
+        editing: dict[str, Any] | None = self.flow._editing_join
+        is_editing: bool = editing is not None
 
         if user_input is not None:
             try:
                 name: str | None = user_input.get(CONF_NAME)
 
-                # Validate analog joins (3 required)
-                analog_joins: dict[str, str | None] = {
-                    CONF_HEAT_SP_JOIN: user_input.get(CONF_HEAT_SP_JOIN),
-                    CONF_COOL_SP_JOIN: user_input.get(CONF_COOL_SP_JOIN),
-                    CONF_REG_TEMP_JOIN: user_input.get(CONF_REG_TEMP_JOIN),
+                # Fetch every join once
+                values: dict[str, str | None] = {
+                    field: user_input.get(field)
+                    for field in (*_STANDARD_ANALOG, *_STANDARD_DIGITAL, *_STANDARD_OPTIONAL)
                 }
 
-                for join_field, join_value in analog_joins.items():
-                    if not join_value or not (join_value[0] == "a" and join_value[1:].isdigit()):
+                # Validate analog joins (3 required)
+                for join_field in _STANDARD_ANALOG:
+                    join_value: str | None = values[join_field]
+                    if not join_value or not ANALOG_JOIN_RE.fullmatch(join_value):
                         errors[join_field] = "invalid_join_format"
 
                 # Validate digital joins (15 required)
-                digital_joins: dict[str, str | None] = {
-                    CONF_MODE_HEAT_JOIN: user_input.get(CONF_MODE_HEAT_JOIN),
-                    CONF_MODE_COOL_JOIN: user_input.get(CONF_MODE_COOL_JOIN),
-                    CONF_MODE_AUTO_JOIN: user_input.get(CONF_MODE_AUTO_JOIN),
-                    CONF_MODE_OFF_JOIN: user_input.get(CONF_MODE_OFF_JOIN),
-                    CONF_FAN_ON_JOIN: user_input.get(CONF_FAN_ON_JOIN),
-                    CONF_FAN_AUTO_JOIN: user_input.get(CONF_FAN_AUTO_JOIN),
-                    CONF_H1_JOIN: user_input.get(CONF_H1_JOIN),
-                    CONF_C1_JOIN: user_input.get(CONF_C1_JOIN),
-                    CONF_FA_JOIN: user_input.get(CONF_FA_JOIN),
-                    CONF_MODE_HEAT_COOL_JOIN: user_input.get(CONF_MODE_HEAT_COOL_JOIN),
-                    CONF_FAN_MODE_AUTO_JOIN: user_input.get(CONF_FAN_MODE_AUTO_JOIN),
-                    CONF_FAN_MODE_ON_JOIN: user_input.get(CONF_FAN_MODE_ON_JOIN),
-                    CONF_HVAC_ACTION_HEAT_JOIN: user_input.get(CONF_HVAC_ACTION_HEAT_JOIN),
-                    CONF_HVAC_ACTION_COOL_JOIN: user_input.get(CONF_HVAC_ACTION_COOL_JOIN),
-                    CONF_HVAC_ACTION_IDLE_JOIN: user_input.get(CONF_HVAC_ACTION_IDLE_JOIN),
-                }
-
-                for join_field, join_value in digital_joins.items():
-                    if not join_value or not (join_value[0] == "d" and join_value[1:].isdigit()):
+                for join_field in _STANDARD_DIGITAL:
+                    join_value = values[join_field]
+                    if not join_value or not DIGITAL_JOIN_RE.fullmatch(join_value):
                         errors[join_field] = "invalid_join_format"
 
                 # Validate optional digital joins (2 optional)
-                h2_join: str = user_input.get(CONF_H2_JOIN, "")
-                c2_join: str = user_input.get(CONF_C2_JOIN, "")
+                for join_field in _STANDARD_OPTIONAL:
+                    join_value = values[join_field]
+                    if join_value and not DIGITAL_JOIN_RE.fullmatch(join_value):
+                        errors[join_field] = "invalid_join_format"
 
-                if h2_join and not (h2_join[0] == "d" and h2_join[1:].isdigit()):
-                    errors[CONF_H2_JOIN] = "invalid_join_format"
-                if c2_join and not (c2_join[0] == "d" and c2_join[1:].isdigit()):
-                    errors[CONF_C2_JOIN] = "invalid_join_format"
+                # Skip the duplicate scan when the joins are already invalid
+                if errors:
+                    return self._show_add_climate_standard_form(errors)
 
                 # Check for duplicate entity name
-                current_climates: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(c.get(CONF_NAME) == name for c in current_climates):
+                old_name: str | None = editing.get(CONF_NAME) if is_editing else None
+                name_index: dict[str | None, int] = get_name_index(self.flow, CONF_CLIMATES)
+                if name != old_name and name in name_index:
                     errors[CONF_NAME] = "entity_already_exists"
 
                 if not errors:
@@ -306,162 +277,85 @@ class ClimateEntityHandler:
                     new_climate: dict[str, Any] = {
                         CONF_NAME: name,
                         CONF_TYPE: "standard",
-                        CONF_HEAT_SP_JOIN: user_input.get(CONF_HEAT_SP_JOIN),
-                        CONF_COOL_SP_JOIN: user_input.get(CONF_COOL_SP_JOIN),
-                        CONF_REG_TEMP_JOIN: user_input.get(CONF_REG_TEMP_JOIN),
-                        CONF_MODE_HEAT_JOIN: user_input.get(CONF_MODE_HEAT_JOIN),
-                        CONF_MODE_COOL_JOIN: user_input.get(CONF_MODE_COOL_JOIN),
-                        CONF_MODE_AUTO_JOIN: user_input.get(CONF_MODE_AUTO_JOIN),
-                        CONF_MODE_OFF_JOIN: user_input.get(CONF_MODE_OFF_JOIN),
-                        CONF_FAN_ON_JOIN: user_input.get(CONF_FAN_ON_JOIN),
-                        CONF_FAN_AUTO_JOIN: user_input.get(CONF_FAN_AUTO_JOIN),
-                        CONF_H1_JOIN: user_input.get(CONF_H1_JOIN),
-                        CONF_C1_JOIN: user_input.get(CONF_C1_JOIN),
-                        CONF_FA_JOIN: user_input.get(CONF_FA_JOIN),
-                        CONF_MODE_HEAT_COOL_JOIN: user_input.get(CONF_MODE_HEAT_COOL_JOIN),
-                        CONF_FAN_MODE_AUTO_JOIN: user_input.get(CONF_FAN_MODE_AUTO_JOIN),
-                        CONF_FAN_MODE_ON_JOIN: user_input.get(CONF_FAN_MODE_ON_JOIN),
-                        CONF_HVAC_ACTION_HEAT_JOIN: user_input.get(CONF_HVAC_ACTION_HEAT_JOIN),
-                        CONF_HVAC_ACTION_COOL_JOIN: user_input.get(CONF_HVAC_ACTION_COOL_JOIN),
-                        CONF_HVAC_ACTION_IDLE_JOIN: user_input.get(CONF_HVAC_ACTION_IDLE_JOIN),
+                        **{field: values[field] for field in (*_STANDARD_ANALOG, *_STANDARD_DIGITAL)},
                     }
 
                     # Add optional joins if provided
-                    if h2_join:
-                        new_climate[CONF_H2_JOIN] = h2_join
-                    if c2_join:
-                        new_climate[CONF_C2_JOIN] = c2_join
-
-                    if is_editing:
-                        # Replace existing climate
-                        updated_climates: list[dict[str, Any]] = [
-                            new_climate if c.get(CONF_NAME) == old_name else c for c in current_climates
-                        ]
-                        _LOGGER.info("Updated standard climate %s", name)
-                    else:
-                        # Append new climate
-                        updated_climates: list[dict[str, Any]] = current_climates + [new_climate]
-                        _LOGGER.info("Added standard climate %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_CLIMATES] = updated_climates
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
+                    for join_field in _STANDARD_OPTIONAL:
+                        if values[join_field]:
+                            new_climate[join_field] = values[join_field]
+
+                    return await async_upsert_entity(
+                        self.flow, CONF_CLIMATES, new_climate, name_index.get(old_name), "standard climate"
+                    )
 
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error adding/updating standard climate: %s", err)
                 errors["base"] = "unknown"
 
+        return self._show_add_climate_standard_form(errors)
+
+    def _show_add_climate_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the floor warming form, pre-filled when editing.
+
+        Args:
+            errors: Validation errors to display
+
+        Returns:
+            FlowResult for form display
+        """
+        # Pre-fill form if editing
+        editing: dict[str, Any] | None = self.flow._editing_join
+        default_values: dict[str, str] = (
+            {field: editing.get(field, "") for field in _ADD_CLIMATE_FIELDS}
+            if editing is not None
+            else dict.fromkeys(_ADD_CLIMATE_FIELDS, "")
+        )
+
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_climate_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_climate_schema is None:
+            add_climate_schema = vol.Schema(
+                {vol.Required(field, default=default_values[field]): _TEXT_SELECTOR for field in _ADD_CLIMATE_FIELDS}
+            )
+            self._schema_cache[cache_key] = add_climate_schema
+
+        return self.flow.async_show_form(
+            step_id="add_climate",
+            data_schema=add_climate_schema,
+            errors=errors,
+        )
+
+    def _show_add_climate_standard_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the standard HVAC form, pre-filled when editing.
+
+        Args:
+            errors: Validation errors to display
+
+        Returns:
+            FlowResult for form display
+        """
         # Pre-fill form if editing
-        default_values: dict[str, str] = {}
-        if is_editing:
-            default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_HEAT_SP_JOIN: self.flow._editing_join.get(CONF_HEAT_SP_JOIN, ""),
-                CONF_COOL_SP_JOIN: self.flow._editing_join.get(CONF_COOL_SP_JOIN, ""),
-                CONF_REG_TEMP_JOIN: self.flow._editing_join.get(CONF_REG_TEMP_JOIN, ""),
-                CONF_MODE_HEAT_JOIN: self.flow._editing_join.get(CONF_MODE_HEAT_JOIN, ""),
-                CONF_MODE_COOL_JOIN: self.flow._editing_join.get(CONF_MODE_COOL_JOIN, ""),
-                CONF_MODE_AUTO_JOIN: self.flow._editing_join.get(CONF_MODE_AUTO_JOIN, ""),
-                CONF_MODE_OFF_JOIN: self.flow._editing_join.get(CONF_MODE_OFF_JOIN, ""),
-                CONF_FAN_ON_JOIN: self.flow._editing_join.get(CONF_FAN_ON_JOIN, ""),
-                CONF_FAN_AUTO_JOIN: self.flow._editing_join.get(CONF_FAN_AUTO_JOIN, ""),
-                CONF_H1_JOIN: self.flow._editing_join.get(CONF_H1_JOIN, ""),
-                CONF_H2_JOIN: self.flow._editing_join.get(CONF_H2_JOIN, ""),
-                CONF_C1_JOIN: self.flow._editing_join.get(CONF_C1_JOIN, ""),
-                CONF_C2_JOIN: self.flow._editing_join.get(CONF_C2_JOIN, ""),
-                CONF_FA_JOIN: self.flow._editing_join.get(CONF_FA_JOIN, ""),
-                CONF_MODE_HEAT_COOL_JOIN: self.flow._editing_join.get(CONF_MODE_HEAT_COOL_JOIN, ""),
-                CONF_FAN_MODE_AUTO_JOIN: self.flow._editing_join.get(CONF_FAN_MODE_AUTO_JOIN, ""),
-                CONF_FAN_MODE_ON_JOIN: self.flow._editing_join.get(CONF_FAN_MODE_ON_JOIN, ""),
-                CONF_HVAC_ACTION_HEAT_JOIN: self.flow._editing_join.get(CONF_HVAC_ACTION_HEAT_JOIN, ""),
-                CONF_HVAC_ACTION_COOL_JOIN: self.flow._editing_join.get(CONF_HVAC_ACTION_COOL_JOIN, ""),
-                CONF_HVAC_ACTION_IDLE_JOIN: self.flow._editing_join.get(CONF_HVAC_ACTION_IDLE_JOIN, ""),
-            }
-
-        # Show form - organized by section
-        add_climate_standard_schema: vol.Schema = vol.Schema(
-            {
-                # Name
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                # Temperature setpoints (3 analog)
-                vol.Required(
-                    CONF_HEAT_SP_JOIN, default=default_values.get(CONF_HEAT_SP_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_COOL_SP_JOIN, default=default_values.get(CONF_COOL_SP_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_REG_TEMP_JOIN, default=default_values.get(CONF_REG_TEMP_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                # HVAC modes (5 digital)
-                vol.Required(
-                    CONF_MODE_HEAT_JOIN, default=default_values.get(CONF_MODE_HEAT_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_MODE_COOL_JOIN, default=default_values.get(CONF_MODE_COOL_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_MODE_AUTO_JOIN, default=default_values.get(CONF_MODE_AUTO_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_MODE_HEAT_COOL_JOIN, default=default_values.get(CONF_MODE_HEAT_COOL_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_MODE_OFF_JOIN, default=default_values.get(CONF_MODE_OFF_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                # Fan modes (4 digital)
-                vol.Required(CONF_FAN_ON_JOIN, default=default_values.get(CONF_FAN_ON_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Required(
-                    CONF_FAN_AUTO_JOIN, default=default_values.get(CONF_FAN_AUTO_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_FAN_MODE_ON_JOIN, default=default_values.get(CONF_FAN_MODE_ON_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_FAN_MODE_AUTO_JOIN, default=default_values.get(CONF_FAN_MODE_AUTO_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                # HVAC equipment status (6 digital, 2 optional)
-                vol.Required(CONF_H1_JOIN, default=default_values.get(CONF_H1_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Optional(CONF_H2_JOIN, default=default_values.get(CONF_H2_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_C1_JOIN, default=default_values.get(CONF_C1_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Optional(CONF_C2_JOIN, default=default_values.get(CONF_C2_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_FA_JOIN, default=default_values.get(CONF_FA_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                # HVAC actions (3 digital)
-                vol.Required(
-                    CONF_HVAC_ACTION_HEAT_JOIN, default=default_values.get(CONF_HVAC_ACTION_HEAT_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_HVAC_ACTION_COOL_JOIN, default=default_values.get(CONF_HVAC_ACTION_COOL_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-                vol.Required(
-                    CONF_HVAC_ACTION_IDLE_JOIN, default=default_values.get(CONF_HVAC_ACTION_IDLE_JOIN, "")
-                ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)),
-            }
+        editing: dict[str, Any] | None = self.flow._editing_join
+        default_values: dict[str, str] = (
+            {field: editing.get(field, "") for field in _ADD_STANDARD_FIELDS}
+            if editing is not None
+            else dict.fromkeys(_ADD_STANDARD_FIELDS, "")
         )
 
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_climate_standard_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_climate_standard_schema is None:
+            add_climate_standard_schema = vol.Schema(
+                {
+                    marker(field, default=default_values[field]): _TEXT_SELECTOR
+                    for marker, field in _ADD_STANDARD_MARKERS
+                }
+            )
+            self._schema_cache[cache_key] = add_climate_standard_schema
+
         return self.flow.async_show_form(
             step_id="add_climate_standard",
             data_schema=add_climate_standard_schema,
@@ -18,163 +18,125 @@ from ...const import (
     CONF_POS_JOIN,
     CONF_STOP_JOIN,
 )
+from ..validators import ANALOG_JOIN_RE, DIGITAL_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 if TYPE_CHECKING:
-    from ..options_flow import OptionsFlowHandler
+    from ..flow import OptionsFlowHandler
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Optional digital joins, in stored entry order
+_OPTIONAL_JOINS: tuple[str, ...] = (CONF_IS_OPENING_JOIN, CONF_IS_CLOSING_JOIN, CONF_IS_CLOSED_JOIN, CONF_STOP_JOIN)
+
+# Cover form fields, in display order
+_COVER_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    CONF_POS_JOIN,
+    CONF_TYPE,
+    CONF_IS_OPENING_JOIN,
+    CONF_IS_CLOSING_JOIN,
+    CONF_IS_CLOSED_JOIN,
+    CONF_STOP_JOIN,
+)
+# Form defaults when adding; also the fallback for fields missing from an edited entry
+_COVER_DEFAULTS_EMPTY: dict[str, str] = {**dict.fromkeys(_COVER_FIELDS, ""), CONF_TYPE: "shade"}
+
+# Selectors are stateless, so the form shares module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_COVER_TYPE_SELECTOR: selector.SelectSelector = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[{"label": "Shade", "value": "shade"}],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
 
 class CoverEntityHandler:
     """Handler for cover entity configuration."""
 
     flow: OptionsFlowHandler
+    _schema_cache: dict[tuple, vol.Schema]
 
     def __init__(self, flow: OptionsFlowHandler) -> None:
         """Initialize the cover entity handler."""
         self.flow = flow
+        self._schema_cache = {}
 
     async def async_step_add_cover(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a cover entity."""
         errors: dict[str, str] = {}
-        is_editing = self.flow._editing_join is not None
+        is_editing: bool = self.flow._editing_join is not None
 
         if user_input is not None:
-            try:
-                name: str | None = user_input.get(CONF_NAME)
-                pos_join: str | None = user_input.get(CONF_POS_JOIN)
-                entity_type: str = user_input.get(CONF_TYPE, "shade")
-                is_opening_join: str = user_input.get(CONF_IS_OPENING_JOIN, "").strip()
-                is_closing_join: str = user_input.get(CONF_IS_CLOSING_JOIN, "").strip()
-                is_closed_join: str = user_input.get(CONF_IS_CLOSED_JOIN, "").strip()
-                stop_join: str = user_input.get(CONF_STOP_JOIN, "").strip()
-
-                # Validate pos_join format (must be analog)
-                if not pos_join or not (pos_join[0] == "a" and pos_join[1:].isdigit()):
-                    errors[CONF_POS_JOIN] = "invalid_join_format"
-
-                # Validate optional joins format (must be digital if provided)
-                for join_field, join_value in [
-                    (CONF_IS_OPENING_JOIN, is_opening_join),
-                    (CONF_IS_CLOSING_JOIN, is_closing_join),
-                    (CONF_IS_CLOSED_JOIN, is_closed_join),
-                    (CONF_STOP_JOIN, stop_join),
-                ]:
-                    if join_value and not (join_value[0] == "d" and join_value[1:].isdigit()):
-                        errors[join_field] = "invalid_join_format"
-
-                # Check for duplicate entity name
-                current_covers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_COVERS, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(c.get(CONF_NAME) == name for c in current_covers):
-                    errors[CONF_NAME] = "entity_already_exists"
-
-                if not errors:
-                    # Build new cover entry
-                    new_cover: dict[str, Any] = {
-                        CONF_NAME: name,
-                        CONF_POS_JOIN: pos_join,
-                        CONF_TYPE: entity_type,
-                    }
-
-                    # Add optional joins
-                    if is_opening_join:
-                        new_cover[CONF_IS_OPENING_JOIN] = is_opening_join
-                    if is_closing_join:
-                        new_cover[CONF_IS_CLOSING_JOIN] = is_closing_join
-                    if is_closed_join:
-                        new_cover[CONF_IS_CLOSED_JOIN] = is_closed_join
-                    if stop_join:
-                        new_cover[CONF_STOP_JOIN] = stop_join
-
-                    if is_editing:
-                        # Replace existing cover
-                        updated_covers: list[dict[str, Any]] = [
-                            new_cover if c.get(CONF_NAME) == old_name else c for c in current_covers
-                        ]
-                        _LOGGER.info("Updated cover %s", name)
-                    else:
-                        # Append new cover
-                        updated_covers: list[dict[str, Any]] = current_covers + [new_cover]
-                        _LOGGER.info("Added cover %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_COVERS] = updated_covers
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
-
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.exception("Error adding/updating cover: %s", err)
-                errors["base"] = "unknown"
+            name: str | None = user_input.get(CONF_NAME)
+            pos_join: str | None = user_input.get(CONF_POS_JOIN)
+            entity_type: str = user_input.get(CONF_TYPE, "shade")
+
+            # Validate pos_join format (must be analog)
+            if not pos_join or not ANALOG_JOIN_RE.fullmatch(pos_join):
+                errors[CONF_POS_JOIN] = "invalid_join_format"
+
+            # Validate optional joins format (must be digital if provided)
+            optional_joins: dict[str, str] = {}
+            join_field: str
+            for join_field in _OPTIONAL_JOINS:
+                join_value: str = user_input.get(join_field, "").strip()
+                if not join_value:
+                    continue
+                if DIGITAL_JOIN_RE.fullmatch(join_value):
+                    optional_joins[join_field] = join_value
+                else:
+                    errors[join_field] = "invalid_join_format"
+
+            # Check for duplicate entity name
+            old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
+            name_index: dict[str | None, int] = get_name_index(self.flow, CONF_COVERS)
+            if name != old_name and name in name_index:
+                errors[CONF_NAME] = "entity_already_exists"
+
+            if not errors:
+                # Build new cover entry
+                new_cover: dict[str, Any] = {
+                    CONF_NAME: name,
+                    CONF_POS_JOIN: pos_join,
+                    CONF_TYPE: entity_type,
+                    **optional_joins,
+                }
+
+                try:
+                    return await async_upsert_entity(
+                        self.flow, CONF_COVERS, new_cover, name_index.get(old_name), "cover"
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error adding/updating cover: %s", err)
+                    errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, Any] = {}
+        default_values: dict[str, str] = _COVER_DEFAULTS_EMPTY
         if is_editing:
             default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_POS_JOIN: self.flow._editing_join.get(CONF_POS_JOIN, ""),
-                CONF_TYPE: self.flow._editing_join.get(CONF_TYPE, "shade"),
-                CONF_IS_OPENING_JOIN: self.flow._editing_join.get(CONF_IS_OPENING_JOIN, ""),
-                CONF_IS_CLOSING_JOIN: self.flow._editing_join.get(CONF_IS_CLOSING_JOIN, ""),
-                CONF_IS_CLOSED_JOIN: self.flow._editing_join.get(CONF_IS_CLOSED_JOIN, ""),
-                CONF_STOP_JOIN: self.flow._editing_join.get(CONF_STOP_JOIN, ""),
+                field: self.flow._editing_join.get(field, _COVER_DEFAULTS_EMPTY[field]) for field in _COVER_FIELDS
             }
 
-        # Show form
-        add_cover_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_POS_JOIN, default=default_values.get(CONF_POS_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_TYPE, default=default_values.get(CONF_TYPE, "shade")): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"label": "Shade", "value": "shade"}],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(
-                    CONF_IS_OPENING_JOIN, default=default_values.get(CONF_IS_OPENING_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    CONF_IS_CLOSING_JOIN, default=default_values.get(CONF_IS_CLOSING_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    CONF_IS_CLOSED_JOIN, default=default_values.get(CONF_IS_CLOSED_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_STOP_JOIN, default=default_values.get(CONF_STOP_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_cover_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_cover_schema is None:
+            add_cover_schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=default_values[CONF_NAME]): _TEXT_SELECTOR,
+                    vol.Required(CONF_POS_JOIN, default=default_values[CONF_POS_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_TYPE, default=default_values[CONF_TYPE]): _COVER_TYPE_SELECTOR,
+                    vol.Optional(CONF_IS_OPENING_JOIN, default=default_values[CONF_IS_OPENING_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_IS_CLOSING_JOIN, default=default_values[CONF_IS_CLOSING_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_IS_CLOSED_JOIN, default=default_values[CONF_IS_CLOSED_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_STOP_JOIN, default=default_values[CONF_STOP_JOIN]): _TEXT_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_cover_schema
 
         return self.flow.async_show_form(
             step_id="add_cover",
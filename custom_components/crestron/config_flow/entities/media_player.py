@@ -1,6 +1,7 @@
 """Media player entity configuration handler for Crestron XSIG integration."""
 
 import logging
+import re
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_DEVICE_CLASS, CONF_NAME
@@ -21,12 +22,72 @@ from ...const import (
     CONF_STOP_JOIN,
     CONF_VOLUME_JOIN,
 )
+from ..validators import ANALOG_JOIN_RE, DIGITAL_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 if TYPE_CHECKING:
     from ..base import BaseOptionsFlow
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# One source per line as "number: name"; any other non-blank line matches "bad"
+_SOURCE_LINE_RE: re.Pattern[str] = re.compile(
+    r"^[^\S\n]*(?P<num>\d+)[^\S\n]*:(?P<name>.*)$|^(?P<bad>.*\S.*)$", re.MULTILINE
+)
+
+# Optional joins and their required format, in stored entry order
+_OPTIONAL_JOINS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    (CONF_POWER_ON_JOIN, DIGITAL_JOIN_RE),
+    (CONF_MUTE_JOIN, DIGITAL_JOIN_RE),
+    (CONF_VOLUME_JOIN, ANALOG_JOIN_RE),
+    (CONF_PLAY_JOIN, DIGITAL_JOIN_RE),
+    (CONF_PAUSE_JOIN, DIGITAL_JOIN_RE),
+    (CONF_STOP_JOIN, DIGITAL_JOIN_RE),
+    (CONF_NEXT_JOIN, DIGITAL_JOIN_RE),
+    (CONF_PREVIOUS_JOIN, DIGITAL_JOIN_RE),
+)
+
+# Media player form fields, in display order
+_MEDIA_PLAYER_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    CONF_DEVICE_CLASS,
+    CONF_SOURCE_NUM_JOIN,
+    CONF_SOURCES,
+    CONF_POWER_ON_JOIN,
+    CONF_MUTE_JOIN,
+    CONF_VOLUME_JOIN,
+    CONF_PLAY_JOIN,
+    CONF_PAUSE_JOIN,
+    CONF_STOP_JOIN,
+    CONF_NEXT_JOIN,
+    CONF_PREVIOUS_JOIN,
+)
+# Form defaults when adding; also the fallback for fields missing from an edited entry
+_MEDIA_PLAYER_DEFAULTS_EMPTY: dict[str, str] = {**dict.fromkeys(_MEDIA_PLAYER_FIELDS, ""), CONF_DEVICE_CLASS: "speaker"}
+
+# Help text shown with the sources field
+_SOURCES_HELP_PLACEHOLDERS: dict[str, str] = {
+    "sources_help": "Enter one source per line in format: number: name\nExample:\n1: HDMI 1\n2: HDMI 2\n3: Chromecast"
+}
+
+# Selectors are stateless, so the form shares module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_MULTILINE_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT, multiline=True)
+)
+_MP_DEVICE_CLASS_SELECTOR: selector.SelectSelector = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"label": "TV", "value": "tv"},
+            {"label": "Speaker", "value": "speaker"},
+            {"label": "Receiver", "value": "receiver"},
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
 
 class MediaPlayerEntityHandler:
     """Handler for media player entity configuration."""
@@ -38,6 +99,58 @@ class MediaPlayerEntityHandler:
             flow: The options flow instance
         """
         self.flow: BaseOptionsFlow = flow
+        self._schema_cache: dict[tuple, vol.Schema] = {}
+        # Last parsed sources text and its (sources, error) result
+        self._last_sources_text: str | None = None
+        self._last_sources_result: tuple[dict[int, str], str | None] = ({}, None)
+        # Last serialized sources dict (by identity) and its form text
+        self._sources_text_cache: tuple[dict[int, str] | None, str] = (None, "")
+
+    def _format_sources(self, sources_dict: dict[int, str]) -> str:
+        """Return sources as "number: name" lines, reusing the text for the same dict.
+
+        Args:
+            sources_dict: Stored sources keyed by source number
+
+        Returns:
+            Sources text for the form, sorted by source number
+        """
+        cached_dict, cached_text = self._sources_text_cache
+        if cached_dict is sources_dict:
+            return cached_text
+        sources_text: str = "\n".join(f"{num}: {name}" for num, name in sorted(sources_dict.items()))
+        self._sources_text_cache = (sources_dict, sources_text)
+        return sources_text
+
+    def _parse_sources(self, sources_text: str) -> tuple[dict[int, str], str | None]:
+        """Parse "number: name" source lines, reusing the result for unchanged text.
+
+        Args:
+            sources_text: Sources as entered in the form, one per line
+
+        Returns:
+            Tuple of the sources parsed before any error, and the error key if a line was invalid
+        """
+        if sources_text == self._last_sources_text:
+            return self._last_sources_result
+
+        sources_dict: dict[int, str] = {}
+        error: str | None = None
+        line_match: re.Match[str]
+        for line_match in _SOURCE_LINE_RE.finditer(sources_text):
+            num_str: str | None = line_match.group("num")
+            if num_str is None:
+                error = "invalid_source_format"
+                break
+            source_num: int = int(num_str)
+            if source_num < 1 or source_num > 99:
+                error = "source_number_out_of_range"
+                break
+            sources_dict[source_num] = line_match.group("name").strip()
+
+        self._last_sources_text = sources_text
+        self._last_sources_result = (sources_dict, error)
+        return self._last_sources_result
 
     async def async_step_add_media_player(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a media player entity.
@@ -52,241 +165,104 @@ class MediaPlayerEntityHandler:
         is_editing: bool = self.flow._editing_join is not None
 
         if user_input is not None:
-            try:
-                name: str | None = user_input.get(CONF_NAME)
-                device_class: str = user_input.get(CONF_DEVICE_CLASS, "speaker")
-                source_num_join: str | None = user_input.get(CONF_SOURCE_NUM_JOIN)
-                sources_text: str = user_input.get(CONF_SOURCES, "")
-
-                # Optional joins
-                power_on_join: str = user_input.get(CONF_POWER_ON_JOIN, "")
-                mute_join: str = user_input.get(CONF_MUTE_JOIN, "")
-                volume_join: str = user_input.get(CONF_VOLUME_JOIN, "")
-                play_join: str = user_input.get(CONF_PLAY_JOIN, "")
-                pause_join: str = user_input.get(CONF_PAUSE_JOIN, "")
-                stop_join: str = user_input.get(CONF_STOP_JOIN, "")
-                next_join: str = user_input.get(CONF_NEXT_JOIN, "")
-                previous_join: str = user_input.get(CONF_PREVIOUS_JOIN, "")
-
-                # Validate source_num_join (required, analog)
-                if not source_num_join or not (source_num_join[0] == "a" and source_num_join[1:].isdigit()):
-                    errors[CONF_SOURCE_NUM_JOIN] = "invalid_join_format"
-
-                # Parse and validate sources (required, min 1 source)
-                sources_dict: dict[int, str] = {}
-                if sources_text.strip():
-                    for line in sources_text.strip().split("\n"):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        if ":" not in line:
-                            errors[CONF_SOURCES] = "invalid_source_format"
-                            break
-                        try:
-                            num_str: str
-                            name_str: str
-                            num_str, name_str = line.split(":", 1)
-                            source_num: int = int(num_str.strip())
-                            source_name: str = name_str.strip()
-                            if source_num < 1 or source_num > 99:
-                                errors[CONF_SOURCES] = "source_number_out_of_range"
-                                break
-                            sources_dict[source_num] = source_name
-                        except (ValueError, AttributeError):
-                            errors[CONF_SOURCES] = "invalid_source_format"
-                            break
-
-                if not sources_dict:
-                    errors[CONF_SOURCES] = "no_sources_configured"
-
-                # Validate optional joins
-                optional_joins: list[tuple[str, str, str]] = [
-                    (CONF_POWER_ON_JOIN, power_on_join, "d"),
-                    (CONF_MUTE_JOIN, mute_join, "d"),
-                    (CONF_VOLUME_JOIN, volume_join, "a"),
-                    (CONF_PLAY_JOIN, play_join, "d"),
-                    (CONF_PAUSE_JOIN, pause_join, "d"),
-                    (CONF_STOP_JOIN, stop_join, "d"),
-                    (CONF_NEXT_JOIN, next_join, "d"),
-                    (CONF_PREVIOUS_JOIN, previous_join, "d"),
-                ]
-
-                join_field: str
-                join_value: str
-                join_type: str
-                for join_field, join_value, join_type in optional_joins:
-                    if join_value and not (join_value[0] == join_type and join_value[1:].isdigit()):
-                        errors[join_field] = "invalid_join_format"
-
-                # Check for duplicate entity name
-                current_media_players: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(mp.get(CONF_NAME) == name for mp in current_media_players):
-                    errors[CONF_NAME] = "entity_already_exists"
-
-                if not errors:
-                    # Build new media player entry
-                    new_media_player: dict[str, Any] = {
-                        CONF_NAME: name,
-                        CONF_DEVICE_CLASS: device_class,
-                        CONF_SOURCE_NUM_JOIN: source_num_join,
-                        CONF_SOURCES: sources_dict,
-                    }
-
-                    # Add optional joins if provided
-                    if power_on_join:
-                        new_media_player[CONF_POWER_ON_JOIN] = power_on_join
-                    if mute_join:
-                        new_media_player[CONF_MUTE_JOIN] = mute_join
-                    if volume_join:
-                        new_media_player[CONF_VOLUME_JOIN] = volume_join
-                    if play_join:
-                        new_media_player[CONF_PLAY_JOIN] = play_join
-                    if pause_join:
-                        new_media_player[CONF_PAUSE_JOIN] = pause_join
-                    if stop_join:
-                        new_media_player[CONF_STOP_JOIN] = stop_join
-                    if next_join:
-                        new_media_player[CONF_NEXT_JOIN] = next_join
-                    if previous_join:
-                        new_media_player[CONF_PREVIOUS_JOIN] = previous_join
-
-                    updated_media_players: list[dict[str, Any]]
-                    if is_editing:
-                        # Replace existing media player
-                        updated_media_players = [
-                            new_media_player if mp.get(CONF_NAME) == old_name else mp for mp in current_media_players
-                        ]
-                        _LOGGER.info("Updated media player %s", name)
-                    else:
-                        # Append new media player
-                        updated_media_players = current_media_players + [new_media_player]
-                        _LOGGER.info("Added media player %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_MEDIA_PLAYERS] = updated_media_players
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
-
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.exception("Error adding/updating media player: %s", err)
-                errors["base"] = "unknown"
+            name: str | None = user_input.get(CONF_NAME)
+            device_class: str = user_input.get(CONF_DEVICE_CLASS, "speaker")
+            source_num_join: str | None = user_input.get(CONF_SOURCE_NUM_JOIN)
+            sources_text: str = user_input.get(CONF_SOURCES, "")
+
+            # Validate source_num_join (required, analog)
+            if not source_num_join or not ANALOG_JOIN_RE.fullmatch(source_num_join):
+                errors[CONF_SOURCE_NUM_JOIN] = "invalid_join_format"
+
+            # Parse and validate sources (required, min 1 source)
+            sources_dict: dict[int, str]
+            sources_error: str | None
+            sources_dict, sources_error = self._parse_sources(sources_text)
+            if sources_error is not None:
+                errors[CONF_SOURCES] = sources_error
+
+            if not sources_dict:
+                errors[CONF_SOURCES] = "no_sources_configured"
+
+            # Validate optional joins, keeping the ones provided
+            optional_joins: dict[str, str] = {}
+            join_field: str
+            join_pattern: re.Pattern[str]
+            for join_field, join_pattern in _OPTIONAL_JOINS:
+                join_value: str = user_input.get(join_field, "")
+                if not join_value:
+                    continue
+                if join_pattern.fullmatch(join_value):
+                    optional_joins[join_field] = join_value
+                else:
+                    errors[join_field] = "invalid_join_format"
+
+            # Check for duplicate entity name
+            old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
+            name_index: dict[str | None, int] = get_name_index(self.flow, CONF_MEDIA_PLAYERS)
+            if name != old_name and name in name_index:
+                errors[CONF_NAME] = "entity_already_exists"
+
+            if not errors:
+                # The parsed sources are stored below, so drop the cached parse
+                self._last_sources_text = None
+                self._last_sources_result = ({}, None)
+
+                # Build new media player entry
+                new_media_player: dict[str, Any] = {
+                    CONF_NAME: name,
+                    CONF_DEVICE_CLASS: device_class,
+                    CONF_SOURCE_NUM_JOIN: source_num_join,
+                    CONF_SOURCES: sources_dict,
+                    **optional_joins,
+                }
+
+                try:
+                    return await async_upsert_entity(
+                        self.flow, CONF_MEDIA_PLAYERS, new_media_player, name_index.get(old_name), "media player"
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error adding/updating media player: %s", err)
+                    errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, Any] = {}
+        default_values: dict[str, str] = _MEDIA_PLAYER_DEFAULTS_EMPTY
         if is_editing:
-            # Convert sources dict to text format
-            sources_dict_edit: dict[int, str] = self.flow._editing_join.get(CONF_SOURCES, {})
-            sources_text_edit: str = "\n".join(f"{num}: {name}" for num, name in sorted(sources_dict_edit.items()))
-
             default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_DEVICE_CLASS: self.flow._editing_join.get(CONF_DEVICE_CLASS, "speaker"),
-                CONF_SOURCE_NUM_JOIN: self.flow._editing_join.get(CONF_SOURCE_NUM_JOIN, ""),
-                CONF_SOURCES: sources_text_edit,
-                CONF_POWER_ON_JOIN: self.flow._editing_join.get(CONF_POWER_ON_JOIN, ""),
-                CONF_MUTE_JOIN: self.flow._editing_join.get(CONF_MUTE_JOIN, ""),
-                CONF_VOLUME_JOIN: self.flow._editing_join.get(CONF_VOLUME_JOIN, ""),
-                CONF_PLAY_JOIN: self.flow._editing_join.get(CONF_PLAY_JOIN, ""),
-                CONF_PAUSE_JOIN: self.flow._editing_join.get(CONF_PAUSE_JOIN, ""),
-                CONF_STOP_JOIN: self.flow._editing_join.get(CONF_STOP_JOIN, ""),
-                CONF_NEXT_JOIN: self.flow._editing_join.get(CONF_NEXT_JOIN, ""),
-                CONF_PREVIOUS_JOIN: self.flow._editing_join.get(CONF_PREVIOUS_JOIN, ""),
+                field: self.flow._editing_join.get(field, _MEDIA_PLAYER_DEFAULTS_EMPTY[field])
+                for field in _MEDIA_PLAYER_FIELDS
             }
-
-        # Show form
-        add_media_player_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    CONF_DEVICE_CLASS, default=default_values.get(CONF_DEVICE_CLASS, "speaker")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "TV", "value": "tv"},
-                            {"label": "Speaker", "value": "speaker"},
-                            {"label": "Receiver", "value": "receiver"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(
-                    CONF_SOURCE_NUM_JOIN, default=default_values.get(CONF_SOURCE_NUM_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_SOURCES, default=default_values.get(CONF_SOURCES, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                        multiline=True,
-                    )
-                ),
-                vol.Optional(
-                    CONF_POWER_ON_JOIN, default=default_values.get(CONF_POWER_ON_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_MUTE_JOIN, default=default_values.get(CONF_MUTE_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_VOLUME_JOIN, default=default_values.get(CONF_VOLUME_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_PLAY_JOIN, default=default_values.get(CONF_PLAY_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_PAUSE_JOIN, default=default_values.get(CONF_PAUSE_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_STOP_JOIN, default=default_values.get(CONF_STOP_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(CONF_NEXT_JOIN, default=default_values.get(CONF_NEXT_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    CONF_PREVIOUS_JOIN, default=default_values.get(CONF_PREVIOUS_JOIN, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-            }
-        )
+            # Convert sources dict to text format
+            sources_dict_edit: dict[int, str] = self.flow._editing_join.get(CONF_SOURCES, {})
+            default_values[CONF_SOURCES] = self._format_sources(sources_dict_edit)
+
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_media_player_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_media_player_schema is None:
+            add_media_player_schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=default_values[CONF_NAME]): _TEXT_SELECTOR,
+                    vol.Optional(
+                        CONF_DEVICE_CLASS, default=default_values[CONF_DEVICE_CLASS]
+                    ): _MP_DEVICE_CLASS_SELECTOR,
+                    vol.Required(CONF_SOURCE_NUM_JOIN, default=default_values[CONF_SOURCE_NUM_JOIN]): _TEXT_SELECTOR,
+                    vol.Required(CONF_SOURCES, default=default_values[CONF_SOURCES]): _MULTILINE_TEXT_SELECTOR,
+                    vol.Optional(CONF_POWER_ON_JOIN, default=default_values[CONF_POWER_ON_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_MUTE_JOIN, default=default_values[CONF_MUTE_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_VOLUME_JOIN, default=default_values[CONF_VOLUME_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_PLAY_JOIN, default=default_values[CONF_PLAY_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_PAUSE_JOIN, default=default_values[CONF_PAUSE_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_STOP_JOIN, default=default_values[CONF_STOP_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_NEXT_JOIN, default=default_values[CONF_NEXT_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(CONF_PREVIOUS_JOIN, default=default_values[CONF_PREVIOUS_JOIN]): _TEXT_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_media_player_schema
 
         return self.flow.async_show_form(
             step_id="add_media_player",
             data_schema=add_media_player_schema,
             errors=errors,
-            description_placeholders={
-                "sources_help": "Enter one source per line in format: number: name\nExample:\n1: HDMI 1\n2: HDMI 2\n3: Chromecast"
-            },
+            description_placeholders=_SOURCES_HELP_PLACEHOLDERS,
         )
@@ -9,18 +9,62 @@ from homeassistant.helpers import selector
 import voluptuous as vol
 
 from ...const import CONF_DIVISOR, CONF_SENSORS, CONF_VALUE_JOIN
+from ..validators import ANALOG_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor form fields, in display order
+_SENSOR_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    CONF_VALUE_JOIN,
+    CONF_DEVICE_CLASS,
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_DIVISOR,
+)
+# Form defaults when adding; also the fallback for fields missing from an edited entry
+_SENSOR_DEFAULTS_EMPTY: dict[str, Any] = {
+    **dict.fromkeys(_SENSOR_FIELDS, ""),
+    CONF_DEVICE_CLASS: "temperature",
+    CONF_DIVISOR: 1,
+}
+
+# Selectors are stateless, so the form shares module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_SENSOR_DEVICE_CLASS_SELECTOR: selector.SelectSelector = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"label": "Temperature", "value": "temperature"},
+            {"label": "Humidity", "value": "humidity"},
+            {"label": "Pressure", "value": "pressure"},
+            {"label": "Power", "value": "power"},
+            {"label": "Energy", "value": "energy"},
+            {"label": "Voltage", "value": "voltage"},
+            {"label": "Current", "value": "current"},
+            {"label": "Illuminance", "value": "illuminance"},
+            {"label": "Battery", "value": "battery"},
+            {"label": "None", "value": "none"},
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_DIVISOR_SELECTOR: selector.NumberSelector = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=1000, mode=selector.NumberSelectorMode.BOX)
+)
+
 
 class SensorEntityHandler:
     """Handler for sensor entity configuration."""
 
     flow: Any  # Type is OptionsFlowHandler from config_flow.py
+    _schema_cache: dict[tuple, vol.Schema]
 
     def __init__(self, flow: Any) -> None:
         """Initialize the sensor entity handler."""
         self.flow = flow
+        self._schema_cache = {}
 
     async def async_step_add_sensor(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a sensor entity."""
@@ -36,14 +80,15 @@ class SensorEntityHandler:
                 divisor: int = user_input.get(CONF_DIVISOR, 1)
 
                 # Validate value_join format (must be analog)
-                if not value_join or not (value_join[0] == "a" and value_join[1:].isdigit()):
+                if not value_join or not ANALOG_JOIN_RE.fullmatch(value_join):
                     errors[CONF_VALUE_JOIN] = "invalid_join_format"
 
-                # Check for duplicate entity name
-                current_sensors: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SENSORS, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(s.get(CONF_NAME) == name for s in current_sensors):
-                    errors[CONF_NAME] = "entity_already_exists"
+                # Check for duplicate entity name, skipping the lookup when the join is already invalid
+                if not errors:
+                    old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
+                    name_index: dict[str | None, int] = get_name_index(self.flow, CONF_SENSORS)
+                    if name != old_name and name in name_index:
+                        errors[CONF_NAME] = "entity_already_exists"
 
                 if not errors:
                     # Build new sensor entry
@@ -55,93 +100,39 @@ class SensorEntityHandler:
                         CONF_DIVISOR: divisor,
                     }
 
-                    if is_editing:
-                        # Replace existing sensor
-                        updated_sensors: list[dict[str, Any]] = [
-                            new_sensor if s.get(CONF_NAME) == old_name else s for s in current_sensors
-                        ]
-                        _LOGGER.info("Updated sensor %s", name)
-                    else:
-                        # Append new sensor
-                        updated_sensors: list[dict[str, Any]] = current_sensors + [new_sensor]
-                        _LOGGER.info("Added sensor %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_SENSORS] = updated_sensors
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
+                    return await async_upsert_entity(
+                        self.flow, CONF_SENSORS, new_sensor, name_index.get(old_name), "sensor"
+                    )
 
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error adding/updating sensor: %s", err)
                 errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, Any] = {}
+        default_values: dict[str, Any] = _SENSOR_DEFAULTS_EMPTY
         if is_editing:
             default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_VALUE_JOIN: self.flow._editing_join.get(CONF_VALUE_JOIN, ""),
-                CONF_DEVICE_CLASS: self.flow._editing_join.get(CONF_DEVICE_CLASS, "temperature"),
-                CONF_UNIT_OF_MEASUREMENT: self.flow._editing_join.get(CONF_UNIT_OF_MEASUREMENT, ""),
-                CONF_DIVISOR: self.flow._editing_join.get(CONF_DIVISOR, 1),
+                field: self.flow._editing_join.get(field, _SENSOR_DEFAULTS_EMPTY[field]) for field in _SENSOR_FIELDS
             }
 
-        # Show form
-        add_sensor_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_VALUE_JOIN, default=default_values.get(CONF_VALUE_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(
-                    CONF_DEVICE_CLASS, default=default_values.get(CONF_DEVICE_CLASS, "temperature")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Temperature", "value": "temperature"},
-                            {"label": "Humidity", "value": "humidity"},
-                            {"label": "Pressure", "value": "pressure"},
-                            {"label": "Power", "value": "power"},
-                            {"label": "Energy", "value": "energy"},
-                            {"label": "Voltage", "value": "voltage"},
-                            {"label": "Current", "value": "current"},
-                            {"label": "Illuminance", "value": "illuminance"},
-                            {"label": "Battery", "value": "battery"},
-                            {"label": "None", "value": "none"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(
-                    CONF_UNIT_OF_MEASUREMENT, default=default_values.get(CONF_UNIT_OF_MEASUREMENT, "")
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_DIVISOR, default=default_values.get(CONF_DIVISOR, 1)): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=1000,
-                        mode=selector.NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_sensor_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_sensor_schema is None:
+            add_sensor_schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=default_values[CONF_NAME]): _TEXT_SELECTOR,
+                    vol.Required(CONF_VALUE_JOIN, default=default_values[CONF_VALUE_JOIN]): _TEXT_SELECTOR,
+                    vol.Required(
+                        CONF_DEVICE_CLASS, default=default_values[CONF_DEVICE_CLASS]
+                    ): _SENSOR_DEVICE_CLASS_SELECTOR,
+                    vol.Required(
+                        CONF_UNIT_OF_MEASUREMENT, default=default_values[CONF_UNIT_OF_MEASUREMENT]
+                    ): _TEXT_SELECTOR,
+                    vol.Required(CONF_DIVISOR, default=default_values[CONF_DIVISOR]): _DIVISOR_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_sensor_schema
 
         return self.flow.async_show_form(
             step_id="add_sensor",
@@ -9,18 +9,45 @@ from homeassistant.helpers import selector
 import voluptuous as vol
 
 from ...const import CONF_SWITCH_JOIN, CONF_SWITCHES
+from ..validators import DIGITAL_JOIN_RE
+from .base import async_upsert_entity, get_name_index
 
 _LOGGER = logging.getLogger(__name__)
 
+# Switch form fields, in display order
+_SWITCH_FIELDS: tuple[str, ...] = (
+    CONF_NAME,
+    CONF_SWITCH_JOIN,
+    CONF_DEVICE_CLASS,
+)
+# Form defaults when adding; also the fallback for fields missing from an edited entry
+_SWITCH_DEFAULTS_EMPTY: dict[str, str] = {**dict.fromkeys(_SWITCH_FIELDS, ""), CONF_DEVICE_CLASS: "switch"}
+
+# Selectors are stateless, so the form shares module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_SWITCH_DEVICE_CLASS_SELECTOR: selector.SelectSelector = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"label": "Switch", "value": "switch"},
+            {"label": "Outlet", "value": "outlet"},
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
 
 class SwitchEntityHandler:
     """Handler for switch entity configuration."""
 
     flow: Any  # Type is OptionsFlowHandler from config_flow.py
+    _schema_cache: dict[tuple, vol.Schema]
 
     def __init__(self, flow: Any) -> None:
         """Initialize the switch entity handler."""
         self.flow = flow
+        self._schema_cache = {}
 
     async def async_step_add_switch(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a switch entity."""
@@ -34,14 +61,15 @@ class SwitchEntityHandler:
                 device_class: str = user_input.get(CONF_DEVICE_CLASS, "switch")
 
                 # Validate switch_join format (must be digital)
-                if not switch_join or not (switch_join[0] == "d" and switch_join[1:].isdigit()):
+                if not switch_join or not DIGITAL_JOIN_RE.fullmatch(switch_join):
                     errors[CONF_SWITCH_JOIN] = "invalid_join_format"
 
-                # Check for duplicate entity name
-                current_switches: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-                old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
-                if name != old_name and any(s.get(CONF_NAME) == name for s in current_switches):
-                    errors[CONF_NAME] = "entity_already_exists"
+                # Check for duplicate entity name, skipping the lookup when the join is already invalid
+                if not errors:
+                    old_name: str | None = self.flow._editing_join.get(CONF_NAME) if is_editing else None
+                    name_index: dict[str | None, int] = get_name_index(self.flow, CONF_SWITCHES)
+                    if name != old_name and name in name_index:
+                        errors[CONF_NAME] = "entity_already_exists"
 
                 if not errors:
                     # Build new switch entry
@@ -51,69 +79,35 @@ class SwitchEntityHandler:
                         CONF_DEVICE_CLASS: device_class,
                     }
 
-                    if is_editing:
-                        # Replace existing switch
-                        updated_switches: list[dict[str, Any]] = [
-                            new_switch if s.get(CONF_NAME) == old_name else s for s in current_switches
-                        ]
-                        _LOGGER.info("Updated switch %s", name)
-                    else:
-                        # Append new switch
-                        updated_switches: list[dict[str, Any]] = current_switches + [new_switch]
-                        _LOGGER.info("Added switch %s", name)
-
-                    # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_SWITCHES] = updated_switches
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
-
-                    # Reload the integration
-                    await self.flow._async_reload_integration()
-
-                    # Clear editing state and return to menu
-                    self.flow._editing_join = None
-                    return await self.flow.async_step_init()
+                    return await async_upsert_entity(
+                        self.flow, CONF_SWITCHES, new_switch, name_index.get(old_name), "switch"
+                    )
 
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error adding/updating switch: %s", err)
                 errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, Any] = {}
+        default_values: dict[str, str] = _SWITCH_DEFAULTS_EMPTY
         if is_editing:
             default_values = {
-                CONF_NAME: self.flow._editing_join.get(CONF_NAME, ""),
-                CONF_SWITCH_JOIN: self.flow._editing_join.get(CONF_SWITCH_JOIN, ""),
-                CONF_DEVICE_CLASS: self.flow._editing_join.get(CONF_DEVICE_CLASS, "switch"),
+                field: self.flow._editing_join.get(field, _SWITCH_DEFAULTS_EMPTY[field]) for field in _SWITCH_FIELDS
             }
 
-        # Show form
-        add_switch_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=default_values.get(CONF_NAME, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required(CONF_SWITCH_JOIN, default=default_values.get(CONF_SWITCH_JOIN, "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    CONF_DEVICE_CLASS, default=default_values.get(CONF_DEVICE_CLASS, "switch")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Switch", "value": "switch"},
-                            {"label": "Outlet", "value": "outlet"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = tuple(default_values.items())
+        add_switch_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_switch_schema is None:
+            add_switch_schema = vol.Schema(
+                {
+                    vol.Required(CONF_NAME, default=default_values[CONF_NAME]): _TEXT_SELECTOR,
+                    vol.Required(CONF_SWITCH_JOIN, default=default_values[CONF_SWITCH_JOIN]): _TEXT_SELECTOR,
+                    vol.Optional(
+                        CONF_DEVICE_CLASS, default=default_values[CONF_DEVICE_CLASS]
+                    ): _SWITCH_DEVICE_CLASS_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_switch_schema
 
         return self.flow.async_show_form(
             step_id="add_switch",
@@ -119,6 +119,7 @@ class OptionsFlowHandler(BaseOptionsFlow):
     """Handle options flow for Crestron XSIG integration."""
 
     _editing_join: int | None
+    _selected_dimmer: str | None
     _menu_handler: Any
     _join_handler: Any
     _dimmer_handler: Any
@@ -136,6 +137,7 @@ class OptionsFlowHandler(BaseOptionsFlow):
         """Initialize options flow."""
         super().__init__(config_entry)
         self._editing_join = None  # Track which join we're editing
+        self._selected_dimmer = None  # Dimmer whose LED bindings are being configured
 
         # Import handlers here to avoid circular imports
         from .dimmers import DimmerHandler
@@ -8,12 +8,29 @@ from homeassistant.helpers import selector
 import voluptuous as vol
 
 from ..const import CONF_FROM_HUB, CONF_TO_HUB
+from .entities.base import get_name_index
+from .validators import SYNC_JOIN_RE
 
 if TYPE_CHECKING:
     from .base import BaseOptionsFlow
 
 _LOGGER = logging.getLogger(__name__)
 
+# to_join form fields, in display order
+_TO_JOIN_FIELDS: tuple[str, ...] = ("join", "entity_id", "attribute", "value_template")
+# Form defaults when adding; also the fallback for fields missing from an edited join
+_TO_JOIN_DEFAULTS_EMPTY: dict[str, str] = dict.fromkeys(_TO_JOIN_FIELDS, "")
+_FROM_JOIN_DEFAULTS_EMPTY: dict[str, str] = {"join": "", "service": "", "target_entity": ""}
+
+# Selectors are stateless, so the forms share module-level instances
+_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_MULTILINE_TEXT_SELECTOR: selector.TextSelector = selector.TextSelector(
+    selector.TextSelectorConfig(multiline=True, type=selector.TextSelectorType.TEXT)
+)
+_ENTITY_SELECTOR: selector.EntitySelector = selector.EntitySelector()
+
 
 class JoinSyncHandler:
     """Handler for join sync (to_joins and from_joins) configuration."""
@@ -25,6 +42,63 @@ class JoinSyncHandler:
             flow: The options flow handler instance
         """
         self.flow: BaseOptionsFlow = flow
+        self._schema_cache: dict[tuple, vol.Schema] = {}
+
+    @staticmethod
+    def _build_join_options(data: dict[str, Any]) -> list[dict[str, str]]:
+        """Build the selection options for every to_join and from_join.
+
+        Args:
+            data: Config entry data
+
+        Returns:
+            Selection options, to_joins first
+        """
+        join_options: list[dict[str, str]] = []
+        append = join_options.append
+        for j in data.get(CONF_TO_HUB, []):
+            join_num: str | None = j.get("join")
+            entity: str = j.get("entity_id", j.get("value_template", "N/A"))
+            append({"label": f"{join_num} → {entity} (to_join)", "value": join_num})
+
+        for j in data.get(CONF_FROM_HUB, []):
+            join_num = j.get("join")
+            script_info: str = "script" if "script" in j else "N/A"
+            append({"label": f"{join_num} → {script_info} (from_join)", "value": join_num})
+        return join_options
+
+    def _get_select_schema(self, field: vol.Marker, join_options: list[dict[str, str]], multiple: bool) -> vol.Schema:
+        """Return a cached join selection schema, building it only when the options change.
+
+        Args:
+            field: Schema marker for the selection field
+            join_options: Selection options for the configured joins
+            multiple: Whether more than one join can be selected
+
+        Returns:
+            The selection schema
+        """
+        cache_key: tuple = (
+            "select",
+            field.schema,
+            multiple,
+            tuple((option["value"], option["label"]) for option in join_options),
+        )
+        schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if schema is None:
+            schema = vol.Schema(
+                {
+                    field: selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=join_options,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            multiple=multiple,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = schema
+        return schema
 
     async def async_step_add_to_join(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Add or edit a single to_join with entity picker.
@@ -37,6 +111,7 @@ class JoinSyncHandler:
         """
         errors: dict[str, str] = {}
         is_editing: bool = self.flow._editing_join is not None
+        data: dict[str, Any] = self.flow.config_entry.data
 
         if user_input is not None:
             try:
@@ -46,14 +121,16 @@ class JoinSyncHandler:
                 value_template: str = user_input.get("value_template", "").strip()
 
                 # Validate join format
-                if not join_num or not (join_num[0] in ["d", "a", "s"] and join_num[1:].isdigit()):
+                if not join_num or not SYNC_JOIN_RE.fullmatch(join_num):
                     errors["join"] = "invalid_join_format"
 
-                # Check for duplicate join (exclude current join if editing)
-                current_to_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-                old_join_num: str | None = self.flow._editing_join.get("join") if is_editing else None
-                if join_num != old_join_num and any(j.get("join") == join_num for j in current_to_joins):
-                    errors["join"] = "join_already_exists"
+                # Check for duplicate join (exclude current join if editing), only for a valid join
+                if not errors:
+                    current_to_joins: list[dict[str, Any]] = data.get(CONF_TO_HUB, [])
+                    old_join_num: str | None = self.flow._editing_join.get("join") if is_editing else None
+                    join_index: dict[str | None, int] = get_name_index(self.flow, CONF_TO_HUB, "join")
+                    if join_num != old_join_num and join_num in join_index:
+                        errors["join"] = "join_already_exists"
 
                 if not errors:
                     # Build new join entry
@@ -68,9 +145,9 @@ class JoinSyncHandler:
 
                     if is_editing:
                         # Replace existing join
-                        updated_to_joins: list[dict[str, Any]] = [
-                            new_join if j.get("join") == old_join_num else j for j in current_to_joins
-                        ]
+                        updated_to_joins: list[dict[str, Any]] = list(current_to_joins)
+                        if old_join_num in join_index:
+                            updated_to_joins[join_index[old_join_num]] = new_join
                         _LOGGER.info("Updated to_join %s for %s", join_num, entity_id)
                     else:
                         # Append new join
@@ -78,10 +155,9 @@ class JoinSyncHandler:
                         _LOGGER.info("Added to_join %s for %s", join_num, entity_id)
 
                     # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_TO_HUB] = updated_to_joins
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
+                    self.flow.hass.config_entries.async_update_entry(
+                        self.flow.config_entry, data={**data, CONF_TO_HUB: updated_to_joins}
+                    )
 
                     # Reload the integration
                     await self.flow._async_reload_integration()
@@ -95,37 +171,25 @@ class JoinSyncHandler:
                 errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, str] = {}
+        default_values: dict[str, str] = _TO_JOIN_DEFAULTS_EMPTY
         if is_editing:
             default_values = {
-                "join": self.flow._editing_join.get("join", ""),
-                "entity_id": self.flow._editing_join.get("entity_id", ""),
-                "attribute": self.flow._editing_join.get("attribute", ""),
-                "value_template": self.flow._editing_join.get("value_template", ""),
+                field: self.flow._editing_join.get(field, _TO_JOIN_DEFAULTS_EMPTY[field]) for field in _TO_JOIN_FIELDS
             }
 
-        # Show form
-        add_to_join_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required("join", default=default_values.get("join", "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional("entity_id", default=default_values.get("entity_id", "")): selector.EntitySelector(),
-                vol.Optional("attribute", default=default_values.get("attribute", "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional("value_template", default=default_values.get("value_template", "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        multiline=True,
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = ("add_to_join", tuple(default_values.items()))
+        add_to_join_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_to_join_schema is None:
+            add_to_join_schema = vol.Schema(
+                {
+                    vol.Required("join", default=default_values["join"]): _TEXT_SELECTOR,
+                    vol.Optional("entity_id", default=default_values["entity_id"]): _ENTITY_SELECTOR,
+                    vol.Optional("attribute", default=default_values["attribute"]): _TEXT_SELECTOR,
+                    vol.Optional("value_template", default=default_values["value_template"]): _MULTILINE_TEXT_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_to_join_schema
 
         return self.flow.async_show_form(
             step_id="add_to_join",
@@ -144,6 +208,7 @@ class JoinSyncHandler:
         """
         errors: dict[str, str] = {}
         is_editing: bool = self.flow._editing_join is not None
+        data: dict[str, Any] = self.flow.config_entry.data
 
         if user_input is not None:
             try:
@@ -152,14 +217,16 @@ class JoinSyncHandler:
                 target_entity: str | None = user_input.get("target_entity")
 
                 # Validate join format
-                if not join_num or not (join_num[0] in ["d", "a", "s"] and join_num[1:].isdigit()):
+                if not join_num or not SYNC_JOIN_RE.fullmatch(join_num):
                     errors["join"] = "invalid_join_format"
 
-                # Check for duplicate join (exclude current join if editing)
-                current_from_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
-                old_join_num: str | None = self.flow._editing_join.get("join") if is_editing else None
-                if join_num != old_join_num and any(j.get("join") == join_num for j in current_from_joins):
-                    errors["join"] = "join_already_exists"
+                # Check for duplicate join (exclude current join if editing), only for a valid join
+                if not errors:
+                    current_from_joins: list[dict[str, Any]] = data.get(CONF_FROM_HUB, [])
+                    old_join_num: str | None = self.flow._editing_join.get("join") if is_editing else None
+                    join_index: dict[str | None, int] = get_name_index(self.flow, CONF_FROM_HUB, "join")
+                    if join_num != old_join_num and join_num in join_index:
+                        errors["join"] = "join_already_exists"
 
                 if not errors:
                     # Build script action
@@ -174,9 +241,9 @@ class JoinSyncHandler:
 
                     if is_editing:
                         # Replace existing join
-                        updated_from_joins: list[dict[str, Any]] = [
-                            new_join if j.get("join") == old_join_num else j for j in current_from_joins
-                        ]
+                        updated_from_joins: list[dict[str, Any]] = list(current_from_joins)
+                        if old_join_num in join_index:
+                            updated_from_joins[join_index[old_join_num]] = new_join
                         _LOGGER.info("Updated from_join %s with service %s", join_num, service)
                     else:
                         # Append new join
@@ -184,10 +251,9 @@ class JoinSyncHandler:
                         _LOGGER.info("Added from_join %s with service %s", join_num, service)
 
                     # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_FROM_HUB] = updated_from_joins
-
-                    self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
+                    self.flow.hass.config_entries.async_update_entry(
+                        self.flow.config_entry, data={**data, CONF_FROM_HUB: updated_from_joins}
+                    )
 
                     # Reload the integration
                     await self.flow._async_reload_integration()
@@ -201,7 +267,7 @@ class JoinSyncHandler:
                 errors["base"] = "unknown"
 
         # Pre-fill form if editing
-        default_values: dict[str, str] = {}
+        default_values: dict[str, str] = _FROM_JOIN_DEFAULTS_EMPTY
         if is_editing:
             script_action: dict[str, Any] = (
                 self.flow._editing_join.get("script", [{}])[0] if self.flow._editing_join.get("script") else {}
@@ -212,24 +278,18 @@ class JoinSyncHandler:
                 "target_entity": script_action.get("target", {}).get("entity_id", ""),
             }
 
-        # Show form
-        add_from_join_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required("join", default=default_values.get("join", "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Required("service", default=default_values.get("service", "")): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    )
-                ),
-                vol.Optional(
-                    "target_entity", default=default_values.get("target_entity", "")
-                ): selector.EntitySelector(),
-            }
-        )
+        # Show form (schema is reused while the defaults are unchanged)
+        cache_key: tuple = ("add_from_join", tuple(default_values.items()))
+        add_from_join_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if add_from_join_schema is None:
+            add_from_join_schema = vol.Schema(
+                {
+                    vol.Required("join", default=default_values["join"]): _TEXT_SELECTOR,
+                    vol.Required("service", default=default_values["service"]): _TEXT_SELECTOR,
+                    vol.Optional("target_entity", default=default_values["target_entity"]): _ENTITY_SELECTOR,
+                }
+            )
+            self._schema_cache[cache_key] = add_from_join_schema
 
         return self.flow.async_show_form(
             step_id="add_from_join",
@@ -247,29 +307,34 @@ class JoinSyncHandler:
             FlowResult for the next step
         """
         errors: dict[str, str] = {}
+        data: dict[str, Any] = self.flow.config_entry.data
 
         if user_input is not None:
             try:
                 joins_to_remove: list[str] = user_input.get("joins_to_remove", [])
+                remove_set: frozenset[str] = frozenset(joins_to_remove)
 
                 if joins_to_remove:
-                    current_to_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-                    current_from_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
+                    current_to_joins: list[dict[str, Any]] = data.get(CONF_TO_HUB, [])
+                    current_from_joins: list[dict[str, Any]] = data.get(CONF_FROM_HUB, [])
 
                     # Filter out selected joins
                     updated_to_joins: list[dict[str, Any]] = [
-                        j for j in current_to_joins if j.get("join") not in joins_to_remove
+                        j for j in current_to_joins if j.get("join") not in remove_set
                     ]
                     updated_from_joins: list[dict[str, Any]] = [
-                        j for j in current_from_joins if j.get("join") not in joins_to_remove
+                        j for j in current_from_joins if j.get("join") not in remove_set
                     ]
 
                     # Update config entry
-                    new_data: dict[str, Any] = dict(self.flow.config_entry.data)
-                    new_data[CONF_TO_HUB] = updated_to_joins
-                    new_data[CONF_FROM_HUB] = updated_from_joins
-
+                    new_data: dict[str, Any] = {
+                        **data,
+                        CONF_TO_HUB: updated_to_joins,
+                        CONF_FROM_HUB: updated_from_joins,
+                    }
                     self.flow.hass.config_entries.async_update_entry(self.flow.config_entry, data=new_data)
+                    # Re-render from the updated data if the reload fails
+                    data = new_data
 
                     # Reload the integration
                     await self.flow._async_reload_integration()
@@ -284,34 +349,14 @@ class JoinSyncHandler:
                 errors["base"] = "unknown"
 
         # Build list of all joins for removal selection
-        current_to_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-        current_from_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
-
-        join_options: list[dict[str, str]] = []
-        for j in current_to_joins:
-            entity: str = j.get("entity_id", j.get("value_template", "N/A"))
-            join_options.append({"label": f"{j.get('join')} → {entity} (to_join)", "value": j.get("join")})
-
-        for j in current_from_joins:
-            script_info: str = "script" if "script" in j else "N/A"
-            join_options.append({"label": f"{j.get('join')} → {script_info} (from_join)", "value": j.get("join")})
+        join_options: list[dict[str, str]] = self._build_join_options(data)
 
         if not join_options:
             # No joins to remove, return to menu
             return await self.flow.async_step_init()
 
         # Show removal form
-        remove_schema: vol.Schema = vol.Schema(
-            {
-                vol.Optional("joins_to_remove"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=join_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                        multiple=True,
-                    )
-                ),
-            }
-        )
+        remove_schema: vol.Schema = self._get_select_schema(vol.Optional("joins_to_remove"), join_options, True)
 
         return self.flow.async_show_form(
             step_id="remove_joins",
@@ -328,56 +373,35 @@ class JoinSyncHandler:
         Returns:
             FlowResult for the next step
         """
+        data: dict[str, Any] = self.flow.config_entry.data
+
         if user_input is not None:
             selected_join: str | None = user_input.get("join_to_edit")
 
             if selected_join:
-                # Find the join in our data
-                current_to_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-                current_from_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
-
                 # Check if it's a to_join or from_join
-                for join in current_to_joins:
-                    if join.get("join") == selected_join:
-                        self.flow._editing_join = join
-                        return await self.async_step_add_to_join()
+                join_pos: int | None = get_name_index(self.flow, CONF_TO_HUB, "join").get(selected_join)
+                if join_pos is not None:
+                    self.flow._editing_join = data[CONF_TO_HUB][join_pos]
+                    return await self.async_step_add_to_join()
 
-                for join in current_from_joins:
-                    if join.get("join") == selected_join:
-                        self.flow._editing_join = join
-                        return await self.async_step_add_from_join()
+                join_pos = get_name_index(self.flow, CONF_FROM_HUB, "join").get(selected_join)
+                if join_pos is not None:
+                    self.flow._editing_join = data[CONF_FROM_HUB][join_pos]
+                    return await self.async_step_add_from_join()
 
             # If no join selected, return to menu
             return await self.flow.async_step_init()
 
         # Build list of all joins for editing
-        current_to_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-        current_from_joins: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
-
-        join_options: list[dict[str, str]] = []
-        for j in current_to_joins:
-            entity: str = j.get("entity_id", j.get("value_template", "N/A"))
-            join_options.append({"label": f"{j.get('join')} → {entity} (to_join)", "value": j.get("join")})
-
-        for j in current_from_joins:
-            script_info: str = "script" if "script" in j else "N/A"
-            join_options.append({"label": f"{j.get('join')} → {script_info} (from_join)", "value": j.get("join")})
+        join_options: list[dict[str, str]] = self._build_join_options(data)
 
         if not join_options:
             # No joins to edit, return to menu
             return await self.flow.async_step_init()
 
         # Show selection form
-        select_schema: vol.Schema = vol.Schema(
-            {
-                vol.Required("join_to_edit"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=join_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-            }
-        )
+        select_schema: vol.Schema = self._get_select_schema(vol.Required("join_to_edit"), join_options, False)
 
         return self.flow.async_show_form(
             step_id="select_join_to_edit",
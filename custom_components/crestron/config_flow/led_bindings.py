@@ -9,13 +9,21 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 import voluptuous as vol
 
-from ..const import BINDABLE_DOMAINS, CONF_DIMMERS, CONF_LED_BINDINGS, DOMAIN
+from ..const import BINDABLE_DOMAIN_LIST, CONF_DIMMERS, CONF_LED_BINDINGS, DOMAIN
+from .entities.base import get_name_index
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors are stateless, so every button row shares module-level instances
+# (the selector config needs a list; a tuple would be wrapped as one domain)
+_BINDABLE_ENTITY_SELECTOR: selector.EntitySelector = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=list(BINDABLE_DOMAIN_LIST))
+)
+_INVERT_SELECTOR: selector.BooleanSelector = selector.BooleanSelector()
+
 
 class LEDBindingHandler:
     """Handler for LED binding configuration."""
@@ -33,6 +41,11 @@ class LEDBindingHandler:
         if not dimmers:
             return self.flow.async_abort(reason="no_dimmers_configured")
 
+        # Nothing to choose with a single dimmer, so go straight to its LEDs
+        if len(dimmers) == 1 and user_input is None:
+            self.flow._selected_dimmer = dimmers[0].get("name")
+            return await self.async_step_configure_dimmer_leds()
+
         if user_input is not None:
             dimmer_name: str | None = user_input.get("dimmer_to_configure")
 
@@ -63,68 +76,66 @@ class LEDBindingHandler:
 
     async def async_step_configure_dimmer_leds(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Configure LED bindings for selected dimmer."""
-        dimmer_name: str = self.flow._selected_dimmer
+        dimmer_name: str | None = self.flow._selected_dimmer
+        if not dimmer_name:
+            return self.flow.async_abort(reason="dimmer_not_found")
 
-        # Find dimmer config
+        # Find dimmer config through the flow's cached name index
         dimmers: list[dict[str, Any]] = self.flow.config_entry.data.get(CONF_DIMMERS, [])
-        dimmer: dict[str, Any] | None = next((d for d in dimmers if d.get("name") == dimmer_name), None)
+        dimmer_pos: int | None = get_name_index(self.flow, CONF_DIMMERS).get(dimmer_name)
+        dimmer: dict[str, Any] | None = dimmers[dimmer_pos] if dimmer_pos is not None else None
 
         if not dimmer:
             return self.flow.async_abort(reason="dimmer_not_found")
 
         button_count: int = dimmer.get("button_count", 2)
 
-        if user_input is not None:
-            # Save bindings
-            bindings: dict[str, dict[str, Any] | None] = {}
-
-            for btn_num in range(1, button_count + 1):
-                entity_id: str | None = user_input.get(f"button_{btn_num}_entity")
-                invert: bool = user_input.get(f"button_{btn_num}_invert", False)
+        # Fresh entry serves both the save and the form (data, not options)
+        fresh_entry: ConfigEntry | None = self.flow.hass.config_entries.async_get_entry(self.flow.config_entry.entry_id)
 
-                if entity_id:
-                    bindings[str(btn_num)] = {
-                        "entity_id": entity_id,
-                        "invert": invert,
-                    }
-                else:
-                    bindings[str(btn_num)] = None
+        if user_input is not None:
+            # Save bindings (None for buttons left unbound)
+            get = user_input.get
+            bindings: dict[str, dict[str, Any] | None] = {
+                str(btn_num): (
+                    {"entity_id": entity_id, "invert": get(f"button_{btn_num}_invert", False)}
+                    if (entity_id := get(f"button_{btn_num}_entity"))
+                    else None
+                )
+                for btn_num in range(1, button_count + 1)
+            }
 
             # Save to config entry data (consistent with other entity handlers)
-            # Get fresh entry to ensure we're updating the latest version
-            fresh_entry: ConfigEntry | None = self.flow.hass.config_entries.async_get_entry(
-                self.flow.config_entry.entry_id
-            )
             if not fresh_entry:
                 _LOGGER.error("Config entry not found, cannot save LED bindings")
                 return self.flow.async_abort(reason="entry_not_found")
 
-            new_data: dict[str, Any] = dict(fresh_entry.data)
-            led_bindings: dict[str, dict[str, dict[str, Any] | None]] = new_data.get(CONF_LED_BINDINGS, {})
-            led_bindings[dimmer_name] = bindings
-            new_data[CONF_LED_BINDINGS] = led_bindings
-
-            self.flow.hass.config_entries.async_update_entry(fresh_entry, data=new_data)
+            led_bindings: dict[str, dict[str, dict[str, Any] | None]] = {
+                **fresh_entry.data.get(CONF_LED_BINDINGS, {}),
+                dimmer_name: bindings,
+            }
+            self.flow.hass.config_entries.async_update_entry(
+                fresh_entry, data={**fresh_entry.data, CONF_LED_BINDINGS: led_bindings}
+            )
 
             _LOGGER.info(
                 "Updated LED bindings for dimmer '%s': %d buttons configured",
                 dimmer_name,
-                sum(1 for b in bindings.values() if b is not None),
+                sum(b is not None for b in bindings.values()),
             )
 
             # Reload LED binding manager
             await self._reload_led_binding_manager()
 
             # Clear temp state
-            del self.flow._selected_dimmer
+            self.flow._selected_dimmer = None
 
-            return self.flow.async_create_entry(title="", data={})
+            return await self.flow._async_finish()
 
         # Build dynamic form
         schema_fields: dict[vol.Marker, Any] = {}
 
-        # Get existing bindings from fresh entry data (not options)
-        fresh_entry: ConfigEntry | None = self.flow.hass.config_entries.async_get_entry(self.flow.config_entry.entry_id)
+        # Get existing bindings from fresh entry data
         existing_bindings: dict[str, dict[str, Any] | None] = {}
         if fresh_entry:
             existing_bindings = fresh_entry.data.get(CONF_LED_BINDINGS, {}).get(dimmer_name, {})
@@ -138,17 +149,15 @@ class LEDBindingHandler:
             existing_entity: str | None = existing.get("entity_id") if existing else None
             if existing_entity:
                 schema_fields[vol.Optional(f"button_{btn_num}_entity", default=existing_entity)] = (
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain=list(BINDABLE_DOMAINS.keys())))
+                    _BINDABLE_ENTITY_SELECTOR
                 )
             else:
                 # No default - field starts blank and can be left blank
-                schema_fields[vol.Optional(f"button_{btn_num}_entity")] = selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(BINDABLE_DOMAINS.keys()))
-                )
+                schema_fields[vol.Optional(f"button_{btn_num}_entity")] = _BINDABLE_ENTITY_SELECTOR
 
             # Invert checkbox
             schema_fields[vol.Optional(f"button_{btn_num}_invert", default=existing.get("invert", False))] = (
-                selector.BooleanSelector()
+                _INVERT_SELECTOR
             )
 
         schema: vol.Schema = vol.Schema(schema_fields)
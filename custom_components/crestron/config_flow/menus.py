@@ -27,6 +27,56 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Config entry keys holding entity lists, counted for the menu labels
+_ENTITY_KEYS: tuple[str, ...] = (
+    CONF_COVERS,
+    CONF_BINARY_SENSORS,
+    CONF_SENSORS,
+    CONF_LIGHTS,
+    CONF_SWITCHES,
+    CONF_CLIMATES,
+    CONF_MEDIA_PLAYERS,
+)
+
+# Menu action -> options flow step it opens
+_INIT_ACTIONS: dict[str, str] = {
+    "entity_menu": "async_step_entity_menu",
+    "join_menu": "async_step_join_menu",
+    "dimmer_menu": "async_step_dimmer_menu",
+}
+_ENTITY_MENU_ACTIONS: dict[str, str] = {
+    "add_entity": "async_step_select_entity_type",
+    "edit_entities": "async_step_select_entity_to_edit",
+    "remove_entities": "async_step_remove_entities",
+    "back": "async_step_init",
+}
+_ENTITY_TYPE_STEPS: dict[str, str] = {
+    "light": "async_step_add_light",
+    "switch": "async_step_add_switch",
+    "cover": "async_step_add_cover",
+    "binary_sensor": "async_step_add_binary_sensor",
+    "sensor": "async_step_add_sensor",
+    "climate": "async_step_select_climate_type",
+    "media_player": "async_step_add_media_player",
+    "back": "async_step_entity_menu",
+}
+_JOIN_MENU_ACTIONS: dict[str, str] = {
+    "add_to_join": "async_step_add_to_join",
+    "add_from_join": "async_step_add_from_join",
+    "edit_joins": "async_step_select_join_to_edit",
+    "remove_joins": "async_step_remove_joins",
+    "back": "async_step_init",
+}
+_DIMMER_MENU_ACTIONS: dict[str, str] = {
+    "add_dimmer": "async_step_add_dimmer_mode",
+    "edit_dimmers": "async_step_select_dimmer_to_edit",
+    "remove_dimmers": "async_step_remove_dimmers",
+    "led_bindings": "async_step_led_binding_menu",
+    "back": "async_step_init",
+}
+# Actions that start adding a new item, so any edit in progress is dropped
+_ADD_ACTIONS: frozenset[str] = frozenset({"add_to_join", "add_from_join", "add_dimmer"})
+
 
 class MenuHandler:
     """Handles menu navigation for options flow."""
@@ -38,65 +88,66 @@ class MenuHandler:
             options_flow: The OptionsFlowHandler instance
         """
         self.flow: OptionsFlowHandler = options_flow
+        self._schema_cache: dict[tuple, vol.Schema] = {}
+
+    def _entity_counts(self) -> tuple[dict[str, int], int]:
+        """Count the configured entities per type.
+
+        Returns:
+            Tuple of entity list key -> count, and the total across all types
+        """
+        data: dict[str, Any] = self.flow.config_entry.data
+        counts: dict[str, int] = {key: len(data.get(key, ())) for key in _ENTITY_KEYS}
+        return counts, sum(counts.values())
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Main menu - choose between entity, join sync, or dimmer/keypad management."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            next_step = user_input.get("action")
-            if next_step == "entity_menu":
-                return await self.flow.async_step_entity_menu()
-            if next_step == "join_menu":
-                return await self.flow.async_step_join_menu()
-            if next_step == "dimmer_menu":
-                return await self.flow.async_step_dimmer_menu()
-            # Done
-            return self.flow.async_create_entry(title="", data={})
+            step_name: str | None = _INIT_ACTIONS.get(user_input.get("action"))
+            if step_name is not None:
+                return await getattr(self.flow, step_name)()
+            # Done: apply this session's changes with one reload
+            try:
+                return await self.flow._async_finish()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error reloading integration: %s", err)
+                errors["base"] = "unknown"
 
         # Get current counts for display
-        current_covers = self.flow.config_entry.data.get(CONF_COVERS, [])
-        current_binary_sensors = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-        current_sensors = self.flow.config_entry.data.get(CONF_SENSORS, [])
-        current_lights = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-        current_switches = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-        current_climates = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-        current_media_players = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-        total_entities = (
-            len(current_covers)
-            + len(current_binary_sensors)
-            + len(current_sensors)
-            + len(current_lights)
-            + len(current_switches)
-            + len(current_climates)
-            + len(current_media_players)
-        )
-
-        current_to_joins = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-        current_from_joins = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
-        total_joins = len(current_to_joins) + len(current_from_joins)
-
-        current_dimmers = self.flow.config_entry.data.get(CONF_DIMMERS, [])
-        total_dimmers = len(current_dimmers)
-
-        # Show main menu
-        menu_schema = vol.Schema(
-            {
-                vol.Required("action"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": f"Manage Entities ({total_entities} configured)", "value": "entity_menu"},
-                            {"label": f"Manage Join Syncs ({total_joins} configured)", "value": "join_menu"},
-                            {"label": f"Manage Dimmers/Keypads ({total_dimmers} configured)", "value": "dimmer_menu"},
-                            {"label": "Done", "value": "done"},
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
+        data = self.flow.config_entry.data
+        _counts, total_entities = self._entity_counts()
+        total_joins = len(data.get(CONF_TO_HUB, [])) + len(data.get(CONF_FROM_HUB, []))
+        total_dimmers = len(data.get(CONF_DIMMERS, []))
+
+        # Show main menu (schema is reused while the counts are unchanged)
+        cache_key: tuple = ("init", total_entities, total_joins, total_dimmers)
+        menu_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if menu_schema is None:
+            menu_schema = vol.Schema(
+                {
+                    vol.Required("action"): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                {"label": f"Manage Entities ({total_entities} configured)", "value": "entity_menu"},
+                                {"label": f"Manage Join Syncs ({total_joins} configured)", "value": "join_menu"},
+                                {
+                                    "label": f"Manage Dimmers/Keypads ({total_dimmers} configured)",
+                                    "value": "dimmer_menu",
+                                },
+                                {"label": "Done", "value": "done"},
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = menu_schema
 
         return self.flow.async_show_form(
             step_id="init",
             data_schema=menu_schema,
+            errors=errors,
             description_placeholders={
                 "entities": str(total_entities),
                 "joins": str(total_joins),
@@ -107,50 +158,33 @@ class MenuHandler:
     async def async_step_entity_menu(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Entity management submenu."""
         if user_input is not None:
-            next_step = user_input.get("action")
-            if next_step == "add_entity":
-                return await self.flow.async_step_select_entity_type()
-            if next_step == "edit_entities":
-                return await self.flow.async_step_select_entity_to_edit()
-            if next_step == "remove_entities":
-                return await self.flow.async_step_remove_entities()
-            if next_step == "back":
-                return await self.flow.async_step_init()
+            step_name: str | None = _ENTITY_MENU_ACTIONS.get(user_input.get("action"))
+            if step_name is not None:
+                return await getattr(self.flow, step_name)()
 
         # Get current entity counts
-        current_covers = self.flow.config_entry.data.get(CONF_COVERS, [])
-        current_binary_sensors = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-        current_sensors = self.flow.config_entry.data.get(CONF_SENSORS, [])
-        current_lights = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-        current_switches = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-        current_climates = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-        current_media_players = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-        total_entities = (
-            len(current_covers)
-            + len(current_binary_sensors)
-            + len(current_sensors)
-            + len(current_lights)
-            + len(current_switches)
-            + len(current_climates)
-            + len(current_media_players)
-        )
-
-        # Show entity menu
-        menu_schema = vol.Schema(
-            {
-                vol.Required("action"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Add Entity", "value": "add_entity"},
-                            {"label": f"Edit Entity ({total_entities} available)", "value": "edit_entities"},
-                            {"label": f"Remove Entity ({total_entities} available)", "value": "remove_entities"},
-                            {"label": "← Back to Main Menu", "value": "back"},
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
+        _counts, total_entities = self._entity_counts()
+
+        # Show entity menu (schema is reused while the counts are unchanged)
+        cache_key: tuple = ("entity_menu", total_entities)
+        menu_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if menu_schema is None:
+            menu_schema = vol.Schema(
+                {
+                    vol.Required("action"): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                {"label": "Add Entity", "value": "add_entity"},
+                                {"label": f"Edit Entity ({total_entities} available)", "value": "edit_entities"},
+                                {"label": f"Remove Entity ({total_entities} available)", "value": "remove_entities"},
+                                {"label": "← Back to Main Menu", "value": "back"},
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = menu_schema
 
         return self.flow.async_show_form(
             step_id="entity_menu",
@@ -161,59 +195,43 @@ class MenuHandler:
         """Select which type of entity to add."""
         if user_input is not None:
             self.flow._editing_join = None  # Clear editing state
-            entity_type = user_input.get("entity_type")
-            if entity_type == "light":
-                return await self.flow.async_step_add_light()
-            if entity_type == "switch":
-                return await self.flow.async_step_add_switch()
-            if entity_type == "cover":
-                return await self.flow.async_step_add_cover()
-            if entity_type == "binary_sensor":
-                return await self.flow.async_step_add_binary_sensor()
-            if entity_type == "sensor":
-                return await self.flow.async_step_add_sensor()
-            if entity_type == "climate":
-                return await self.flow.async_step_select_climate_type()
-            if entity_type == "media_player":
-                return await self.flow.async_step_add_media_player()
-            if entity_type == "back":
-                return await self.flow.async_step_entity_menu()
+            step_name: str | None = _ENTITY_TYPE_STEPS.get(user_input.get("entity_type"))
+            if step_name is not None:
+                return await getattr(self.flow, step_name)()
 
         # Get current counts
-        current_lights = self.flow.config_entry.data.get(CONF_LIGHTS, [])
-        current_switches = self.flow.config_entry.data.get(CONF_SWITCHES, [])
-        current_covers = self.flow.config_entry.data.get(CONF_COVERS, [])
-        current_binary_sensors = self.flow.config_entry.data.get(CONF_BINARY_SENSORS, [])
-        current_sensors = self.flow.config_entry.data.get(CONF_SENSORS, [])
-        current_climates = self.flow.config_entry.data.get(CONF_CLIMATES, [])
-        current_media_players = self.flow.config_entry.data.get(CONF_MEDIA_PLAYERS, [])
-
-        # Show entity type selection
-        menu_schema = vol.Schema(
-            {
-                vol.Required("entity_type"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": f"Light ({len(current_lights)} configured)", "value": "light"},
-                            {"label": f"Switch ({len(current_switches)} configured)", "value": "switch"},
-                            {"label": f"Cover ({len(current_covers)} configured)", "value": "cover"},
-                            {
-                                "label": f"Binary Sensor ({len(current_binary_sensors)} configured)",
-                                "value": "binary_sensor",
-                            },
-                            {"label": f"Sensor ({len(current_sensors)} configured)", "value": "sensor"},
-                            {"label": f"Climate ({len(current_climates)} configured)", "value": "climate"},
-                            {
-                                "label": f"Media Player ({len(current_media_players)} configured)",
-                                "value": "media_player",
-                            },
-                            {"label": "← Back", "value": "back"},
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
+        counts, _total = self._entity_counts()
+
+        # Show entity type selection (schema is reused while the counts are unchanged)
+        cache_key: tuple = ("select_entity_type", *counts.values())
+        menu_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if menu_schema is None:
+            menu_schema = vol.Schema(
+                {
+                    vol.Required("entity_type"): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                {"label": f"Light ({counts[CONF_LIGHTS]} configured)", "value": "light"},
+                                {"label": f"Switch ({counts[CONF_SWITCHES]} configured)", "value": "switch"},
+                                {"label": f"Cover ({counts[CONF_COVERS]} configured)", "value": "cover"},
+                                {
+                                    "label": f"Binary Sensor ({counts[CONF_BINARY_SENSORS]} configured)",
+                                    "value": "binary_sensor",
+                                },
+                                {"label": f"Sensor ({counts[CONF_SENSORS]} configured)", "value": "sensor"},
+                                {"label": f"Climate ({counts[CONF_CLIMATES]} configured)", "value": "climate"},
+                                {
+                                    "label": f"Media Player ({counts[CONF_MEDIA_PLAYERS]} configured)",
+                                    "value": "media_player",
+                                },
+                                {"label": "← Back", "value": "back"},
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = menu_schema
 
         return self.flow.async_show_form(
             step_id="select_entity_type",
@@ -224,47 +242,45 @@ class MenuHandler:
         """Join sync management submenu."""
         if user_input is not None:
             next_step = user_input.get("action")
-            if next_step == "add_to_join":
-                self.flow._editing_join = None  # Clear editing state
-                return await self.flow.async_step_add_to_join()
-            if next_step == "add_from_join":
-                self.flow._editing_join = None  # Clear editing state
-                return await self.flow.async_step_add_from_join()
-            if next_step == "edit_joins":
-                return await self.flow.async_step_select_join_to_edit()
-            if next_step == "remove_joins":
-                return await self.flow.async_step_remove_joins()
-            if next_step == "back":
-                return await self.flow.async_step_init()
+            step_name: str | None = _JOIN_MENU_ACTIONS.get(next_step)
+            if step_name is not None:
+                if next_step in _ADD_ACTIONS:
+                    self.flow._editing_join = None  # Clear editing state
+                return await getattr(self.flow, step_name)()
 
         # Get current join counts
-        current_to_joins = self.flow.config_entry.data.get(CONF_TO_HUB, [])
-        current_from_joins = self.flow.config_entry.data.get(CONF_FROM_HUB, [])
+        data = self.flow.config_entry.data
+        current_to_joins = data.get(CONF_TO_HUB, [])
+        current_from_joins = data.get(CONF_FROM_HUB, [])
         total_joins = len(current_to_joins) + len(current_from_joins)
 
-        # Show join menu
-        menu_schema = vol.Schema(
-            {
-                vol.Required("action"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {
-                                "label": f"Add to_join (HA→Crestron) ({len(current_to_joins)} configured)",
-                                "value": "add_to_join",
-                            },
-                            {
-                                "label": f"Add from_join (Crestron→HA) ({len(current_from_joins)} configured)",
-                                "value": "add_from_join",
-                            },
-                            {"label": f"Edit Join ({total_joins} available)", "value": "edit_joins"},
-                            {"label": f"Remove Join ({total_joins} available)", "value": "remove_joins"},
-                            {"label": "← Back to Main Menu", "value": "back"},
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
+        # Show join menu (schema is reused while the counts are unchanged)
+        cache_key: tuple = ("join_menu", len(current_to_joins), len(current_from_joins))
+        menu_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if menu_schema is None:
+            menu_schema = vol.Schema(
+                {
+                    vol.Required("action"): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                {
+                                    "label": f"Add to_join (HA→Crestron) ({len(current_to_joins)} configured)",
+                                    "value": "add_to_join",
+                                },
+                                {
+                                    "label": f"Add from_join (Crestron→HA) ({len(current_from_joins)} configured)",
+                                    "value": "add_from_join",
+                                },
+                                {"label": f"Edit Join ({total_joins} available)", "value": "edit_joins"},
+                                {"label": f"Remove Join ({total_joins} available)", "value": "remove_joins"},
+                                {"label": "← Back to Main Menu", "value": "back"},
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = menu_schema
 
         return self.flow.async_show_form(
             step_id="join_menu",
@@ -277,40 +293,43 @@ class MenuHandler:
         if user_input is not None:
             next_step = user_input.get("action")
             _LOGGER.debug("Dimmer menu action selected: %s", next_step)
-            if next_step == "add_dimmer":
-                self.flow._editing_join = None  # Clear editing state
-                _LOGGER.debug("Calling async_step_add_dimmer_mode (v1.17.1)")
-                return await self.flow.async_step_add_dimmer_mode()
-            if next_step == "edit_dimmers":
-                return await self.flow.async_step_select_dimmer_to_edit()
-            if next_step == "remove_dimmers":
-                return await self.flow.async_step_remove_dimmers()
-            if next_step == "led_bindings":
-                return await self.flow.async_step_led_binding_menu()
-            if next_step == "back":
-                return await self.flow.async_step_init()
+            step_name: str | None = _DIMMER_MENU_ACTIONS.get(next_step)
+            if step_name is not None:
+                if next_step in _ADD_ACTIONS:
+                    self.flow._editing_join = None  # Clear editing state
+                return await getattr(self.flow, step_name)()
 
         # Get current dimmer counts
         current_dimmers = self.flow.config_entry.data.get(CONF_DIMMERS, [])
         total_dimmers = len(current_dimmers)
 
-        # Show dimmer menu
-        menu_schema = vol.Schema(
-            {
-                vol.Required("action"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"label": "Add Dimmer/Keypad", "value": "add_dimmer"},
-                            {"label": f"Edit Dimmer/Keypad ({total_dimmers} available)", "value": "edit_dimmers"},
-                            {"label": f"Remove Dimmer/Keypad ({total_dimmers} available)", "value": "remove_dimmers"},
-                            {"label": f"Configure LED Bindings ({total_dimmers} available)", "value": "led_bindings"},
-                            {"label": "← Back to Main Menu", "value": "back"},
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
+        # Show dimmer menu (schema is reused while the counts are unchanged)
+        cache_key: tuple = ("dimmer_menu", total_dimmers)
+        menu_schema: vol.Schema | None = self._schema_cache.get(cache_key)
+        if menu_schema is None:
+            menu_schema = vol.Schema(
+                {
+                    vol.Required("action"): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                {"label": "Add Dimmer/Keypad", "value": "add_dimmer"},
+                                {"label": f"Edit Dimmer/Keypad ({total_dimmers} available)", "value": "edit_dimmers"},
+                                {
+                                    "label": f"Remove Dimmer/Keypad ({total_dimmers} available)",
+                                    "value": "remove_dimmers",
+                                },
+                                {
+                                    "label": f"Configure LED Bindings ({total_dimmers} available)",
+                                    "value": "led_bindings",
+                                },
+                                {"label": "← Back to Main Menu", "value": "back"},
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                }
+            )
+            self._schema_cache[cache_key] = menu_schema
 
         return self.flow.async_show_form(
             step_id="dimmer_menu",
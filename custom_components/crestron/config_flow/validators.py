@@ -1,7 +1,8 @@
 """Validation utilities for Crestron XSIG config flow."""
 
+import asyncio
 import logging
-import socket
+import re
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -12,6 +13,13 @@ from ..const import CONF_PORT, DOMAIN
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Entity join string format: "a<number>" (analog) or "d<number>" (digital)
+JOIN_RE: re.Pattern[str] = re.compile(r"([ad])(\d+)")
+ANALOG_JOIN_RE: re.Pattern[str] = re.compile(r"a\d+")
+DIGITAL_JOIN_RE: re.Pattern[str] = re.compile(r"d\d+")
+# Join sync format, which also allows "s<number>" (serial)
+SYNC_JOIN_RE: re.Pattern[str] = re.compile(r"[das]\d+")
+
 # Port validation schema
 STEP_USER_DATA_SCHEMA: vol.Schema = vol.Schema(
     {
@@ -52,11 +60,12 @@ async def validate_port(hass: HomeAssistant, port: int) -> dict[str, Any]:
 
     # Only check port availability if NOT used by our YAML config
     if not yaml_using_port:
-        # Check if port is already in use by testing if we can bind to it
+        # Check if port is already in use by testing if we can listen on it
+        # (bound through the event loop, so the probe never blocks it)
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                sock.bind(("0.0.0.0", port))
+            server: asyncio.Server = await hass.loop.create_server(asyncio.Protocol, "0.0.0.0", port)
+            server.close()
+            await server.wait_closed()
         except OSError as err:
             _LOGGER.error("Port %d is already in use by external service: %s", port, err)
             raise PortInUse(f"Port {port} is already in use") from err
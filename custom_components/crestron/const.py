@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
 VERSION: str = "1.25.2"
 HUB: str = "hub"
 DOMAIN: str = "crestron"
@@ -87,30 +90,36 @@ CONF_ACTION: str = "action"
 CONF_SERVICE_DATA: str = "service_data"
 
 # Domain action mappings for dimmer buttons (v1.16.x - deprecated)
-DOMAIN_ACTIONS: dict[str, list[str]] = {
-    "light": ["turn_on", "turn_off", "toggle"],
-    "switch": ["turn_on", "turn_off", "toggle"],
-    "cover": ["open_cover", "close_cover", "stop_cover", "toggle"],
-    "scene": ["turn_on"],
-    "script": ["turn_on"],
-    "climate": ["turn_on", "turn_off", "set_temperature", "set_hvac_mode"],
-    "media_player": [
-        "turn_on",
-        "turn_off",
-        "media_play",
-        "media_pause",
-        "media_play_pause",
-        "volume_up",
-        "volume_down",
-        "volume_mute",
-    ],
-    "fan": ["turn_on", "turn_off", "toggle", "increase_speed", "decrease_speed"],
-    "lock": ["lock", "unlock"],
-    "vacuum": ["start", "stop", "return_to_base"],
-    "input_boolean": ["turn_on", "turn_off", "toggle"],
-    "automation": ["turn_on", "turn_off", "toggle", "trigger"],
-    "group": ["turn_on", "turn_off", "toggle"],
-}
+DOMAIN_ACTIONS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "light": ("turn_on", "turn_off", "toggle"),
+        "switch": ("turn_on", "turn_off", "toggle"),
+        "cover": ("open_cover", "close_cover", "stop_cover", "toggle"),
+        "scene": ("turn_on",),
+        "script": ("turn_on",),
+        "climate": ("turn_on", "turn_off", "set_temperature", "set_hvac_mode"),
+        "media_player": (
+            "turn_on",
+            "turn_off",
+            "media_play",
+            "media_pause",
+            "media_play_pause",
+            "volume_up",
+            "volume_down",
+            "volume_mute",
+        ),
+        "fan": ("turn_on", "turn_off", "toggle", "increase_speed", "decrease_speed"),
+        "lock": ("lock", "unlock"),
+        "vacuum": ("start", "stop", "return_to_base"),
+        "input_boolean": ("turn_on", "turn_off", "toggle"),
+        "automation": ("turn_on", "turn_off", "toggle", "trigger"),
+        "group": ("turn_on", "turn_off", "toggle"),
+    }
+)
+# Same actions as sets, for membership checks
+DOMAIN_ACTION_SETS: Mapping[str, frozenset[str]] = MappingProxyType(
+    {domain: frozenset(actions) for domain, actions in DOMAIN_ACTIONS.items()}
+)
 
 # Dimmer/Keypad Device Types (v1.17.0+)
 DEVICE_TYPE_DIMMER_KEYPAD: str = "dimmer_keypad"
@@ -127,64 +136,70 @@ ENTITY_TYPE_DIMMER_LIGHT: str = "dimmer_light"
 
 # LED Binding: Bindable entity domains (v1.17.0+)
 # These domains can be bound to LED switches for state feedback
-BINDABLE_DOMAINS: dict[str, list[str]] = {
-    "light": ["on", "off"],
-    "switch": ["on", "off"],
-    "binary_sensor": ["on", "off"],
-    "lock": ["locked", "unlocked"],
-    "cover": ["open", "closed", "opening", "closing"],
-    "media_player": ["playing", "paused", "idle", "off"],
-    "climate": ["heat", "cool", "heat_cool", "auto", "off"],
-    "fan": ["on", "off"],
-    "input_boolean": ["on", "off"],
-    "automation": ["on", "off"],
-    "vacuum": ["cleaning", "docked", "paused", "idle", "returning"],
-    "alarm_control_panel": ["armed_away", "armed_home", "armed_night", "disarmed"],
-    "person": ["home", "not_home"],
-    "device_tracker": ["home", "not_home"],
-    "sun": ["above_horizon", "below_horizon"],
-}
+BINDABLE_DOMAINS: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        "light": frozenset(("on", "off")),
+        "switch": frozenset(("on", "off")),
+        "binary_sensor": frozenset(("on", "off")),
+        "lock": frozenset(("locked", "unlocked")),
+        "cover": frozenset(("open", "closed", "opening", "closing")),
+        "media_player": frozenset(("playing", "paused", "idle", "off")),
+        "climate": frozenset(("heat", "cool", "heat_cool", "auto", "off")),
+        "fan": frozenset(("on", "off")),
+        "input_boolean": frozenset(("on", "off")),
+        "automation": frozenset(("on", "off")),
+        "vacuum": frozenset(("cleaning", "docked", "paused", "idle", "returning")),
+        "alarm_control_panel": frozenset(("armed_away", "armed_home", "armed_night", "disarmed")),
+        "person": frozenset(("home", "not_home")),
+        "device_tracker": frozenset(("home", "not_home")),
+        "sun": frozenset(("above_horizon", "below_horizon")),
+    }
+)
+# Bindable domain names, in BINDABLE_DOMAINS order
+BINDABLE_DOMAIN_LIST: tuple[str, ...] = tuple(BINDABLE_DOMAINS)
 
 # LED Binding: State to LED on/off mapping (v1.17.0+)
 # Maps entity states to LED on (True) or off (False)
-STATE_TO_LED: dict[str, bool] = {
-    # Common states
-    "on": True,
-    "off": False,
-    "true": True,
-    "false": False,
-    # Lock states
-    "locked": True,
-    "unlocked": False,
-    "locking": True,
-    "unlocking": False,
-    # Cover states
-    "open": True,
-    "closed": False,
-    "opening": True,
-    "closing": True,
-    # Media player states
-    "playing": True,
-    "paused": False,
-    "idle": False,
-    # Climate states
-    "heat": True,
-    "cool": True,
-    "heat_cool": True,
-    "auto": True,
-    # Vacuum states
-    "cleaning": True,
-    "docked": False,
-    "returning": True,
-    # Alarm states
-    "armed_away": True,
-    "armed_home": True,
-    "armed_night": True,
-    "disarmed": False,
-    # Presence states
-    "home": True,
-    "not_home": False,
-    # Sun states
-    "above_horizon": True,
-    "below_horizon": False,
-}
+STATE_TO_LED: Mapping[str, bool] = MappingProxyType(
+    {
+        # Common states
+        "on": True,
+        "off": False,
+        "true": True,
+        "false": False,
+        # Lock states
+        "locked": True,
+        "unlocked": False,
+        "locking": True,
+        "unlocking": False,
+        # Cover states
+        "open": True,
+        "closed": False,
+        "opening": True,
+        "closing": True,
+        # Media player states
+        "playing": True,
+        "paused": False,
+        "idle": False,
+        # Climate states
+        "heat": True,
+        "cool": True,
+        "heat_cool": True,
+        "auto": True,
+        # Vacuum states
+        "cleaning": True,
+        "docked": False,
+        "returning": True,
+        # Alarm states
+        "armed_away": True,
+        "armed_home": True,
+        "armed_night": True,
+        "disarmed": False,
+        # Presence states
+        "home": True,
+        "not_home": False,
+        # Sun states
+        "above_horizon": True,
+        "below_horizon": False,
+    }
+)
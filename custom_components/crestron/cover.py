@@ -1,13 +1,14 @@
 """Platform for Crestron Shades integration."""
 
-import asyncio
+from collections.abc import Callable
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.cover import CoverDeviceClass, CoverEntity, CoverEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -30,6 +31,11 @@ from .helpers import get_hub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Position scaling between HA percent (0-100) and the Crestron analog range (0-65535)
+_ANALOG_MAX: int = 0xFFFF
+_PCT_TO_ANALOG: float = 655.35
+_ANALOG_TO_PCT: float = 1.0 / _PCT_TO_ANALOG
+
 PLATFORM_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): cv.string,
@@ -43,6 +49,27 @@ PLATFORM_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# UI join strings ("a30", "d31") coerced to join numbers; whole-string matches,
+# like the config flow's ANALOG_JOIN_RE/DIGITAL_JOIN_RE fullmatch checks
+_ANALOG_JOIN = vol.All(cv.string, vol.Match(r"a\d+\Z", msg="expected a<int>"), lambda join: int(join[1:]))
+_DIGITAL_JOIN = vol.All(cv.string, vol.Match(r"d\d+\Z", msg="expected d<int>"), lambda join: int(join[1:]))
+# Optional digital joins that are blank or not in "d<int>" form are left unset
+_OPTIONAL_DIGITAL_JOIN = vol.Any(_DIGITAL_JOIN, lambda _join: None)
+
+UI_COVER_SCHEMA = vol.Schema(
+    {
+        # Stored entries may carry a None name or type; those still load
+        vol.Optional(CONF_NAME): vol.Any(None, cv.string),
+        vol.Optional(CONF_TYPE, default="shade"): vol.Any(None, cv.string),
+        vol.Required(CONF_POS_JOIN): _ANALOG_JOIN,
+        vol.Optional(CONF_IS_OPENING_JOIN): _OPTIONAL_DIGITAL_JOIN,
+        vol.Optional(CONF_IS_CLOSING_JOIN): _OPTIONAL_DIGITAL_JOIN,
+        vol.Optional(CONF_IS_CLOSED_JOIN): _OPTIONAL_DIGITAL_JOIN,
+        vol.Optional(CONF_STOP_JOIN): _OPTIONAL_DIGITAL_JOIN,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -78,30 +105,16 @@ async def async_setup_entry(
         _LOGGER.debug("No cover entities configured in config entry")
         return True
 
-    # Parse join strings to integers and create entities
-    entities = []
+    # Parse join strings ("a30", "d31") to integers and create entities
+    entities: list[CrestronShade] = []
+    append = entities.append
     for cover_config in cover_configs:
-        # Parse joins from string format ("a30", "d31") to integers
-        parsed_config = {
-            CONF_NAME: cover_config.get(CONF_NAME),
-            CONF_TYPE: cover_config.get(CONF_TYPE, "shade"),
-        }
-
-        # Parse position join (required, analog)
-        pos_join_str = cover_config.get(CONF_POS_JOIN)
-        if pos_join_str and pos_join_str[0] == "a":
-            parsed_config[CONF_POS_JOIN] = int(pos_join_str[1:])
-        else:
-            _LOGGER.warning("Skipping cover %s: invalid pos_join format %s", cover_config.get(CONF_NAME), pos_join_str)
+        try:
+            parsed_config: dict[str, Any] = UI_COVER_SCHEMA(cover_config)
+        except vol.Invalid as err:
+            _LOGGER.warning("Skipping cover %s: %s", cover_config.get(CONF_NAME), err)
             continue
-
-        # Parse optional digital joins
-        for join_key in [CONF_IS_OPENING_JOIN, CONF_IS_CLOSING_JOIN, CONF_IS_CLOSED_JOIN, CONF_STOP_JOIN]:
-            join_str = cover_config.get(join_key)
-            if join_str and join_str[0] == "d":
-                parsed_config[join_key] = int(join_str[1:])
-
-        entities.append(CrestronShade(hub, parsed_config, from_ui=True))
+        append(CrestronShade(hub, parsed_config, from_ui=True))
 
     if entities:
         async_add_entities(entities)
@@ -113,6 +126,35 @@ async def async_setup_entry(
 class CrestronShade(CoverEntity, RestoreEntity):
     """Crestron Cover/Shade entity."""
 
+    # Fixed storage for the fields this class owns. The HA entity bases keep a __dict__,
+    # and their _attr_* names are cached properties, so those stay out of the slots.
+    __slots__ = (
+        "_hub",
+        "_has_analog",
+        "_analog_or",
+        "_digital_or",
+        "_is_available",
+        "_from_ui",
+        "_should_poll",
+        "_name",
+        "_is_opening_join",
+        "_is_closing_join",
+        "_is_closed_join",
+        "_stop_join",
+        "_pos_join",
+        "_relevant_joins",
+        "_restored_position",
+        "_restored_is_closed",
+        "_last_available",
+        "_last_pos_raw",
+        "_last_position",
+        "_last_opening",
+        "_last_closing",
+        "_last_closed",
+        "_last_is_closed",
+        "_callback_ref",
+    )
+
     def __init__(self, hub: Any, config: dict[str, Any], from_ui: bool = False) -> None:
         """Initialize the Crestron shade.
 
@@ -122,6 +164,12 @@ class CrestronShade(CoverEntity, RestoreEntity):
             from_ui: Whether entity was created via UI (affects unique_id)
         """
         self._hub = hub
+        # Hub accessors bound once; the state properties call them on every read
+        self._has_analog: Callable[[int], bool] = hub.has_analog_value
+        # Value-or-default in a single lookup, rather than has_*_value then get_*
+        self._analog_or: Callable[[int | None, int | None], int | None] = hub.get_analog_or
+        self._digital_or: Callable[[int | None, bool | None], bool | None] = hub.get_digital_or
+        self._is_available: Callable[[], bool] = hub.is_available
         self._from_ui = from_ui  # Track if this is a UI-created entity
         # Initialize with default values
         self._attr_device_class: CoverDeviceClass | None = None
@@ -136,6 +184,28 @@ class CrestronShade(CoverEntity, RestoreEntity):
         self._stop_join: int | None = config.get(CONF_STOP_JOIN)
         self._pos_join: int = config.get(CONF_POS_JOIN)
 
+        # Identity is fixed for the entity's lifetime, so set it once
+        self._attr_unique_id = (
+            f"crestron_cover_ui_a{self._pos_join}" if from_ui else f"crestron_cover_a{self._pos_join}"
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"crestron_{hub.port}")},
+            name="Crestron Control System",
+            manufacturer="Crestron Electronics",
+            model="XSIG Gateway",
+            sw_version=VERSION,
+        )
+
+        # Callback types for our joins (optional digital joins may be unset).
+        # Interned like the hub's callback types, so lookups match by identity.
+        joins: list[str] = [f"a{self._pos_join}"]
+        joins += [
+            f"d{join}"
+            for join in (self._is_opening_join, self._is_closing_join, self._is_closed_join, self._stop_join)
+            if join
+        ]
+        self._relevant_joins: frozenset[str] = frozenset(map(sys.intern, joins))
+
         # Set device class and features based on type and configured joins
         if config.get(CONF_TYPE) == "shade":
             self._attr_device_class = CoverDeviceClass.SHADE
@@ -153,17 +223,31 @@ class CrestronShade(CoverEntity, RestoreEntity):
         self._restored_position: float | None = None
         self._restored_is_closed: bool | None = None
 
+        # Last join values read from the hub, so repeated hub updates don't rewrite state
+        self._last_available: bool | None = None
+        self._last_pos_raw: int | None = None
+        self._last_position: float | None = None
+        self._last_opening: bool | None = None
+        self._last_closing: bool | None = None
+        self._last_closed: bool | None = None
+        self._last_is_closed: bool | None = None
+        self._refresh_join_values()
+
         # Callback reference for proper deregistration
         self._callback_ref = None
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks and restore state."""
         await super().async_added_to_hass()
+        # Only our joins and connection state changes are routed to us
         self._callback_ref = self.process_callback
-        self._hub.register_callback(self._callback_ref)
+        for cbtype in (*self._relevant_joins, "available"):
+            self._hub.register_join_callback(cbtype, self._callback_ref)
+        # Pick up any values the hub received before the callback was registered
+        self._refresh_join_values()
 
-        # Restore last state if available
-        if (last_state := await self.async_get_last_state()) is not None:
+        # Restore last state if available (not needed when the hub already has a live position)
+        if not self._has_analog(self._pos_join) and (last_state := await self.async_get_last_state()) is not None:
             self._restored_position = last_state.attributes.get("current_position")
             self._restored_is_closed = last_state.state == "closed"
             _LOGGER.debug(
@@ -171,64 +255,77 @@ class CrestronShade(CoverEntity, RestoreEntity):
             )
 
         # Request current state from Crestron if connected
-        if self._hub.is_available():
+        if self._is_available():
             self._hub.request_update()
             _LOGGER.debug("Requested update for %s", self.name)
 
     async def async_will_remove_from_hass(self) -> None:
         """Unregister callbacks when entity is removed."""
         if self._callback_ref is not None:
-            self._hub.remove_callback(self._callback_ref)
+            for cbtype in (*self._relevant_joins, "available"):
+                self._hub.remove_join_callback(cbtype, self._callback_ref)
 
-    async def process_callback(self, cbtype: str, value: Any) -> None:
-        """Process callbacks from the hub."""
-        # Only update if this is one of our joins or connection state changed
+    @callback
+    def process_callback(self, cbtype: str, value: Any) -> None:
+        """Process callbacks from the hub for our joins and connection state."""
         if cbtype == "available":
-            self.async_write_ha_state()
+            # Only write on an actual connection state transition
+            available: bool = self._is_available()
+            if available != self._last_available:
+                self._last_available = available
+                self.async_write_ha_state()
             return
 
-        # Build set of relevant joins (handle None values for optional joins)
-        relevant_joins = {f"a{self._pos_join}"}
-        if self._is_opening_join:
-            relevant_joins.add(f"d{self._is_opening_join}")
-        if self._is_closing_join:
-            relevant_joins.add(f"d{self._is_closing_join}")
-        if self._is_closed_join:
-            relevant_joins.add(f"d{self._is_closed_join}")
-        if self._stop_join:
-            relevant_joins.add(f"d{self._stop_join}")
-
-        if cbtype in relevant_joins:
+        # Crestron often re-sends identical values; skip the write when nothing visible changed
+        if self._refresh_join_values():
             self.async_write_ha_state()
 
+    def _refresh_join_values(self) -> bool:
+        """Read our join values from the hub and recompute the position and closed verdict.
+
+        Returns:
+            True if any of the values changed since the last refresh
+        """
+        pos_raw: int | None = self._analog_or(self._pos_join, None)
+        opening: bool | None = self._digital_or(self._is_opening_join, None)
+        closing: bool | None = self._digital_or(self._is_closing_join, None)
+        closed: bool | None = self._digital_or(self._is_closed_join, None)
+        if (pos_raw, opening, closing, closed) == (
+            self._last_pos_raw,
+            self._last_opening,
+            self._last_closing,
+            self._last_closed,
+        ):
+            return False
+
+        self._last_pos_raw = pos_raw
+        # Scaled once per change, so every state write reads the same percentage
+        self._last_position = None if pos_raw is None else pos_raw * _ANALOG_TO_PCT
+        self._last_opening = opening
+        self._last_closing = closing
+        self._last_closed = closed
+
+        # Closed feedback wins; otherwise infer from position when not moving
+        # (opening/closing state takes precedence). None defers to restored state.
+        if closed is not None:
+            self._last_is_closed = closed
+        elif not opening and not closing and self._last_position is not None:
+            # Closed if position is at or very close to 0
+            self._last_is_closed = self._last_position < 1
+        else:
+            self._last_is_closed = None
+        return True
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._hub.is_available()
+        return self._is_available()
 
     @property
     def name(self) -> str:
         """Return the name of the entity."""
         return self._name
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for this entity."""
-        if self._from_ui:
-            return f"crestron_cover_ui_a{self._pos_join}"
-        return f"crestron_cover_a{self._pos_join}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"crestron_{self._hub.port}")},
-            name="Crestron Control System",
-            manufacturer="Crestron Electronics",
-            model="XSIG Gateway",
-            sw_version=VERSION,
-        )
-
     @property
     def device_class(self) -> CoverDeviceClass | None:
         """Return the device class of the cover."""
@@ -247,49 +344,39 @@ class CrestronShade(CoverEntity, RestoreEntity):
     @property
     def current_cover_position(self) -> float | None:
         """Return current position of cover."""
-        if self._hub.has_analog_value(self._pos_join):
-            return self._hub.get_analog(self._pos_join) / 655.35
-        return self._restored_position
+        return self._restored_position if self._last_position is None else self._last_position
 
     @property
     def is_opening(self) -> bool | None:
         """Return if the cover is opening."""
-        if self._hub.has_digital_value(self._is_opening_join):
-            return self._hub.get_digital(self._is_opening_join)
-        return None
+        return self._digital_or(self._is_opening_join, None)
 
     @property
     def is_closing(self) -> bool | None:
         """Return if the cover is closing."""
-        if self._hub.has_digital_value(self._is_closing_join):
-            return self._hub.get_digital(self._is_closing_join)
-        return None
+        return self._digital_or(self._is_closing_join, None)
 
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed."""
-        # If we have closed state feedback, use it
-        if self._hub.has_digital_value(self._is_closed_join):
-            return self._hub.get_digital(self._is_closed_join)
-
-        # Otherwise, infer from position when not moving
-        # (opening/closing state takes precedence)
-        if not self.is_opening and not self.is_closing:
-            position = self.current_cover_position
-            if position is not None:
-                # Closed if position is at or very close to 0
-                return position < 1
+        # Verdict from live hub values, recomputed whenever one of our joins changes
+        if self._last_is_closed is not None:
+            return self._last_is_closed
+
+        # Otherwise infer from the restored position when not moving
+        if not self._last_opening and not self._last_closing and self._restored_position is not None:
+            return self._restored_position < 1
 
         # Fallback to restored state if available
         return self._restored_is_closed
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover to a specific position."""
-        await self._hub.async_set_analog(self._pos_join, int(kwargs["position"]) * 655)
+        await self._hub.async_set_analog(self._pos_join, int(kwargs["position"] * _PCT_TO_ANALOG))
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self._hub.async_set_analog(self._pos_join, 0xFFFF)
+        await self._hub.async_set_analog(self._pos_join, _ANALOG_MAX)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
@@ -316,17 +403,15 @@ class CrestronShade(CoverEntity, RestoreEntity):
             _LOGGER.warning("Stop requested but no stop_join configured for %s", self._name)
             return
 
-        # Send stop pulse
-        await self._hub.async_set_digital(self._stop_join, 1)
-        await asyncio.sleep(0.2)
-        await self._hub.async_set_digital(self._stop_join, 0)
-
-        # Clear the direction state by setting analog to current position
+        # Send stop pulse, then clear the direction state by setting analog to
+        # the current position in the same write as the pulse release.
         # This allows immediate direction changes after stopping
+        await self._hub.async_pulse_then_set(self._stop_join, 200, self._pos_join, self._neutral_position)
+
+    def _neutral_position(self) -> int:
+        """Return the analog value for the current position, or mid-point (50%) if unknown."""
         current_pos = self.current_cover_position
         if current_pos is not None:
-            # Set to current position (convert percentage back to analog value)
-            await self._hub.async_set_analog(self._pos_join, int(current_pos * 655.35))
-        else:
-            # If we don't have a position, use mid-point (50%)
-            await self._hub.async_set_analog(self._pos_join, 32767)
+            # Convert percentage back to analog value
+            return int(current_pos * _PCT_TO_ANALOG)
+        return 32767
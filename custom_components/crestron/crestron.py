@@ -2,23 +2,58 @@ import asyncio
 from collections.abc import Callable, Coroutine
 import logging
 import struct
+import sys
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled packet layouts (2-byte digital/serial header, 4-byte analog)
+_S_BB = struct.Struct(">BB")
+_S_BBBB = struct.Struct(">BBBB")
+
+# Flush queued outbound joins early once this many bytes are pending (about one TCP segment)
+TX_FLUSH_BYTES: int = 1400
+# Transport backlog above which awaited sends wait for the socket to catch up
+TX_DRAIN_BYTES: int = 8192
+# Bytes requested per read from the control system
+RX_CHUNK_BYTES: int = 4096
+
+
+def _pack_analog(join: int, value: int) -> bytes:
+    """Encode an analog join packet"""
+    return _S_BBBB.pack(
+        0b11000000 | (value >> 10 & 0b00110000) | (join - 1) >> 7,
+        (join - 1) & 0b01111111,
+        value >> 7 & 0b01111111,
+        value & 0b01111111,
+    )
+
+
+def _pack_digital(join: int, value: int) -> bytes:
+    """Encode a digital join packet"""
+    return _S_BB.pack(
+        0b10000000 | (~int(value) << 5 & 0b00100000) | (join - 1) >> 7,
+        (join - 1) & 0b01111111,
+    )
+
 
 class CrestronXsig:
     def __init__(self) -> None:
         """Initialize CrestronXsig object"""
+        # Only joins received from Crestron are stored, so the keys double as
+        # the "has received data" markers for has_*_value
         self._digital: dict[int, bool] = {}
         self._analog: dict[int, int] = {}
         self._serial: dict[int, str] = {}
-        # Track which joins have received data from Crestron
-        self._digital_received: set[int] = set()
-        self._analog_received: set[int] = set()
-        self._serial_received: set[int] = set()
         self._writer: asyncio.StreamWriter | None = None
+        # Outbound bytes waiting for the next flush, so bursts of joins share one write
+        self._tx_buf: bytearray = bytearray()
+        self._tx_scheduled: bool = False
+        # Scheduled pulse releases by the analog join they set: (timer, digital join)
+        self._pending_releases: dict[int, tuple[asyncio.TimerHandle, int]] = {}
         self._callbacks: set[Callable[[str, str], Coroutine[Any, Any, None]]] = set()
+        # Synchronous callbacks keyed by the one callback type they care about ("a30", "d31", "available")
+        self._join_callbacks: dict[str, list[Callable[[str, str], None]]] = {}
         self._server: asyncio.Server | None = None
         self._available: bool = False
         self._sync_all_joins_callback: Callable[[], Coroutine[Any, Any, None]] | None = None
@@ -37,11 +72,14 @@ class CrestronXsig:
     async def stop(self) -> None:
         """Stop TCP XSIG server"""
         self._available = False
-        for callback in self._callbacks:
-            await callback("available", "False")
+        await self._notify("available", "False")
         _LOGGER.info("Stop called. Closing connection")
 
-        # Close the writer if connected (drain pending data first)
+        # Close the writer if connected (send pending releases and data first)
+        for analog_join in list(self._pending_releases):
+            self._release_pending(analog_join)
+        if self._writer is not None:
+            self._flush_tx()
         if self._writer is not None:
             try:
                 self._writer.close()
@@ -57,6 +95,23 @@ class CrestronXsig:
             await self._server.wait_closed()
             _LOGGER.debug("Server closed successfully")
 
+    async def _notify(self, cbtype: str, value: str) -> None:
+        """Run the callbacks keyed to one update, then every broadcast callback, logging any failures
+
+        Callbacks are awaited in turn, so they must not hold up the receive loop;
+        long-running work (services, scripts) is started as a task by the callback.
+        """
+        for join_callback in tuple(self._join_callbacks.get(cbtype, ())):
+            try:
+                join_callback(cbtype, value)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Callback for %s failed", cbtype)
+        for callback in tuple(self._callbacks):
+            try:
+                await callback(cbtype, value)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Callback for %s failed", cbtype)
+
     def register_sync_all_joins_callback(self, callback: Callable[[], Coroutine[Any, Any, None]]) -> None:
         """Allow callback to be registred for when control system requests an update to all joins"""
         _LOGGER.debug("Sync-all-joins callback registered")
@@ -70,6 +125,18 @@ class CrestronXsig:
         """Allow callbacks to be de-registered"""
         self._callbacks.discard(callback)
 
+    def register_join_callback(self, cbtype: str, callback: Callable[[str, str], None]) -> None:
+        """Register a synchronous callback run only for one join ("a30", "d31") or for "available" changes"""
+        self._join_callbacks.setdefault(sys.intern(cbtype), []).append(callback)
+
+    def remove_join_callback(self, cbtype: str, callback: Callable[[str, str], None]) -> None:
+        """De-register a callback added with register_join_callback"""
+        callbacks = self._join_callbacks.get(cbtype)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._join_callbacks[cbtype]
+
     async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         """Parse packets from Crestron XSIG symbol"""
         self._writer = writer
@@ -78,64 +145,73 @@ class CrestronXsig:
         _LOGGER.debug("Sending update request")
         writer.write(b"\xfd")
         self._available = True
-        for callback in self._callbacks:
-            await callback("available", "True")
+        await self._notify("available", "True")
 
-        connected = True
-        while connected:
-            data = await reader.read(1)
-            if data:
+        # Packets are parsed straight out of a receive buffer filled a chunk at a time,
+        # so a burst of joins costs one read instead of one per byte.
+        # pos is the start of the first unparsed packet.
+        buf = bytearray()
+        while chunk := await reader.read(RX_CHUNK_BYTES):
+            buf += chunk
+            end = len(buf)
+            pos = 0
+            while pos < end:
                 # Sync all joins request
-                if data[0] == 0xFB:
+                if buf[pos] == 0xFB:
+                    pos += 1
                     _LOGGER.debug("Got update all joins request")
                     if self._sync_all_joins_callback is not None:
                         await self._sync_all_joins_callback()
                         _LOGGER.debug("Calling sync-all-joins callback")
+                    continue
+                if pos + 2 > end:
+                    break  # Wait for the rest of the header
+                head, low = buf[pos], buf[pos + 1]
+                # Digital Join
+                if head & 0b11000000 == 0b10000000 and low & 0b10000000 == 0b00000000:
+                    pos += 2
+                    join = ((head & 0b00011111) << 7 | low) + 1
+                    value = ~head >> 5 & 0b1
+                    self._digital[join] = value == 1
+                    # Removed excessive debug logging that floods logs
+                    # _LOGGER.debug(f"Got Digital: {join} = {value}")
+                    cbtype = sys.intern(f"d{join}")  # Entities intern their join keys too
+                    await self._notify(cbtype, str(value))
+                # Analog Join
+                elif head & 0b11001000 == 0b11000000 and low & 0b10000000 == 0b00000000:
+                    if pos + 4 > end:
+                        break  # Wait for the value bytes
+                    header = _S_BBBB.unpack_from(buf, pos)
+                    pos += 4
+                    join = ((header[0] & 0b00000111) << 7 | header[1]) + 1
+                    value = (header[0] & 0b00110000) << 10 | header[2] << 7 | header[3]
+                    self._analog[join] = value
+                    # Removed excessive debug logging that floods logs
+                    # _LOGGER.debug(f"Got Analog: {join} = {value}")
+                    cbtype = sys.intern(f"a{join}")  # Entities intern their join keys too
+                    await self._notify(cbtype, str(value))
+                # Serial Join
+                elif head & 0b11111000 == 0b11001000 and low & 0b10000000 == 0b00000000:
+                    terminator = buf.find(0xFF, pos + 2)
+                    if terminator < 0:
+                        break  # Wait for the rest of the string
+                    join = ((head & 0b00000111) << 7 | low) + 1
+                    string = buf[pos + 2 : terminator].decode("utf-8")
+                    pos = terminator + 1
+                    self._serial[join] = string
+                    # Removed excessive debug logging that floods logs
+                    # _LOGGER.debug(f"Got String: {join} = {string}")
+                    cbtype = sys.intern(f"s{join}")  # Entities intern their join keys too
+                    await self._notify(cbtype, string)
                 else:
-                    data += await reader.read(1)
-                    # Digital Join
-                    if data[0] & 0b11000000 == 0b10000000 and data[1] & 0b10000000 == 0b00000000:
-                        header = struct.unpack("BB", data)
-                        join = ((header[0] & 0b00011111) << 7 | header[1]) + 1
-                        value = ~header[0] >> 5 & 0b1
-                        self._digital[join] = value == 1
-                        self._digital_received.add(join)  # Mark as received
-                        # Removed excessive debug logging that floods logs
-                        # _LOGGER.debug(f"Got Digital: {join} = {value}")
-                        for callback in self._callbacks:
-                            await callback(f"d{join}", str(value))
-                    # Analog Join
-                    elif data[0] & 0b11001000 == 0b11000000 and data[1] & 0b10000000 == 0b00000000:
-                        data += await reader.read(2)
-                        header = struct.unpack("BBBB", data)
-                        join = ((header[0] & 0b00000111) << 7 | header[1]) + 1
-                        value = (header[0] & 0b00110000) << 10 | header[2] << 7 | header[3]
-                        self._analog[join] = value
-                        self._analog_received.add(join)  # Mark as received
-                        # Removed excessive debug logging that floods logs
-                        # _LOGGER.debug(f"Got Analog: {join} = {value}")
-                        for callback in self._callbacks:
-                            await callback(f"a{join}", str(value))
-                    # Serial Join
-                    elif data[0] & 0b11111000 == 0b11001000 and data[1] & 0b10000000 == 0b00000000:
-                        data += await reader.readuntil(b"\xff")
-                        header = struct.unpack("BB", data[:2])
-                        join = ((header[0] & 0b00000111) << 7 | header[1]) + 1
-                        string = data[2:-1].decode("utf-8")
-                        self._serial[join] = string
-                        self._serial_received.add(join)  # Mark as received
-                        # Removed excessive debug logging that floods logs
-                        # _LOGGER.debug(f"Got String: {join} = {string}")
-                        for callback in self._callbacks:
-                            await callback(f"s{join}", string)
-                    else:
-                        _LOGGER.debug("Unknown Packet: %s", data.hex())
-            else:
-                _LOGGER.info("Control system disconnected")
-                connected = False
-                self._available = False
-                for callback in self._callbacks:
-                    await callback("available", "False")
+                    _LOGGER.debug("Unknown Packet: %s", buf[pos : pos + 2].hex())
+                    pos += 2
+            # Keep only the incomplete packet (if any) for the next read
+            del buf[:pos]
+
+        _LOGGER.info("Control system disconnected")
+        self._available = False
+        await self._notify("available", "False")
 
     def is_available(self) -> bool:
         """Returns True if control system is connected"""
@@ -153,123 +229,154 @@ class CrestronXsig:
         """Return serial value for join"""
         return self._serial.get(join, "")
 
+    def get_analog_or(self, join: int, default: int | None = None) -> int | None:
+        """Return analog value for join, or default if none has been received"""
+        return self._analog.get(join, default)
+
+    def get_digital_or(self, join: int, default: bool | None = None) -> bool | None:
+        """Return digital value for join, or default if none has been received"""
+        return self._digital.get(join, default)
+
     def has_analog_value(self, join: int) -> bool:
         """Check if analog join has received valid data from Crestron"""
-        return join in self._analog_received
+        return join in self._analog
 
     def has_digital_value(self, join: int) -> bool:
         """Check if digital join has received valid data from Crestron"""
-        return join in self._digital_received
+        return join in self._digital
 
     def has_serial_value(self, join: int) -> bool:
         """Check if serial join has received valid data from Crestron"""
-        return join in self._serial_received
+        return join in self._serial
+
+    def _queue_tx(self, data: bytes) -> None:
+        """Buffer outbound bytes, flushing on the next loop tick or once a full segment is pending"""
+        self._tx_buf += data
+        if len(self._tx_buf) >= TX_FLUSH_BYTES:
+            self._flush_tx()
+        elif not self._tx_scheduled:
+            self._tx_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_tx)
+
+    def _flush_tx(self) -> None:
+        """Write all buffered outbound bytes in a single call"""
+        self._tx_scheduled = False
+        if not self._tx_buf:
+            return
+        data = bytes(self._tx_buf)
+        self._tx_buf.clear()
+        if not self._writer:
+            _LOGGER.debug("Dropped %d queued bytes. No connection to hub", len(data))
+            return
+        try:
+            self._writer.write(data)
+        except OSError as err:
+            _LOGGER.warning("Failed to send to Crestron: %s", err)
+            self._writer = None  # Mark connection as dead
+            self._available = False
+
+    async def _async_flush_tx(self) -> None:
+        """Write all buffered outbound bytes now, waiting only if the transport is backed up"""
+        self._flush_tx()
+        if not self._writer:
+            return
+        # Joins are a few bytes each; draining every send would yield the loop for nothing
+        if self._writer.transport.get_write_buffer_size() <= TX_DRAIN_BYTES:
+            return
+        try:
+            await self._writer.drain()  # Ensure data is actually sent
+        except OSError as err:
+            _LOGGER.warning("Failed to send to Crestron: %s", err)
+            self._writer = None  # Mark connection as dead
+            self._available = False
 
     def set_analog(self, join: int, value: int) -> None:
         """Send Analog Join to Crestron XSIG symbol"""
         if self._writer:
-            try:
-                data = struct.pack(
-                    ">BBBB",
-                    0b11000000 | (value >> 10 & 0b00110000) | (join - 1) >> 7,
-                    (join - 1) & 0b01111111,
-                    value >> 7 & 0b01111111,
-                    value & 0b01111111,
-                )
-                self._writer.write(data)
-                # Removed excessive debug logging
-                # _LOGGER.debug(f"Sending Analog: {join}, {value}")
-            except OSError as err:
-                _LOGGER.warning("Failed to send analog join %s: %s", join, err)
-                self._writer = None  # Mark connection as dead
-                self._available = False
+            self._release_pending(join)
+            self._queue_tx(_pack_analog(join, value))
         else:
             _LOGGER.debug("Could not send analog. No connection to hub")
 
     async def async_set_analog(self, join: int, value: int) -> None:
         """Send Analog Join to Crestron XSIG symbol and ensure it's transmitted"""
         if self._writer:
-            try:
-                data = struct.pack(
-                    ">BBBB",
-                    0b11000000 | (value >> 10 & 0b00110000) | (join - 1) >> 7,
-                    (join - 1) & 0b01111111,
-                    value >> 7 & 0b01111111,
-                    value & 0b01111111,
-                )
-                self._writer.write(data)
-                await self._writer.drain()  # Ensure data is actually sent
-            except OSError as err:
-                _LOGGER.warning("Failed to send analog join %s: %s", join, err)
-                self._writer = None  # Mark connection as dead
-                self._available = False
+            self._release_pending(join)
+            self._tx_buf += _pack_analog(join, value)
+            await self._async_flush_tx()
         else:
             _LOGGER.debug("Could not send analog. No connection to hub")
 
     def set_digital(self, join: int, value: int) -> None:
         """Send Digital Join to Crestron XSIG symbol"""
         if self._writer:
-            try:
-                data = struct.pack(
-                    ">BB",
-                    0b10000000 | (~int(value) << 5 & 0b00100000) | (join - 1) >> 7,
-                    (join - 1) & 0b01111111,
-                )
-                self._writer.write(data)
-            except OSError as err:
-                _LOGGER.warning("Failed to send digital join %s: %s", join, err)
-                self._writer = None  # Mark connection as dead
-                self._available = False
+            self._queue_tx(_pack_digital(join, value))
         else:
             _LOGGER.debug("Could not send digital. No connection to hub")
 
     async def async_set_digital(self, join: int, value: int) -> None:
         """Send Digital Join to Crestron XSIG symbol and ensure it's transmitted"""
         if self._writer:
-            try:
-                data = struct.pack(
-                    ">BB",
-                    0b10000000 | (~int(value) << 5 & 0b00100000) | (join - 1) >> 7,
-                    (join - 1) & 0b01111111,
-                )
-                self._writer.write(data)
-                await self._writer.drain()  # Ensure data is actually sent
-            except OSError as err:
-                _LOGGER.warning("Failed to send digital join %s: %s", join, err)
-                self._writer = None  # Mark connection as dead
-                self._available = False
+            self._tx_buf += _pack_digital(join, value)
+            await self._async_flush_tx()
         else:
             _LOGGER.debug("Could not send digital. No connection to hub")
 
+    async def async_pulse_then_set(
+        self, digital_join: int, pulse_ms: int, analog_join: int, analog_value: Callable[[], int]
+    ) -> None:
+        """Pulse a digital join, then send its release and an analog value in one write
+
+        Returns once the press is sent; the release is scheduled on the loop, so
+        callers are not held for the pulse. analog_value is called at release time,
+        so it sees any feedback received meanwhile. Writing analog_join before then
+        sends the release at once and drops the analog value, so a newer command
+        is never overwritten.
+        """
+        if not self._writer:
+            _LOGGER.debug("Could not send pulse. No connection to hub")
+            return
+        self._release_pending(analog_join)
+        self._tx_buf += _pack_digital(digital_join, 1)
+        await self._async_flush_tx()
+        handle = asyncio.get_running_loop().call_later(
+            pulse_ms / 1000, self._release_pulse, digital_join, analog_join, analog_value
+        )
+        self._pending_releases[analog_join] = (handle, digital_join)
+
+    def _release_pulse(self, digital_join: int, analog_join: int, analog_value: Callable[[], int]) -> None:
+        """Send the release of a pulse together with the analog value that follows it"""
+        self._pending_releases.pop(analog_join, None)
+        if not self._writer:
+            _LOGGER.debug("Could not release pulse. No connection to hub")
+            return
+        self._queue_tx(_pack_digital(digital_join, 0) + _pack_analog(analog_join, analog_value()))
+
+    def _release_pending(self, analog_join: int) -> None:
+        """Cancel a scheduled pulse release on analog_join and buffer just its digital release"""
+        pending = self._pending_releases.pop(analog_join, None)
+        if pending is not None:
+            handle, digital_join = pending
+            handle.cancel()
+            self._tx_buf += _pack_digital(digital_join, 0)
+
     def set_serial(self, join: int, string: str) -> None:
         """Send String Join to Crestron XSIG symbol"""
         if len(string) > 252:
             _LOGGER.warning("Could not send serial. String too long (%d>252)", len(string))
             return
         if self._writer:
-            try:
-                data = struct.pack(">BB", 0b11001000 | ((join - 1) >> 7), (join - 1) & 0b01111111)
-                data += string.encode()
-                data += b"\xff"
-                self._writer.write(data)
-                # Removed excessive debug logging
-                # _LOGGER.debug(f"Sending Serial: {join}, {string}")
-            except OSError as err:
-                _LOGGER.warning("Failed to send serial join %s: %s", join, err)
-                self._writer = None  # Mark connection as dead
-                self._available = False
+            data = _S_BB.pack(0b11001000 | ((join - 1) >> 7), (join - 1) & 0b01111111)
+            data += string.encode()
+            data += b"\xff"
+            self._queue_tx(data)
         else:
             _LOGGER.debug("Could not send serial. No connection to hub")
 
     def request_update(self) -> None:
         """Request Crestron to send current state of all joins"""
         if self._writer:
-            try:
-                self._writer.write(b"\xfd")
-                _LOGGER.debug("Requested update from Crestron")
-            except OSError as err:
-                _LOGGER.warning("Failed to request update: %s", err)
-                self._writer = None
-                self._available = False
+            self._queue_tx(b"\xfd")
+            _LOGGER.debug("Requested update from Crestron")
         else:
             _LOGGER.debug("Could not request update. No connection to hub")
@@ -30,21 +30,19 @@ def get_hub(
     Returns:
         The hub instance or None if not found
     """
-    if DOMAIN not in hass.data:
+    domain_data: dict[str, Any] | None = hass.data.get(DOMAIN)
+    if domain_data is None:
         return None
 
     if entry is not None:
-        entry_data = hass.data[DOMAIN].get(entry.entry_id)
+        entry_data = domain_data.get(entry.entry_id)
         if entry_data:
-            if isinstance(entry_data, dict):
-                hub = entry_data.get(HUB)
-            else:
-                hub = entry_data
+            hub = entry_data.get(HUB) if isinstance(entry_data, dict) else entry_data
             if hub:
                 return hub
 
     # Fall back to global HUB key (YAML setup or shared hub)
-    return hass.data[DOMAIN].get(HUB)
+    return domain_data.get(HUB)
 
 
 def get_hub_wrapper(
@@ -60,10 +58,11 @@ def get_hub_wrapper(
     Returns:
         The hub wrapper instance or None if not found
     """
-    if DOMAIN not in hass.data:
+    domain_data: dict[str, Any] | None = hass.data.get(DOMAIN)
+    if domain_data is None:
         return None
 
-    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    entry_data = domain_data.get(entry.entry_id)
     if entry_data and isinstance(entry_data, dict):
         return entry_data.get("hub_wrapper")
 
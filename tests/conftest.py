@@ -14,32 +14,40 @@ def mock_hub():
     hub._digital = {}
     hub._analog = {}
     hub._serial = {}
-    hub._digital_received = set()
-    hub._analog_received = set()
     hub._callbacks = set()
+    hub._join_callbacks = {}
 
     # Mock methods
     hub.is_available.return_value = True
     hub.get_digital.side_effect = lambda j: hub._digital.get(j, False)
     hub.get_analog.side_effect = lambda j: hub._analog.get(j, 0)
     hub.get_serial.side_effect = lambda j: hub._serial.get(j, "")
-    hub.has_digital_value.side_effect = lambda j: j in hub._digital_received
-    hub.has_analog_value.side_effect = lambda j: j in hub._analog_received
+    # Like the real hub, a join has a value once it is in the value dict
+    hub.has_digital_value.side_effect = lambda j: j in hub._digital
+    hub.has_analog_value.side_effect = lambda j: j in hub._analog
+    hub.has_serial_value.side_effect = lambda j: j in hub._serial
+    hub.get_analog_or.side_effect = lambda j, d=None: hub._analog.get(j, d)
+    hub.get_digital_or.side_effect = lambda j, d=None: hub._digital.get(j, d)
 
     # Track set calls
     def set_digital(join, value):
         hub._digital[join] = value
-        hub._digital_received.add(join)
 
     def set_analog(join, value):
         hub._analog[join] = value
-        hub._analog_received.add(join)
 
     hub.set_digital.side_effect = set_digital
     hub.set_analog.side_effect = set_analog
     hub.async_set_analog = AsyncMock(side_effect=set_analog)
     hub.async_set_digital = AsyncMock(side_effect=set_digital)
 
+    def pulse_then_set(digital_join, pulse_ms, analog_join, analog_value):
+        set_digital(digital_join, 1)
+        set_digital(digital_join, 0)
+        set_analog(analog_join, analog_value())
+
+    hub.async_pulse_then_set = AsyncMock(side_effect=pulse_then_set)
+
     # Callback registration
     def register_callback(cb):
         hub._callbacks.add(cb)
@@ -50,6 +58,15 @@ def mock_hub():
     hub.register_callback.side_effect = register_callback
     hub.remove_callback.side_effect = remove_callback
 
+    def register_join_callback(cbtype, cb):
+        hub._join_callbacks.setdefault(cbtype, []).append(cb)
+
+    def remove_join_callback(cbtype, cb):
+        hub._join_callbacks[cbtype].remove(cb)
+
+    hub.register_join_callback.side_effect = register_join_callback
+    hub.remove_join_callback.side_effect = remove_join_callback
+
     return hub
 
 
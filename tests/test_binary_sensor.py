@@ -91,7 +91,6 @@ class TestCrestronBinarySensor:
 
         # Simulate hub having digital value = True
         mock_hub._digital[1] = True
-        mock_hub._digital_received.add(1)
 
         sensor = CrestronBinarySensor(mock_hub, config)
 
@@ -107,7 +106,6 @@ class TestCrestronBinarySensor:
 
         # Simulate hub having digital value = False
         mock_hub._digital[1] = False
-        mock_hub._digital_received.add(1)
 
         sensor = CrestronBinarySensor(mock_hub, config)
 
@@ -241,7 +239,6 @@ class TestCrestronBinarySensor:
 
         # Initially off
         mock_hub._digital[1] = False
-        mock_hub._digital_received.add(1)
 
         sensor = CrestronBinarySensor(mock_hub, config)
         assert sensor.is_on is False
@@ -270,8 +267,6 @@ class TestCrestronBinarySensor:
         # Set different values for different joins
         mock_hub._digital[1] = True
         mock_hub._digital[2] = False
-        mock_hub._digital_received.add(1)
-        mock_hub._digital_received.add(2)
 
         sensor1 = CrestronBinarySensor(mock_hub, config1)
         sensor2 = CrestronBinarySensor(mock_hub, config2)
@@ -0,0 +1,319 @@
+"""Tests for Crestron Cover platform."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+
+# Add custom_components to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from custom_components.crestron.cover import CrestronShade, async_setup_entry
+from custom_components.crestron.crestron import CrestronXsig
+
+
+class TestCrestronShade:
+    """Tests for CrestronShade entity."""
+
+    def test_cover_init(self, mock_hub, cover_config):
+        """Test cover initializes with correct name and joins."""
+        cover = CrestronShade(mock_hub, cover_config)
+
+        assert cover._name == "Test Cover"
+        assert cover._pos_join == 1
+        assert cover._stop_join == 2
+        assert cover._is_opening_join is None
+        assert cover._from_ui is False
+
+    def test_cover_relevant_joins(self, mock_hub):
+        """Test relevant joins cover the position join and configured digital joins."""
+        config = {
+            "name": "Test Cover",
+            "type": "shade",
+            "pos_join": 30,
+            "is_opening_join": 31,
+            "is_closed_join": 33,
+        }
+
+        cover = CrestronShade(mock_hub, config)
+
+        assert cover._relevant_joins == frozenset({"a30", "d31", "d33"})
+
+    @pytest.mark.asyncio
+    async def test_cover_callback_writes_state_for_own_join(self, mock_hub, cover_config):
+        """Test callback for one of our joins writes state."""
+        cover = CrestronShade(mock_hub, cover_config)
+        cover.async_write_ha_state = MagicMock()
+
+        mock_hub._analog[1] = 32767
+        cover.process_callback("a1", "32767")
+
+        cover.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cover_callback_skips_unchanged_values(self, mock_hub, cover_config):
+        """Test repeated identical values only write state once."""
+        cover = CrestronShade(mock_hub, cover_config)
+        cover.async_write_ha_state = MagicMock()
+
+        mock_hub._analog[1] = 32767
+        cover.process_callback("a1", "32767")
+        cover.process_callback("a1", "32767")
+        # Stop pulse feedback changes nothing visible
+        cover.process_callback("d2", "1")
+
+        cover.async_write_ha_state.assert_called_once()
+
+        mock_hub._analog[1] = 0
+        cover.process_callback("a1", "0")
+
+        assert cover.async_write_ha_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cover_registers_only_its_joins(self, mock_hub):
+        """Test the cover subscribes to its own joins and availability only."""
+        config = {
+            "name": "Test Cover",
+            "type": "shade",
+            "pos_join": 30,
+            "is_opening_join": 31,
+            "stop_join": 34,
+        }
+        cover = CrestronShade(mock_hub, config)
+        cover.async_get_last_state = AsyncMock(return_value=None)
+
+        with patch.object(RestoreEntity, "async_added_to_hass", AsyncMock()):
+            await cover.async_added_to_hass()
+
+        assert set(mock_hub._join_callbacks) == {"a30", "d31", "d34", "available"}
+        assert all(cbs == [cover.process_callback] for cbs in mock_hub._join_callbacks.values())
+
+        with patch.object(RestoreEntity, "async_will_remove_from_hass", AsyncMock()):
+            await cover.async_will_remove_from_hass()
+
+        assert all(not cbs for cbs in mock_hub._join_callbacks.values())
+
+    @pytest.mark.asyncio
+    async def test_cover_callback_available(self, mock_hub, cover_config):
+        """Test availability changes write state."""
+        cover = CrestronShade(mock_hub, cover_config)
+        cover.async_write_ha_state = MagicMock()
+
+        cover.process_callback("available", "True")
+        cover.process_callback("available", "True")
+
+        cover.async_write_ha_state.assert_called_once()
+
+        mock_hub.is_available.return_value = False
+        cover.process_callback("available", "False")
+
+        assert cover.async_write_ha_state.call_count == 2
+
+    def test_cover_position_from_hub(self, mock_hub, cover_config):
+        """Test cover position is scaled from the hub's analog value."""
+        mock_hub._analog[1] = 65535
+
+        cover = CrestronShade(mock_hub, cover_config)
+
+        assert cover.current_cover_position == pytest.approx(100)
+
+    def test_cover_position_follows_callbacks(self, mock_hub, cover_config):
+        """Test cached position is rescaled when the position join changes."""
+        cover = CrestronShade(mock_hub, cover_config)
+        cover.async_write_ha_state = MagicMock()
+        cover._restored_position = 25
+
+        assert cover.current_cover_position == 25
+
+        mock_hub._analog[1] = 32767
+        cover.process_callback("a1", "32767")
+
+        assert cover.current_cover_position == pytest.approx(50, abs=0.01)
+
+    def test_cover_is_opening_from_hub(self, mock_hub):
+        """Test opening state comes from the digital feedback join."""
+        config = {
+            "name": "Test Cover",
+            "type": "shade",
+            "pos_join": 1,
+            "is_opening_join": 3,
+        }
+        cover = CrestronShade(mock_hub, config)
+
+        assert cover.is_opening is None
+
+        mock_hub._digital[3] = True
+
+        assert cover.is_opening is True
+
+    @pytest.mark.asyncio
+    async def test_cover_set_position_full_range(self, mock_hub, cover_config):
+        """Test position 100 maps to the full analog range like open does."""
+        cover = CrestronShade(mock_hub, cover_config)
+
+        await cover.async_set_cover_position(position=100)
+        mock_hub.async_set_analog.assert_called_with(1, 65535)
+
+        await cover.async_set_cover_position(position=50)
+        mock_hub.async_set_analog.assert_called_with(1, 32767)
+
+    @pytest.mark.asyncio
+    async def test_cover_restores_state_without_hub_value(self, mock_hub, cover_config):
+        """Test last state is restored when the hub has no position yet."""
+        cover = CrestronShade(mock_hub, cover_config)
+        last_state = MagicMock(state="closed", attributes={"current_position": 0})
+        cover.async_get_last_state = AsyncMock(return_value=last_state)
+
+        with patch.object(RestoreEntity, "async_added_to_hass", AsyncMock()):
+            await cover.async_added_to_hass()
+
+        cover.async_get_last_state.assert_awaited_once()
+        assert cover._restored_is_closed is True
+        assert mock_hub._join_callbacks["a1"] == [cover.process_callback]
+
+    @pytest.mark.asyncio
+    async def test_cover_skips_restore_with_live_hub_value(self, mock_hub, cover_config):
+        """Test restore is skipped when the hub already knows the position."""
+        mock_hub._analog[1] = 65535
+        cover = CrestronShade(mock_hub, cover_config)
+        cover.async_get_last_state = AsyncMock()
+
+        with patch.object(RestoreEntity, "async_added_to_hass", AsyncMock()):
+            await cover.async_added_to_hass()
+
+        cover.async_get_last_state.assert_not_awaited()
+        assert mock_hub._join_callbacks["a1"] == [cover.process_callback]
+        mock_hub.request_update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cover_is_closed_follows_callbacks(self, mock_hub):
+        """Test closed verdict is inferred from position and tracks hub updates."""
+        config = {
+            "name": "Test Cover",
+            "type": "shade",
+            "pos_join": 1,
+            "is_closing_join": 3,
+        }
+        cover = CrestronShade(mock_hub, config)
+        cover.async_write_ha_state = MagicMock()
+
+        assert cover.is_closed is None
+
+        mock_hub._analog[1] = 0
+        cover.process_callback("a1", "0")
+        assert cover.is_closed is True
+
+        # While closing, the position no longer decides the verdict
+        mock_hub._digital[3] = True
+        cover.process_callback("d3", "1")
+        assert cover.is_closed is None
+
+        mock_hub._digital[3] = False
+        mock_hub._analog[1] = 32767
+        cover.process_callback("a1", "32767")
+        assert cover.is_closed is False
+
+    @pytest.mark.asyncio
+    async def test_cover_stop_pulses_and_holds_position(self, mock_hub, cover_config):
+        """Test stop pulses the stop join and resends the current position."""
+        mock_hub._analog[1] = 32767
+        cover = CrestronShade(mock_hub, cover_config)
+
+        await cover.async_stop_cover()
+
+        mock_hub.async_pulse_then_set.assert_awaited_once()
+        assert mock_hub.async_pulse_then_set.call_args.args[:3] == (2, 200, 1)
+        assert mock_hub._digital[2] == 0
+        assert mock_hub._analog[1] == 32767
+
+    @pytest.mark.asyncio
+    async def test_cover_stop_then_set_position(self, cover_config):
+        """Test a position set right after stop is not overwritten by the stop's release."""
+        hub = CrestronXsig()
+        hub._writer = MagicMock()
+        hub._writer.drain = AsyncMock()
+        hub._writer.transport.get_write_buffer_size.return_value = 0
+        hub._analog[1] = 16384
+        cover = CrestronShade(hub, cover_config)
+
+        await cover.async_stop_cover()
+        await cover.async_set_cover_position(position=50)
+        await asyncio.sleep(0.25)
+
+        assert [c.args[0] for c in hub._writer.write.call_args_list] == [
+            b"\x80\x01",
+            b"\xa0\x01" + b"\xd0\x00\x7f\x7f",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cover_stop_without_stop_join(self, mock_hub):
+        """Test stop does nothing when no stop join is configured."""
+        cover = CrestronShade(mock_hub, {"name": "Test Cover", "type": "shade", "pos_join": 1})
+
+        await cover.async_stop_cover()
+
+        mock_hub.async_pulse_then_set.assert_not_awaited()
+
+    def test_cover_unique_id(self, mock_hub, cover_config):
+        """Test unique_id format for YAML and UI covers."""
+        assert CrestronShade(mock_hub, cover_config).unique_id == "crestron_cover_a1"
+        assert CrestronShade(mock_hub, cover_config, from_ui=True).unique_id == "crestron_cover_ui_a1"
+
+    def test_cover_device_info(self, mock_hub, cover_config):
+        """Test covers are grouped under the hub's device."""
+        cover = CrestronShade(mock_hub, cover_config)
+
+        assert cover.device_info["identifiers"] == {("crestron", "crestron_16384")}
+
+
+class TestCoverSetupEntry:
+    """Tests for UI cover setup."""
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_parses_joins(self, mock_hass, mock_hub):
+        """Test UI join strings are parsed and invalid covers are skipped."""
+        entry = MagicMock()
+        entry.entry_id = "entry1"
+        entry.data = {
+            "covers": [
+                {"name": "Shade", "type": "shade", "pos_join": "a30", "is_closed_join": "d33", "stop_join": ""},
+                {"name": "Broken", "type": "shade", "pos_join": "d40"},
+                {"name": "Truncated", "type": "shade", "pos_join": "a"},
+            ]
+        }
+        mock_hass.data = {"crestron": {"entry1": {"hub": mock_hub}}}
+        async_add_entities = MagicMock()
+
+        assert await async_setup_entry(mock_hass, entry, async_add_entities) is True
+
+        (entities,) = async_add_entities.call_args.args
+        assert len(entities) == 1
+        shade = entities[0]
+        assert shade._pos_join == 30
+        assert shade._is_closed_join == 33
+        assert shade._stop_join is None
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_keeps_unnamed_and_rejects_trailing_newline(self, mock_hass, mock_hub):
+        """Test a stored cover without a name still loads and joins must match exactly."""
+        entry = MagicMock()
+        entry.entry_id = "entry1"
+        entry.data = {
+            "covers": [
+                {"name": None, "type": "shade", "pos_join": "a30"},
+                {"name": "Newline", "type": "shade", "pos_join": "a31\n"},
+                {"name": "Digital", "type": "shade", "pos_join": "a32", "stop_join": "d34\n"},
+            ]
+        }
+        mock_hass.data = {"crestron": {"entry1": {"hub": mock_hub}}}
+        async_add_entities = MagicMock()
+
+        assert await async_setup_entry(mock_hass, entry, async_add_entities) is True
+
+        (entities,) = async_add_entities.call_args.args
+        assert [e._pos_join for e in entities] == [30, 32]
+        assert entities[0]._name is None
+        assert entities[1]._stop_join is None
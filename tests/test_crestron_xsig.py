@@ -55,14 +55,27 @@ class TestCrestronXsig:
         assert xsig.has_serial_value(1) is False
 
         # Simulate receiving values
-        xsig._digital_received.add(1)
-        xsig._analog_received.add(2)
-        xsig._serial_received.add(3)
+        xsig._digital[1] = False
+        xsig._analog[2] = 0
+        xsig._serial[3] = ""
 
         assert xsig.has_digital_value(1) is True
         assert xsig.has_analog_value(2) is True
         assert xsig.has_serial_value(3) is True
 
+    def test_get_value_or_default(self):
+        """Test get_*_or returns the default until a value is received."""
+        xsig = CrestronXsig()
+
+        assert xsig.get_analog_or(1) is None
+        assert xsig.get_digital_or(1, True) is True
+
+        xsig._analog[1] = 0
+        xsig._digital[1] = False
+
+        assert xsig.get_analog_or(1) == 0
+        assert xsig.get_digital_or(1, True) is False
+
     def test_is_available(self):
         """Test is_available method."""
         xsig = CrestronXsig()
@@ -137,24 +150,43 @@ class TestCrestronXsig:
         # Writer.write should not be called for too-long strings
         xsig._writer.write.assert_not_called()
 
-    def test_set_digital_with_writer(self):
+    @pytest.mark.asyncio
+    async def test_set_digital_with_writer(self):
         """Test set_digital with active connection."""
         xsig = CrestronXsig()
         xsig._writer = MagicMock()
 
         xsig.set_digital(1, True)
+        await asyncio.sleep(0)  # Queued writes flush on the next loop tick
 
         xsig._writer.write.assert_called_once()
 
-    def test_set_analog_with_writer(self):
+    @pytest.mark.asyncio
+    async def test_set_analog_with_writer(self):
         """Test set_analog with active connection."""
         xsig = CrestronXsig()
         xsig._writer = MagicMock()
 
         xsig.set_analog(1, 32767)
+        await asyncio.sleep(0)  # Queued writes flush on the next loop tick
 
         xsig._writer.write.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_set_joins_coalesce_into_one_write(self):
+        """Test joins set in the same loop tick go out in a single write."""
+        xsig = CrestronXsig()
+        xsig._writer = MagicMock()
+
+        xsig.set_digital(1, True)
+        xsig.set_analog(1, 1000)
+        xsig.set_serial(1, "hi")
+        xsig._writer.write.assert_not_called()
+
+        await asyncio.sleep(0)
+
+        xsig._writer.write.assert_called_once_with(b"\x80\x00" + b"\xc0\x00\x07\x68" + b"\xc8\x00hi\xff")
+
     def test_request_update_no_writer(self):
         """Test request_update with no connection."""
         xsig = CrestronXsig()
@@ -162,12 +194,27 @@ class TestCrestronXsig:
         # Should not raise
         xsig.request_update()
 
-    def test_request_update_with_writer(self):
+    @pytest.mark.asyncio
+    async def test_set_joins_flush_when_segment_full(self):
+        """Test a full segment of queued joins is written without waiting for the tick."""
+        xsig = CrestronXsig()
+        xsig._writer = MagicMock()
+
+        for join in range(1, 351):
+            xsig.set_analog(join, join)
+
+        # 350 analog packets of 4 bytes reach the 1400 byte threshold
+        xsig._writer.write.assert_called_once()
+        assert len(xsig._writer.write.call_args.args[0]) == 1400
+
+    @pytest.mark.asyncio
+    async def test_request_update_with_writer(self):
         """Test request_update with active connection."""
         xsig = CrestronXsig()
         xsig._writer = MagicMock()
 
         xsig.request_update()
+        await asyncio.sleep(0)  # Queued writes flush on the next loop tick
 
         # Should send 0xFD byte
         xsig._writer.write.assert_called_once_with(b"\xfd")
@@ -218,26 +265,249 @@ class TestCrestronXsigAsync:
 
     @pytest.mark.asyncio
     async def test_async_set_analog(self):
-        """Test async_set_analog drains writer."""
+        """Test async_set_analog writes immediately without draining an idle transport."""
         xsig = CrestronXsig()
         xsig._writer = MagicMock()
         xsig._writer.write = MagicMock()
         xsig._writer.drain = AsyncMock()
+        xsig._writer.transport.get_write_buffer_size.return_value = 0
 
         await xsig.async_set_analog(1, 1000)
 
         xsig._writer.write.assert_called_once()
-        xsig._writer.drain.assert_awaited_once()
+        xsig._writer.drain.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_async_set_digital(self):
-        """Test async_set_digital drains writer."""
+        """Test async_set_digital writes immediately without draining an idle transport."""
         xsig = CrestronXsig()
         xsig._writer = MagicMock()
         xsig._writer.write = MagicMock()
         xsig._writer.drain = AsyncMock()
+        xsig._writer.transport.get_write_buffer_size.return_value = 0
 
         await xsig.async_set_digital(1, True)
 
         xsig._writer.write.assert_called_once()
+        xsig._writer.drain.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_async_set_digital_drains_backed_up_transport(self):
+        """Test async sends wait for the socket once the transport buffer is backed up."""
+        xsig = CrestronXsig()
+        xsig._writer = MagicMock()
+        xsig._writer.drain = AsyncMock()
+        xsig._writer.transport.get_write_buffer_size.return_value = 16384
+
+        await xsig.async_set_digital(1, True)
+
         xsig._writer.drain.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_pulse_then_set(self):
+        """Test the press returns immediately and the release goes out with the analog value."""
+        xsig = CrestronXsig()
+        xsig._writer = MagicMock()
+        xsig._writer.write = MagicMock()
+        xsig._writer.drain = AsyncMock()
+        xsig._writer.transport.get_write_buffer_size.return_value = 0
+
+        await xsig.async_pulse_then_set(2, 10, 1, lambda: 1000)
+
+        xsig._writer.write.assert_called_once_with(b"\x80\x01")
+        xsig._writer.drain.assert_not_awaited()
+
+        await asyncio.sleep(0.05)
+
+        assert xsig._writer.write.call_count == 2
+        release_packet = xsig._writer.write.call_args_list[1].args[0]
+        assert release_packet == b"\xa0\x01" + b"\xc0\x00\x07\x68"
+
+    @pytest.mark.asyncio
+    async def test_analog_write_supersedes_pending_release(self):
+        """Test writing the analog join during a pulse releases it at once without the stale value."""
+        xsig = CrestronXsig()
+        xsig._writer = MagicMock()
+        xsig._writer.drain = AsyncMock()
+        xsig._writer.transport.get_write_buffer_size.return_value = 0
+
+        await xsig.async_pulse_then_set(2, 10, 1, lambda: 1000)
+        await xsig.async_set_analog(1, 65535)
+        await asyncio.sleep(0.05)
+
+        assert [c.args[0] for c in xsig._writer.write.call_args_list] == [
+            b"\x80\x01",
+            b"\xa0\x01" + b"\xf0\x00\x7f\x7f",
+        ]
+        assert xsig._pending_releases == {}
+
+    @pytest.mark.asyncio
+    async def test_stop_sends_pending_release(self):
+        """Test stopping the hub releases a pulse that is still held."""
+        xsig = CrestronXsig()
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.wait_closed = AsyncMock()
+        writer.transport.get_write_buffer_size.return_value = 0
+        xsig._writer = writer
+
+        await xsig.async_pulse_then_set(2, 10, 1, lambda: 1000)
+        await xsig.stop()
+        await asyncio.sleep(0.05)
+
+        assert [c.args[0] for c in writer.write.call_args_list] == [b"\x80\x01", b"\xa0\x01"]
+
+    @pytest.mark.asyncio
+    async def test_async_pulse_release_skipped_after_disconnect(self):
+        """Test a pending release is dropped if the connection goes away."""
+        xsig = CrestronXsig()
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.transport.get_write_buffer_size.return_value = 0
+        xsig._writer = writer
+
+        await xsig.async_pulse_then_set(2, 10, 1, lambda: 1000)
+        xsig._writer = None
+        await asyncio.sleep(0.05)
+
+        writer.write.assert_called_once_with(b"\x80\x01")
+
+    @pytest.mark.asyncio
+    async def test_async_pulse_then_set_no_writer(self):
+        """Test pulse with no connection does nothing."""
+        xsig = CrestronXsig()
+
+        # Should not raise
+        await xsig.async_pulse_then_set(2, 200, 1, lambda: 1000)
+
+    @pytest.mark.asyncio
+    async def test_handle_connection_parses_packets(self):
+        """Test digital, analog and serial packets update state and notify callbacks."""
+        xsig = CrestronXsig()
+        received = []
+
+        async def callback(cbtype, value):
+            received.append((cbtype, value))
+
+        xsig.register_callback(callback)
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\x80\x00" + b"\xc0\x00\x07\x68" + b"\xc8\x01hi\xff")
+        reader.feed_eof()
+        writer = MagicMock()
+
+        await xsig.handle_connection(reader, writer)
+
+        # Update request is sent on connect
+        writer.write.assert_called_once_with(b"\xfd")
+        assert received == [
+            ("available", "True"),
+            ("d1", "1"),
+            ("a1", "1000"),
+            ("s2", "hi"),
+            ("available", "False"),
+        ]
+        assert xsig.get_digital(1) is True
+        assert xsig.get_analog(1) == 1000
+        assert xsig.get_serial(2) == "hi"
+        assert xsig.has_analog_value(1)
+        assert xsig.is_available() is False
+
+    @pytest.mark.asyncio
+    async def test_handle_connection_sync_all_joins(self):
+        """Test the update-all-joins request invokes the sync callback."""
+        xsig = CrestronXsig()
+        sync_callback = AsyncMock()
+        xsig.register_sync_all_joins_callback(sync_callback)
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\xfb")
+        reader.feed_eof()
+
+        await xsig.handle_connection(reader, MagicMock())
+
+        sync_callback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_connection_packets_split_across_reads(self):
+        """Test packets split across reads are reassembled."""
+        xsig = CrestronXsig()
+        received = []
+
+        async def callback(cbtype, value):
+            received.append((cbtype, value))
+
+        xsig.register_callback(callback)
+        reader = MagicMock()
+        reader.read = AsyncMock(side_effect=[b"\xc0", b"\x00\x07", b"\x68\xc8\x01h", b"i", b"\xff\x80", b"\x00", b""])
+
+        await xsig.handle_connection(reader, MagicMock())
+
+        assert received == [
+            ("available", "True"),
+            ("a1", "1000"),
+            ("s2", "hi"),
+            ("d1", "1"),
+            ("available", "False"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_block_others(self):
+        """Test one callback raising does not stop the others or the connection."""
+        xsig = CrestronXsig()
+        received = []
+
+        async def failing(cbtype, value):
+            raise ValueError("boom")
+
+        async def callback(cbtype, value):
+            received.append((cbtype, value))
+
+        xsig.register_callback(failing)
+        xsig.register_callback(callback)
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\x80\x00")
+        reader.feed_eof()
+
+        await xsig.handle_connection(reader, MagicMock())
+
+        assert received == [("available", "True"), ("d1", "1"), ("available", "False")]
+
+    @pytest.mark.asyncio
+    async def test_from_hub_service_does_not_block_receive_loop(self, mock_hass):
+        """Test from_hub services are started as tasks instead of awaited in the callback."""
+        from custom_components.crestron import CrestronHub
+
+        mock_hass.data = {"crestron": {}}
+        started = []
+        mock_hass.async_create_task = MagicMock(side_effect=lambda coro: started.append(coro) or coro.close())
+        mock_hass.services.async_call = AsyncMock()
+        hub = CrestronHub(
+            mock_hass,
+            {"port": 16384, "from_joins": [{"join": "d5", "service": "light.turn_on", "data": {}}]},
+            set_hub_key=False,
+        )
+
+        await hub.join_change_callback("d5", "1")
+
+        assert len(started) == 1
+        mock_hass.services.async_call.assert_called_once_with("light", "turn_on", {})
+        mock_hass.services.async_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_join_callbacks_only_see_their_join(self):
+        """Test keyed callbacks run only for the join they registered for."""
+        xsig = CrestronXsig()
+        analog_callback = MagicMock()
+        available_callback = MagicMock()
+        xsig.register_join_callback("a1", analog_callback)
+        xsig.register_join_callback("available", available_callback)
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\x80\x00" + b"\xc0\x00\x07\x68" + b"\xc0\x01\x00\x01")
+        reader.feed_eof()
+
+        await xsig.handle_connection(reader, MagicMock())
+
+        analog_callback.assert_called_once_with("a1", "1000")
+        assert available_callback.call_count == 2
+
+        xsig.remove_join_callback("a1", analog_callback)
+        assert "a1" not in xsig._join_callbacks
@@ -103,7 +103,6 @@ class TestCrestronLight:
 
         # Simulate hub having brightness value (1-65535 = on)
         mock_hub._analog[1] = 32767  # Mid brightness
-        mock_hub._analog_received.add(1)
 
         light = CrestronLight(mock_hub, config)
 
@@ -119,7 +118,6 @@ class TestCrestronLight:
 
         # Simulate hub having zero brightness
         mock_hub._analog[1] = 0
-        mock_hub._analog_received.add(1)
 
         light = CrestronLight(mock_hub, config)
 
@@ -149,7 +147,6 @@ class TestCrestronLight:
 
         # Simulate hub having brightness value (65535 = full brightness = 255 in HA)
         mock_hub._analog[1] = 65535
-        mock_hub._analog_received.add(1)
 
         light = CrestronLight(mock_hub, config)
 
@@ -166,7 +163,6 @@ class TestCrestronLight:
 
         # Test mid brightness: 32767 / 65535 * 255 = ~127
         mock_hub._analog[1] = 32767
-        mock_hub._analog_received.add(1)
 
         light = CrestronLight(mock_hub, config)
 
@@ -182,7 +178,6 @@ class TestCrestronLight:
 
         # Zero brightness
         mock_hub._analog[1] = 0
-        mock_hub._analog_received.add(1)
 
         light = CrestronLight(mock_hub, config)
 